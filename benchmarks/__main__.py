@@ -0,0 +1,85 @@
+"""Run the benchmark suite and write the results as JSON, optionally comparing them with an earlier run."""
+
+import argparse
+import asyncio
+import datetime
+import importlib.metadata
+import json
+import platform
+import typing
+
+import hikari
+
+from benchmarks import resolvers, sync_cache
+
+
+def parse_args(argv: typing.Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the hikariutils resolvers against synthetic guilds.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(resolvers.SIZES), help="member counts of the generated guilds")
+    parser.add_argument("--modes", nargs="+", choices=resolvers.MODES, default=list(resolvers.MODES), help="where the resolvers find objects")
+    parser.add_argument("--lookups", nargs="+", choices=list(resolvers.LOOKUPS), default=None, help="lookups to run, all by default")
+    parser.add_argument("--latency", type=float, default=0.001, help="simulated REST latency in seconds")
+    parser.add_argument("--seconds", type=float, default=1.0, help="time spent on each lookup")
+    parser.add_argument("--output", default="benchmarks.json", help="file to write the results to")
+    parser.add_argument("--compare", default=None, help="earlier results to compare with")
+    parser.add_argument("--skip-sync-cache", action="store_true", help="skip comparing the sync and async cache resolvers")
+    return parser.parse_args(argv)
+
+
+def print_result(result: dict[str, typing.Any]) -> None:
+    """Print one result as a table row."""
+    print(f"{result['size']:>8} {result['mode']:<15} {result['lookup']:<14} {result['ops_per_sec']:>12,.0f} ops/s  p50 {result['p50_ns']:>11,.0f} ns  p99 {result['p99_ns']:>11,.0f} ns  peak {result['peak_bytes_per_call']:>10,.0f} B/call")
+
+
+def compare(results: list[dict[str, typing.Any]], baseline: list[dict[str, typing.Any]]) -> None:
+    """Print how the throughput and median latency of every result changed from a baseline run."""
+    previous = {(result["size"], result["mode"], result["lookup"]): result for result in baseline}
+
+    for result in results:
+        if (before := previous.get((result["size"], result["mode"], result["lookup"]))) is None:
+            continue
+
+        print(f"{result['size']:>8} {result['mode']:<15} {result['lookup']:<14} ops/s {result['ops_per_sec'] / before['ops_per_sec'] - 1:>+8.1%}  p50 {result['p50_ns'] / before['p50_ns'] - 1:>+8.1%}")
+
+
+def main(argv: typing.Sequence[str] | None = None) -> None:
+    args = parse_args(argv)
+    results = asyncio.run(resolvers.run(args.sizes, args.modes, args.lookups, args.latency, args.seconds, report=print_result))
+    output: dict[str, typing.Any] = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "hikari": hikari.__version__,
+            "hikari-utils": importlib.metadata.version("hikari-utils") if _is_installed("hikari-utils") else None,
+            "latency": args.latency,
+            "seconds": args.seconds,
+        },
+        "resolvers": results,
+    }
+
+    if not args.skip_sync_cache:
+        output["sync_cache"] = asyncio.run(sync_cache.run())
+
+        for name, result in output["sync_cache"].items():
+            print(f"{name:<12} async {result['async']:>7.0f} ns  sync {result['sync']:>7.0f} ns")
+
+    with open(args.output, "w") as file:
+        json.dump(output, file, indent=4)
+
+    if args.compare is not None:
+        with open(args.compare) as file:
+            compare(results, json.load(file)["resolvers"])
+
+
+def _is_installed(distribution: str) -> bool:
+    try:
+        importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    main()
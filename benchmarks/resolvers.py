@@ -0,0 +1,150 @@
+"""Measure the hot resolver paths against synthetic guilds of growing size, through the gateway cache with and without indexes, a simulated REST client and the resolver cache."""
+
+import gc
+import time
+import tracemalloc
+import typing
+
+import hikari
+
+from hikariutils.cache import attach_cache, detach_cache
+from hikariutils.getfetch import Optional
+from hikariutils.index import BoosterIndex, ChannelIndex, EmojiIndex, GatewayIndex, MemberIndex, RoleIndex
+from hikariutils.testing import FakeGatewayBot, SyntheticGuild, generate_guild
+
+SIZES: tuple[int, ...] = (1_000, 50_000, 500_000)
+MODES: tuple[str, ...] = ("cache", "indexed", "compact", "rest", "resolver_cache")
+CACHE_MODES: tuple[str, ...] = ("cache", "indexed", "compact")
+INDEXES: dict[str, tuple[type[GatewayIndex], ...]] = {"indexed": (BoosterIndex, ChannelIndex, EmojiIndex, RoleIndex), "compact": (MemberIndex,)}
+SAMPLE = 1_000
+
+LOOKUPS: dict[str, tuple[str, typing.Callable[[SyntheticGuild], list[tuple[typing.Any, ...]]]]] = {
+    "guild": ("guild", lambda guild: [(guild.guild_id,)]),
+    "member": ("member", lambda guild: [(guild.guild_id, member_id) for member_id in guild.member_ids[:SAMPLE]]),
+    "user": ("user", lambda guild: [(member_id,) for member_id in guild.member_ids[:SAMPLE]]),
+    "textable": ("textable", lambda guild: [(channel_id,) for channel_id in guild.channel_ids[1::2]]),
+    "role": ("role", lambda guild: [(guild.guild_id, role_id) for role_id in guild.role_ids]),
+    "textables": ("textables", lambda guild: [(guild.guild_id,)]),
+    "roles": ("roles", lambda guild: [(guild.guild_id, None)]),
+    "member roles": ("roles", lambda guild: [(guild.guild_id, member_id) for member_id in guild.member_ids[:SAMPLE]]),
+    "top_role": ("top_role", lambda guild: [(guild.guild_id, member_id) for member_id in guild.member_ids[:SAMPLE]]),
+    "boosters": ("boosters", lambda guild: [(guild.guild_id,)]),
+    "emoji": ("emoji", lambda guild: [(hikari.CustomEmoji(id=emoji_id, name="emoji", is_animated=False), guild.guild_id) for emoji_id in guild.emoji_ids]),
+    "unicode emoji": ("emoji", lambda guild: [("👍", guild.guild_id)]),
+}
+
+
+async def measure(
+    function: typing.Callable[..., typing.Awaitable[typing.Any]],
+    bot: hikari.GatewayBot,
+    arguments: list[tuple[typing.Any, ...]],
+    seconds: float,
+    max_iterations: int,
+    allocation_iterations: int,
+) -> dict[str, float]:
+    """Await a resolver over rotating arguments for up to `seconds`, at least once. Return its throughput, latency percentiles and allocations.
+
+    Allocations are traced over a tenth of the timed calls, at most `allocation_iterations`, since tracing slows every call down.
+    """
+    durations: list[int] = []
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter_ns()
+
+    while not durations or (len(durations) < max_iterations and time.perf_counter() < deadline):
+        args = arguments[len(durations) % len(arguments)]
+        call_started = time.perf_counter_ns()
+        await function(bot, *args)
+        durations.append(time.perf_counter_ns() - call_started)
+
+    elapsed = time.perf_counter_ns() - started
+    durations.sort()
+    peaks: list[int] = []
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    for index in range(min(allocation_iterations, -(-len(durations) // 10))):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await function(bot, *arguments[index % len(arguments)])
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        "iterations": len(durations),
+        "ops_per_sec": len(durations) / (elapsed / 1e9),
+        "mean_ns": sum(durations) / len(durations),
+        "p50_ns": durations[len(durations) // 2],
+        "p99_ns": durations[min(len(durations) - 1, len(durations) * 99 // 100)],
+        "peak_bytes_per_call": sum(peaks) / len(peaks),
+        "retained_bytes_per_call": (retained - baseline) / len(peaks),
+    }
+
+
+async def run(
+    sizes: typing.Iterable[int] = SIZES,
+    modes: typing.Iterable[str] = MODES,
+    lookups: typing.Iterable[str] | None = None,
+    latency: float = 0.001,
+    seconds: float = 1.0,
+    max_iterations: int = 100_000,
+    allocation_iterations: int = 1_000,
+    report: typing.Callable[[dict[str, typing.Any]], None] | None = None,
+) -> list[dict[str, typing.Any]]:
+    """Run every lookup in every mode against a generated guild of each size. Return one result per size, mode and lookup.
+
+    - `cache` resolves through `Optional.Cache` from the gateway cache.
+    - `indexed` resolves through `Optional.Cache` with the booster, channel, emoji and role indexes attached.
+    - `compact` resolves through `Optional.Cache` with a member index attached and the members dropped from the gateway cache, so members come from their compact records.
+    - `rest` resolves through `Optional.Rest`, every call paying the simulated `latency`.
+    - `resolver_cache` resolves through `Optional.Rest` with a resolver cache warmed by one untimed pass.
+    """
+    lookup_names = list(lookups) if lookups is not None else list(LOOKUPS)
+    results: list[dict[str, typing.Any]] = []
+
+    for size in sizes:
+        bot = FakeGatewayBot(latency=latency, seed=size)
+        generated_at = time.perf_counter()
+        guild = generate_guild(bot, members=size, roles=50, channels=100, boosters=max(size // 100, 1), emojis=50)
+        generate_seconds = time.perf_counter() - generated_at
+
+        for mode in modes:
+            indexes = [index_type().attach(bot) for index_type in INDEXES.get(mode, ())]
+            dropped_members = list(bot.cache.get_members_view_for_guild(guild.guild_id).values()) if mode == "compact" else []
+
+            if dropped_members:
+                bot.cache.clear_members_for_guild(guild.guild_id)
+
+            if mode == "resolver_cache":
+                attach_cache(bot)
+
+            for lookup in lookup_names:
+                name, build_arguments = LOOKUPS[lookup]
+                function = getattr(Optional.Cache if mode in CACHE_MODES else Optional.Rest, name)
+                arguments = build_arguments(guild)
+
+                if mode == "resolver_cache":
+                    for args in arguments:
+                        await function(bot, *args)
+
+                result = {"size": size, "mode": mode, "lookup": lookup, "generate_seconds": generate_seconds, **await measure(function, bot, arguments, seconds, max_iterations, allocation_iterations)}
+                results.append(result)
+
+                if report is not None:
+                    report(result)
+
+            if mode == "resolver_cache":
+                detach_cache(bot)
+
+            for index in indexes:
+                index.detach(bot)
+
+            for member in dropped_members:
+                bot.cache.set_member(member)
+
+        del bot, guild
+        gc.collect()
+
+    return results
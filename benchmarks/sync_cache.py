@@ -0,0 +1,87 @@
+"""Compare the per-call cost of the synchronous and asynchronous cache resolvers on a populated gateway cache."""
+
+import asyncio
+import base64
+import time
+import typing
+
+import hikari
+
+from hikariutils.getfetch import Optional, Sync
+
+GUILD_ID = 1
+USER_ID = 2
+CHANNEL_ID = 3
+
+
+def make_bot() -> hikari.GatewayBot:
+    """Build an offline GatewayBot with one member and one text channel in its cache."""
+    bot = hikari.GatewayBot(base64.b64encode(b"123456789012345678").decode() + ".bench.mark", banner=None)
+    bot.cache.set_member(
+        bot.entity_factory.deserialize_member(
+            {"user": {"id": str(USER_ID), "username": "bench", "discriminator": "0", "avatar": None}, "roles": [], "joined_at": "2020-01-01T00:00:00+00:00", "deaf": False, "mute": False},
+            guild_id=hikari.Snowflake(GUILD_ID),
+        )
+    )
+    bot.cache.set_guild_channel(bot.entity_factory.deserialize_guild_text_channel({"id": str(CHANNEL_ID), "type": 0, "guild_id": str(GUILD_ID), "name": "bench", "position": 0, "permission_overwrites": [], "topic": None, "nsfw": False, "last_message_id": None, "rate_limit_per_user": 0, "parent_id": None}))
+    return bot
+
+
+def time_sync(function: typing.Callable[..., typing.Any], args: tuple[typing.Any, ...], iterations: int, repeats: int) -> float:
+    """Return the best nanoseconds per call of a plain function."""
+    best = float("inf")
+
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+
+        for _ in range(iterations):
+            function(*args)
+
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+
+    return best
+
+
+async def time_async(function: typing.Callable[..., typing.Awaitable[typing.Any]], args: tuple[typing.Any, ...], iterations: int, repeats: int) -> float:
+    """Return the best nanoseconds per call of a coroutine function awaited in a loop."""
+    best = float("inf")
+
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+
+        for _ in range(iterations):
+            await function(*args)
+
+        best = min(best, (time.perf_counter_ns() - start) / iterations)
+
+    return best
+
+
+async def run(iterations: int = 100_000, repeats: int = 7) -> dict[str, dict[str, float]]:
+    """Time each lookup through the async and sync resolvers. Return nanoseconds per call keyed by lookup."""
+    bot = make_bot()
+    lookups = {
+        "member": ("member", (GUILD_ID, USER_ID)),
+        "member miss": ("member", (GUILD_ID, USER_ID + 1)),
+        "textable": ("textable", (CHANNEL_ID,)),
+        "textables": ("textables", (GUILD_ID,)),
+        "guild miss": ("guild", (GUILD_ID,)),
+    }
+    results: dict[str, dict[str, float]] = {}
+
+    for label, (name, args) in lookups.items():
+        results[label] = {
+            "async": await time_async(getattr(Optional.Cache, name), (bot, *args), iterations, repeats),
+            "sync": time_sync(getattr(Sync.Cache, name), (bot, *args), iterations, repeats),
+        }
+
+    return results
+
+
+def main() -> None:
+    for name, result in asyncio.run(run()).items():
+        print(f"{name:<12} async {result['async']:>7.0f} ns  sync {result['sync']:>7.0f} ns  saved {result['async'] - result['sync']:>6.0f} ns ({1 - result['sync'] / result['async']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+import collections
+import sys
+import time
+import typing
+
+import hikari
+
+DEFAULT_TTLS: dict[str, float] = {
+    "guild": 300.0,
+    "ban": 30.0,
+    "bans": 30.0,
+    "user": 600.0,
+    "member": 60.0,
+    "members": 60.0,
+    "boosters": 60.0,
+    "channel": 300.0,
+    "channels": 300.0,
+    "role": 300.0,
+    "roles": 300.0,
+    "emoji": 600.0,
+    "emojis": 600.0,
+}
+
+
+class CacheStats:
+    """Hit, miss and eviction counters for a single kind of cached object."""
+
+    __slots__ = ("hits", "misses", "stale_hits", "negative_hits", "evictions", "expirations")
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of hits to total lookups, or 0.0 if there were no lookups."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self) -> str:
+        return f"CacheStats(hits={self.hits}, misses={self.misses}, stale_hits={self.stale_hits}, negative_hits={self.negative_hits}, evictions={self.evictions}, expirations={self.expirations})"
+
+
+class CacheBackend(typing.Protocol):
+    """The interface the resolvers use to talk to a cache. Implement this to plug in a different store."""
+
+    def get(self, kind: str, key: typing.Hashable) -> typing.Any | None: ...
+
+    def is_stale(self, kind: str, key: typing.Hashable) -> bool: ...
+
+    def set(self, kind: str, key: typing.Hashable, value: typing.Any, age: float = 0.0) -> None: ...
+
+    def invalidate(self, kind: str, key: typing.Hashable | None = None) -> None: ...
+
+    def is_missing(self, kind: str, key: typing.Hashable) -> bool: ...
+
+    def set_missing(self, kind: str, key: typing.Hashable) -> None: ...
+
+
+class ResolverCache:
+    """A bounded in-memory cache with per-kind TTLs, LRU eviction and an approximate memory cap.
+
+    - `ttls` overrides the time to live in seconds for individual kinds, falling back to `default_ttl`.
+    - `max_entries` is the maximum number of objects held across all kinds.
+    - `max_bytes` is an optional cap on the approximate memory held, see `approximate_size`.
+    - `max_ages` and `default_max_age` opt kinds into stale-while-revalidate: past its TTL an object is still served, and refreshed in the background, until it is this many seconds old.
+    - `negative_ttl` and `max_negative_entries` bound the separate store remembering what Discord returned 404 for.
+    """
+
+    def __init__(
+        self,
+        ttls: typing.Mapping[str, float] | None = None,
+        default_ttl: float = 60.0,
+        max_entries: int = 10_000,
+        max_bytes: int | None = None,
+        max_ages: typing.Mapping[str, float] | None = None,
+        default_max_age: float | None = None,
+        negative_ttl: float = 15.0,
+        max_negative_entries: int = 1_000,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttls: dict[str, float] = {**DEFAULT_TTLS, **(ttls or {})}
+        self._default_ttl = default_ttl
+        self._max_ages: dict[str, float] = dict(max_ages or {})
+        self._default_max_age = default_max_age
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: collections.OrderedDict[tuple[str, typing.Hashable], tuple[typing.Any, float, float, int]] = collections.OrderedDict()
+        self._bytes = 0
+        self._negative_ttl = negative_ttl
+        self._max_negative_entries = max_negative_entries
+        self._missing: collections.OrderedDict[tuple[str, typing.Hashable], float] = collections.OrderedDict()
+        self._stats: dict[str, CacheStats] = collections.defaultdict(CacheStats)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: tuple[str, typing.Hashable]) -> bool:
+        entry = self._entries.get(item)
+        return entry is not None and entry[2] > self._clock()
+
+    @property
+    def bytes(self) -> int:
+        """The approximate number of bytes currently held."""
+        return self._bytes
+
+    def ttl(self, kind: str) -> float:
+        """Return the time to live in seconds for a kind."""
+        return self._ttls.get(kind, self._default_ttl)
+
+    def max_age(self, kind: str) -> float:
+        """Return how many seconds an object of a kind may be served for, stale or not."""
+        max_age = self._max_ages.get(kind, self._default_max_age)
+        return max(self.ttl(kind), max_age if max_age is not None else 0.0)
+
+    def get(self, kind: str, key: typing.Hashable) -> typing.Any | None:
+        """Return a cached object, stale or not, or None if it is missing or past its max age."""
+        stats = self._stats[kind]
+        entry = self._entries.get((kind, key))
+
+        if entry is None:
+            stats.misses += 1
+            return None
+
+        if entry[2] <= (now := self._clock()):
+            self._remove((kind, key))
+            stats.expirations += 1
+            stats.misses += 1
+            return None
+
+        if entry[1] <= now:
+            stats.stale_hits += 1
+
+        self._entries.move_to_end((kind, key))
+        stats.hits += 1
+        return entry[0]
+
+    def is_stale(self, kind: str, key: typing.Hashable) -> bool:
+        """Check if a cached object is past its TTL but still within its max age, and should be refreshed."""
+        entry = self._entries.get((kind, key))
+        return entry is not None and entry[1] <= self._clock() < entry[2]
+
+    def set(self, kind: str, key: typing.Hashable, value: typing.Any, age: float = 0.0) -> None:
+        """Store an object fetched `age` seconds ago, evicting the least recently used objects if a bound is exceeded. An object already past its max age isn't stored."""
+        if (ttl := self.ttl(kind)) <= 0:
+            return
+
+        if (kind, key) in self._entries:
+            self._remove((kind, key))
+
+        if age >= self.max_age(kind):
+            return
+
+        size = approximate_size(value) if self._max_bytes is not None else 0
+        fetched_at = self._clock() - age
+        self._entries[(kind, key)] = (value, fetched_at + ttl, fetched_at + self.max_age(kind), size)
+        self._bytes += size
+
+        while self._entries and (len(self._entries) > self._max_entries or (self._max_bytes is not None and self._bytes > self._max_bytes)):
+            evicted_key, evicted_entry = self._entries.popitem(last=False)
+            self._bytes -= evicted_entry[3]
+            self._stats[evicted_key[0]].evictions += 1
+
+    def is_missing(self, kind: str, key: typing.Hashable) -> bool:
+        """Check if Discord recently reported an object as not found."""
+        if (expires_at := self._missing.get((kind, key))) is None:
+            return False
+
+        if expires_at <= self._clock():
+            del self._missing[(kind, key)]
+            return False
+
+        self._stats[kind].negative_hits += 1
+        return True
+
+    def set_missing(self, kind: str, key: typing.Hashable) -> None:
+        """Remember that Discord reported an object as not found, dropping any cached copy and evicting the oldest such records if the bound is exceeded."""
+        self._remove((kind, key))
+
+        if self._negative_ttl <= 0:
+            return
+
+        self._missing.pop((kind, key), None)
+        self._missing[(kind, key)] = self._clock() + self._negative_ttl
+
+        while len(self._missing) > self._max_negative_entries:
+            self._missing.popitem(last=False)
+
+    def invalidate(self, kind: str, key: typing.Hashable | None = None) -> None:
+        """Remove a single cached object or not found record, or every one of a kind if no key is given."""
+        if key is not None:
+            self._remove((kind, key))
+            self._missing.pop((kind, key), None)
+            return
+
+        for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == kind]:
+            self._remove(entry_key)
+
+        for entry_key in [entry_key for entry_key in self._missing if entry_key[0] == kind]:
+            del self._missing[entry_key]
+
+    def clear(self) -> None:
+        """Remove every cached object and not found record. Statistics are kept."""
+        self._entries.clear()
+        self._missing.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Return the statistics for every kind that has been looked up or evicted."""
+        return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """Reset every statistic to zero."""
+        self._stats.clear()
+
+    def _remove(self, entry_key: tuple[str, typing.Hashable]) -> None:
+        if (entry := self._entries.pop(entry_key, None)) is not None:
+            self._bytes -= entry[3]
+
+
+class DMChannelCache:
+    """A bounded LRU of the DM channel opened with each user.
+
+    The DM channel between the bot and a user never changes, so entries don't expire and are only evicted past `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._max_entries = max_entries
+        self._channels: collections.OrderedDict[hikari.Snowflake, hikari.DMChannel] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __contains__(self, user: int | hikari.User) -> bool:
+        return hikari.Snowflake(user) in self._channels
+
+    def get(self, user: int | hikari.User) -> hikari.DMChannel | None:
+        """Return the DM channel opened with a user, if cached."""
+        if (channel := self._channels.get(user_id := hikari.Snowflake(user))) is not None:
+            self._channels.move_to_end(user_id)
+
+        return channel
+
+    def set(self, user: int | hikari.User, channel: hikari.DMChannel) -> None:
+        """Cache the DM channel opened with a user, evicting the least recently used channels past the limit."""
+        self._channels[user_id := hikari.Snowflake(user)] = channel
+        self._channels.move_to_end(user_id)
+
+        while len(self._channels) > self._max_entries:
+            self._channels.popitem(last=False)
+
+    def invalidate(self, user: int | hikari.User | None = None) -> None:
+        """Remove the DM channel of a user, or every one if no user is given."""
+        if user is None:
+            self._channels.clear()
+        else:
+            self._channels.pop(hikari.Snowflake(user), None)
+
+
+def approximate_size(value: typing.Any) -> int:
+    """Estimate the memory held by an object, its attributes and, for containers, a sample of its items.
+
+    Objects defining `__sizeof__`, such as the snapshots in `hikariutils.index`, are trusted to count what they hold.
+    """
+    if isinstance(value, typing.Mapping):
+        sample = next(iter(value.values()), None)
+        return sys.getsizeof(value) + len(value) * (_shallow_size(sample) if sample is not None else 0)
+
+    if isinstance(value, tuple | list | set | frozenset):
+        sample = next(iter(value), None)
+        return sys.getsizeof(value) + len(value) * (_shallow_size(sample) if sample is not None else 0)
+
+    if type(value).__sizeof__ is not object.__sizeof__:
+        return sys.getsizeof(value)
+
+    return _shallow_size(value)
+
+
+def _shallow_size(value: typing.Any) -> int:
+    size = sys.getsizeof(value)
+
+    for slot in getattr(type(value), "__slots__", ()):
+        size += sys.getsizeof(getattr(value, slot, None))
+
+    for attribute in getattr(value, "__dict__", {}).values():
+        size += sys.getsizeof(attribute)
+
+    return size
+
+
+_CACHES: dict[hikari.GatewayBot | hikari.RESTBot, CacheBackend] = {}
+_DM_CACHES: dict[hikari.GatewayBot | hikari.RESTBot, DMChannelCache] = {}
+_LISTENERS: dict[hikari.GatewayBot, list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]] = {}
+
+
+def attach_cache(bot: hikari.GatewayBot | hikari.RESTBot, cache: CacheBackend | None = None) -> CacheBackend:
+    """Put a cache in front of every fetch the resolvers make for a bot. Return the attached cache.
+
+    On a GatewayBot, create, update and delete events invalidate the matching cached objects and not found records.
+    """
+    detach_cache(bot)
+    resolved_cache = _CACHES[bot] = cache if cache is not None else ResolverCache()
+
+    if isinstance(bot, hikari.GatewayBot):
+        _LISTENERS[bot] = _invalidation_listeners(resolved_cache)
+
+        for event_type, callback in _LISTENERS[bot]:
+            bot.subscribe(event_type, callback)
+
+    return resolved_cache
+
+
+def detach_cache(bot: hikari.GatewayBot | hikari.RESTBot) -> CacheBackend | None:
+    """Stop caching fetches for a bot. Return the previously attached cache, if any."""
+    if isinstance(bot, hikari.GatewayBot):
+        for event_type, callback in _LISTENERS.pop(bot, []):
+            bot.unsubscribe(event_type, callback)
+
+    return _CACHES.pop(bot, None)
+
+
+def get_cache(bot: hikari.GatewayBot | hikari.RESTBot) -> CacheBackend | None:
+    """Return the cache attached to a bot, if any."""
+    return _CACHES.get(bot)
+
+
+def attach_dm_cache(bot: hikari.GatewayBot | hikari.RESTBot, max_entries: int = 10_000) -> DMChannelCache:
+    """Replace the cache of DM channels opened with users for a bot. Return the attached cache."""
+    dm_cache = _DM_CACHES[bot] = DMChannelCache(max_entries)
+    return dm_cache
+
+
+def detach_dm_cache(bot: hikari.GatewayBot | hikari.RESTBot) -> DMChannelCache | None:
+    """Stop caching DM channels opened with users for a bot. Return the previously attached cache, if any."""
+    return _DM_CACHES.pop(bot, None)
+
+
+def get_dm_cache(bot: hikari.GatewayBot | hikari.RESTBot) -> DMChannelCache | None:
+    """Return the cache of DM channels opened with users attached to a bot, if any."""
+    return _DM_CACHES.get(bot)
+
+
+def _invalidation_listeners(cache: CacheBackend) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+    # Joining, becoming available and leaving may follow any number of missed events, so every list cached for the guild is dropped.
+    # An update carries the guild with its roles and emojis only.
+    async def on_guild(event: hikari.GuildJoinEvent | hikari.GuildAvailableEvent | hikari.GuildLeaveEvent) -> None:
+        for kind in ("guild", "members", "boosters", "channels", "roles", "emojis", "bans"):
+            cache.invalidate(kind, event.guild_id)
+
+    async def on_guild_update(event: hikari.GuildUpdateEvent) -> None:
+        for kind in ("guild", "roles", "emojis"):
+            cache.invalidate(kind, event.guild_id)
+
+    async def on_member(event: hikari.MemberCreateEvent | hikari.MemberUpdateEvent | hikari.MemberDeleteEvent) -> None:
+        cache.invalidate("member", (event.guild_id, event.user_id))
+        cache.invalidate("members", event.guild_id)
+        cache.invalidate("boosters", event.guild_id)
+        cache.invalidate("user", event.user_id)
+
+    async def on_channel(event: hikari.GuildChannelCreateEvent | hikari.GuildChannelUpdateEvent | hikari.GuildChannelDeleteEvent) -> None:
+        cache.invalidate("channel", event.channel_id)
+        cache.invalidate("channels", event.guild_id)
+
+    async def on_thread(event: hikari.GuildThreadCreateEvent | hikari.GuildThreadUpdateEvent | hikari.GuildThreadDeleteEvent) -> None:
+        cache.invalidate("channel", event.thread_id)
+
+    async def on_role(event: hikari.RoleCreateEvent | hikari.RoleUpdateEvent | hikari.RoleDeleteEvent) -> None:
+        cache.invalidate("role", (event.guild_id, event.role_id))
+        cache.invalidate("roles", event.guild_id)
+
+    async def on_ban(event: hikari.BanCreateEvent) -> None:
+        cache.invalidate("ban", (event.guild_id, event.user_id))
+        cache.invalidate("bans", event.guild_id)
+
+    async def on_unban(event: hikari.BanDeleteEvent) -> None:
+        cache.invalidate("ban", (event.guild_id, event.user_id))
+        cache.invalidate("bans", event.guild_id)
+
+    async def on_emojis(event: hikari.EmojisUpdateEvent) -> None:
+        cache.invalidate("emojis", event.guild_id)
+
+        for emoji in (*event.emojis, *(event.old_emojis or ())):
+            cache.invalidate("emoji", (event.guild_id, emoji.id))
+
+    return [
+        (hikari.GuildJoinEvent, on_guild),
+        (hikari.GuildAvailableEvent, on_guild),
+        (hikari.GuildUpdateEvent, on_guild_update),
+        (hikari.GuildLeaveEvent, on_guild),
+        (hikari.MemberCreateEvent, on_member),
+        (hikari.MemberUpdateEvent, on_member),
+        (hikari.MemberDeleteEvent, on_member),
+        (hikari.GuildChannelCreateEvent, on_channel),
+        (hikari.GuildChannelUpdateEvent, on_channel),
+        (hikari.GuildChannelDeleteEvent, on_channel),
+        (hikari.GuildThreadCreateEvent, on_thread),
+        (hikari.GuildThreadUpdateEvent, on_thread),
+        (hikari.GuildThreadDeleteEvent, on_thread),
+        (hikari.RoleCreateEvent, on_role),
+        (hikari.RoleUpdateEvent, on_role),
+        (hikari.RoleDeleteEvent, on_role),
+        (hikari.BanCreateEvent, on_ban),
+        (hikari.BanDeleteEvent, on_unban),
+        (hikari.EmojisUpdateEvent, on_emojis),
+    ]
@@ -0,0 +1,85 @@
+import functools
+import re
+import typing
+
+import hikari
+
+_CUSTOM_EMOJI = re.compile(r"<(a)?:(\w{2,32}):(\d{15,20})>")
+_END = ""
+
+_TrieNode: typing.TypeAlias = dict[str, "_TrieNode"]
+
+
+def is_unicode_emoji(text: str) -> bool:
+    """Return whether a text is exactly one unicode emoji, including skin tone and ZWJ sequences."""
+    return text in _emoji_set()
+
+
+def extract_emojis(text: str) -> list[hikari.UnicodeEmoji | hikari.CustomEmoji]:
+    """Find every unicode and custom emoji in a text, in order, in a single pass. The longest sequence wins, so a family or a skin tone counts as one emoji."""
+    trie = _emoji_trie()
+    candidates = _candidates()
+    found: list[hikari.UnicodeEmoji | hikari.CustomEmoji] = []
+    length = len(text)
+    index = 0
+
+    while (candidate := candidates.search(text, index)) is not None:
+        index = candidate.start()
+
+        if text[index] == "<" and (match := _CUSTOM_EMOJI.match(text, index)) is not None:
+            found.append(hikari.CustomEmoji(id=hikari.Snowflake(match[3]), name=match[2], is_animated=bool(match[1])))
+            index = match.end()
+            continue
+
+        node: _TrieNode | None = trie
+        cursor = index
+        end = 0
+
+        while cursor < length and (node := node.get(text[cursor])) is not None:
+            cursor += 1
+
+            if _END in node:
+                end = cursor
+
+        if end:
+            found.append(hikari.UnicodeEmoji.parse(text[index:end]))
+            index = end
+        else:
+            index += 1
+
+    return found
+
+
+@functools.cache
+def _emoji_set() -> frozenset[str]:
+    import emoji
+
+    return frozenset(emoji.EMOJI_DATA)
+
+
+@functools.cache
+def _candidates() -> re.Pattern[str]:
+    ranges: list[list[int]] = []
+
+    for code_point in sorted(map(ord, _emoji_trie())):
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1][1] = code_point
+        else:
+            ranges.append([code_point, code_point])
+
+    return re.compile("[<" + "".join(re.escape(chr(start)) if start == end else f"{re.escape(chr(start))}-{re.escape(chr(end))}" for start, end in ranges) + "]")
+
+
+@functools.cache
+def _emoji_trie() -> _TrieNode:
+    trie: _TrieNode = {}
+
+    for sequence in _emoji_set():
+        node = trie
+
+        for char in sequence:
+            node = node.setdefault(char, {})
+
+        node[_END] = {}
+
+    return trie
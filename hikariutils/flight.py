@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import typing
+
+import hikari
+
+T = typing.TypeVar("T")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Share one in-flight call between every concurrent caller asking for the same key.
+
+    The call runs in its own task, so a caller being cancelled doesn't cancel it for the others.
+    Results and exceptions are delivered to every caller alike.
+    Exceptions of calls started without a caller awaiting them are logged as warnings, every other one at debug level.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[typing.Hashable, asyncio.Task[typing.Any]] = {}
+        self._awaited: set[asyncio.Task[typing.Any]] = set()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: typing.Hashable, fetcher: typing.Callable[[], typing.Awaitable[T]]) -> T:
+        """Await the call in flight for a key, starting it with the fetcher if there is none."""
+        if (task := self._calls.get(key)) is None:
+            task = self.start(key, fetcher)
+
+        self._awaited.add(task)
+        return await asyncio.shield(task)
+
+    def start(self, key: typing.Hashable, fetcher: typing.Callable[[], typing.Awaitable[T]]) -> asyncio.Task[T]:
+        """Start the call for a key without awaiting it. Return the task already in flight if there is one."""
+        if (task := self._calls.get(key)) is not None:
+            return task
+
+        task = asyncio.ensure_future(fetcher())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: typing.Hashable, task: asyncio.Task[typing.Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        awaited = task in self._awaited
+        self._awaited.discard(task)
+
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            level = logging.DEBUG if awaited or isinstance(exception, hikari.NotFoundError) else logging.WARNING
+            _LOGGER.log(level, "Call for %r failed", key, exc_info=exception)
@@ -1,9 +1,27 @@
+import asyncio
+import collections.abc
+import contextvars
+import functools
+import inspect
+import operator
+import secrets
 import typing
 
-import emoji as emojis
 import hikari
 
-from hikariutils.errors import InvalidBot, MandatoryBanNotFound, MandatoryChannelNotFound, MandatoryEmojiNotFound, MandatoryGuildNotFound, MandatoryMemberNotFound, MandatoryRoleNotFound, MandatoryUserNotFound
+from hikariutils.cache import CacheBackend, attach_cache, attach_dm_cache, get_cache, get_dm_cache
+from hikariutils.emojis import is_unicode_emoji
+from hikariutils.errors import HikariUtilsError, InvalidBot, MandatoryBanNotFound, MandatoryChannelNotFound, MandatoryEmojiNotFound, MandatoryGuildNotFound, MandatoryMemberNotFound, MandatoryRoleNotFound, MandatoryUserNotFound
+from hikariutils.flight import SingleFlight
+from hikariutils.hooks import HOOKS, HookCall, traced, traced_iterator
+from hikariutils.index import CHANNEL_PARTITIONS, BanIndex, BoosterIndex, ChannelIndex, ChannelPartitions, CompactMember, EmojiIndex, EmojiSnapshot, MemberIndex, RoleIndex, RoleSnapshot, get_index
+from hikariutils.scheduler import Priority, current_priority, get_scheduler, use_priority
+
+T = typing.TypeVar("T")
+
+_IN_FLIGHT = SingleFlight()
+_CALL: contextvars.ContextVar[HookCall | None] = contextvars.ContextVar("hikariutils_call", default=None)
+_PAGE_SIZE = 1000
 
 
 class Optional:
@@ -11,3493 +29,1361 @@ class Optional:
         """Retrieve an object from the cache or fetch it from Discord if not found. Return None if still not found."""
 
         @staticmethod
-        async def guild(
+        @traced("members_by_ids")
+        async def members_by_ids(
             bot: hikari.GatewayBot | hikari.RESTBot,
             guild: int | hikari.Guild | None,
-        ) -> hikari.GatewayGuild | hikari.RESTGuild | None:
-            """Retrieve a guild from the cache. If not found, fetch it from Discord. Return None if still not found."""
-            return await _either_guild(bot, guild)
+            users: typing.Iterable[int | hikari.User],
+            concurrency: int = 10,
+            timeout: float = 10.0,
+            priority: Priority | None = None,
+        ) -> tuple[typing.Mapping[hikari.Snowflake, hikari.Member | CompactMember], set[hikari.Snowflake]]:
+            """Retrieve many members from the cache. Request the rest in chunks from the gateway or fetch them from Discord. Return the members found and the IDs not found."""
+            return await _either_members_by_ids(bot, guild, users, concurrency, timeout, priority)
 
         @staticmethod
-        async def banned(
+        @traced("banned_many")
+        async def banned_many(
             bot: hikari.GatewayBot | hikari.RESTBot,
             guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.GuildBan | None:
-            """Retrieve a ban by fetching it from Discord. Return None if not found."""
-            return await _rest_banned(bot, guild, user)
-
-        @staticmethod
-        async def user(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            user: int | hikari.User | None,
-        ) -> hikari.User | None:
-            """Retrieve a user from the cache. If not found, fetch it from Discord. Return None if still not found."""
-            return await _either_user(bot, user)
+            users: typing.Iterable[int | hikari.User],
+            priority: Priority | None = None,
+        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildBan]:
+            """Check many users against the ban list of a guild, fetching it from Discord once if not indexed. Return the bans of the users banned."""
+            return await _either_banned_many(bot, guild, users, priority)
 
         @staticmethod
-        async def member(
+        @traced("dm_for_user")
+        async def dm_for_user(
             bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
             user: int | hikari.User | None,
-        ) -> hikari.Member | None:
-            """Retrieve a member from the cache. If not found, fetch it from Discord. Return None if still not found."""
-            return await _either_member(bot, guild, user)
-
-        @staticmethod
-        async def members(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-            """Retrieve members from the cache. If not found, fetch them from Discord. Return None if still not found."""
-            return await _either_members(bot, guild)
-
-        @staticmethod
-        async def boosters(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-            """Retrieve members from the cache. If not found, fetch them from Discord. Return None if still not found."""
-            return await _either_boosters(bot, guild)
-
-        @staticmethod
-        async def channel(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildChannel | None:
-            """Retrieve a channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
-            return await _either_channel(bot, channel)
-
-        @staticmethod
-        async def channels(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
-            """Retrieve channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
-            return await _either_channels(bot, guild)
-
-        @staticmethod
-        async def dms(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.PrivateChannel | None,
-        ) -> hikari.PrivateChannel | None:
-            """Retrieve a private channel by fetching from Discord. Return None if not found."""
-            return await _rest_dms(bot, channel)
-
-        @staticmethod
-        async def dm(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.DMChannel | None,
+            priority: Priority | None = None,
         ) -> hikari.DMChannel | None:
-            """Retrieve a DM channel by fetching from Discord. Return None if not found."""
-            return await _rest_dm(bot, channel)
-
-        @staticmethod
-        async def group(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GroupDMChannel | None,
-        ) -> hikari.GroupDMChannel | None:
-            """Retrieve a group DM channel by fetching from Discord. Return None if not found."""
-            return await _rest_group(bot, channel)
+            """Retrieve the DM channel with a user from the DM cache or open it through Discord if not found. Return None if still not found."""
+            return await _either_dm_for_user(bot, user, priority)
 
-        @staticmethod
-        async def textable(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.TextableGuildChannel | None:
-            """Retrieve a textable channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_textable(bot, channel)
-
-        @staticmethod
-        async def textables(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
-            """Retrieve textable channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_textables(bot, guild)
-
-        @staticmethod
-        async def permissible(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.PermissibleGuildChannel | None:
-            """Retrieve a permissible channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_permissible(bot, channel)
-
-        @staticmethod
-        async def permissibles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
-            """Retrieve permissible channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_permissibles(bot, guild)
-
-        @staticmethod
-        async def category(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildCategory | None:
-            """Retrieve a category channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_category(bot, channel)
-
-        @staticmethod
-        async def categories(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
-            """Retrieve category channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_categories(bot, guild)
+    class Cache:
+        """Retrieve an object from the cache. Return None if not found."""
 
-        @staticmethod
-        async def voice(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildVoiceChannel | None:
-            """Retrieve a voice channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_voice(bot, channel)
+    class Rest:
+        """Retrieve an object by fetching it from Discord. Return None if not found."""
 
         @staticmethod
-        async def voices(
+        @traced_iterator("iter_members")
+        def iter_members(
             bot: hikari.GatewayBot | hikari.RESTBot,
             guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
-            """Retrieve voice channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_voices(bot, guild)
-
-        @staticmethod
-        async def stage(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildStageChannel | None:
-            """Retrieve a stage channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_stage(bot, channel)
+            predicate: typing.Callable[[hikari.Member], bool] | None = None,
+            priority: Priority | None = None,
+        ) -> typing.AsyncIterator[hikari.Member]:
+            """Stream members matching an optional predicate from Discord as each page arrives. Yield nothing if not found."""
+            return _rest_iter_members(bot, guild, predicate, priority)
 
         @staticmethod
-        async def stages(
+        @traced_iterator("iter_boosters")
+        def iter_boosters(
             bot: hikari.GatewayBot | hikari.RESTBot,
             guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
-            """Retrieve stage channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_stages(bot, guild)
-
-        @staticmethod
-        async def text(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildTextChannel | None:
-            """Retrieve a text channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_text(bot, channel)
+            predicate: typing.Callable[[hikari.Member], bool] | None = None,
+            priority: Priority | None = None,
+        ) -> typing.AsyncIterator[hikari.Member]:
+            """Stream boosters matching an optional predicate from Discord as each page arrives. Yield nothing if not found."""
+            return _rest_iter_members(bot, guild, _is_booster if predicate is None else lambda member: _is_booster(member) and predicate(member), priority)
 
         @staticmethod
-        async def texts(
+        @traced_iterator("iter_bans")
+        def iter_bans(
             bot: hikari.GatewayBot | hikari.RESTBot,
             guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
-            """Retrieve text channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_texts(bot, guild)
+            predicate: typing.Callable[[hikari.GuildBan], bool] | None = None,
+            priority: Priority | None = None,
+        ) -> typing.AsyncIterator[hikari.GuildBan]:
+            """Stream bans matching an optional predicate from Discord as each page arrives. Yield nothing if not found."""
+            return _rest_iter_bans(bot, guild, predicate, priority)
 
-        @staticmethod
-        async def thread(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildThreadChannel | None:
-            """Retrieve a thread channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_thread(bot, channel)
-
-        @staticmethod
-        async def threads(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
-            """Retrieve thread channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_threads(bot, guild)
 
-        @staticmethod
-        async def public(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
-            """Retrieve a public thread or news thread from the cache or fetch from Discord. Return None if not found."""
-            return await _either_public(bot, channel)
+class Mandatory:
+    class Either:
+        """Retrieve an object from the cache or fetch it from Discord if not found. Raise an exception if still not found."""
 
         @staticmethod
-        async def publics(
+        @traced("members_by_ids")
+        async def members_by_ids(
             bot: hikari.GatewayBot | hikari.RESTBot,
             guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
-            """Retrieve public/news threads from the cache or fetch from Discord. Return None if not found."""
-            return await _either_publics(bot, guild)
+            users: typing.Iterable[int | hikari.User],
+            concurrency: int = 10,
+            timeout: float = 10.0,
+            priority: Priority | None = None,
+        ) -> typing.Mapping[hikari.Snowflake, hikari.Member | CompactMember]:
+            """Retrieve many members from the cache. Request the rest in chunks from the gateway or fetch them from Discord. Raise an exception if any are not found."""
+            resolved_members, missing_members = await _either_members_by_ids(bot, guild, users, concurrency, timeout, priority)
 
-        @staticmethod
-        async def private(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPrivateThread | None:
-            """Retrieve a private thread from the cache or fetch from Discord. Return None if not found."""
-            return await _either_private(bot, channel)
+            if missing_members:
+                raise MandatoryMemberNotFound
 
-        @staticmethod
-        async def privates(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
-            """Retrieve private threads from the cache or fetch from Discord. Return None if not found."""
-            return await _either_privates(bot, guild)
+            return resolved_members
 
         @staticmethod
-        async def forum(
+        @traced("dm_for_user")
+        async def dm_for_user(
             bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildForumChannel | None:
-            """Retrieve a forum channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_forum(bot, channel)
+            user: int | hikari.User | None,
+            priority: Priority | None = None,
+        ) -> hikari.DMChannel:
+            """Retrieve the DM channel with a user from the DM cache or open it through Discord if not found. Raise an exception if still not found."""
+            if (dm_channel := await _either_dm_for_user(bot, user, priority)) is None:
+                raise MandatoryChannelNotFound
 
-        @staticmethod
-        async def forums(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
-            """Retrieve forum channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_forums(bot, guild)
+            return dm_channel
 
-        @staticmethod
-        async def news(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildNewsChannel | None:
-            """Retrieve a news channel from the cache or fetch from Discord. Return None if not found."""
-            return await _either_news(bot, channel)
+    class Cache:
+        """Retrieve an object from the cache. Raise an exception if not found."""
 
-        @staticmethod
-        async def newses(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
-            """Retrieve news channels from the cache or fetch from Discord. Return None if not found."""
-            return await _either_newses(bot, guild)
+    class Rest:
+        """Retrieve an object by fetching it from Discord. Raise an exception if not found."""
 
-        @staticmethod
-        async def role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            role: int | hikari.Role | None,
-        ) -> hikari.Role | None:
-            """Retrieve a role from the cache or fetch from Discord. Return None if not found."""
-            return await _either_role(bot, guild, role)
 
-        @staticmethod
-        async def roles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
-            """Retrieve roles belonging to a member or a guild from the cache or fetch from Discord. Return None if not found."""
-            return await _either_roles(bot, guild, member)
+class Sync:
+    class Cache:
+        """Retrieve an object from the cache without awaiting. Return None if not found."""
 
-        @staticmethod
-        async def top_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> hikari.Role | None:
-            """Retrieve the top role of a member or guild from the cache or fetch from Discord. Return None if not found."""
-            return await _either_top_role(bot, guild, member)
+    class MandatoryCache:
+        """Retrieve an object from the cache without awaiting. Raise an exception if not found."""
 
-        @staticmethod
-        async def booster_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.Role | None:
-            """Retrieve the booster role of a guild from the cache or fetch from Discord. Return None if not found."""
-            return await _either_booster_role(bot, guild)
 
-        @staticmethod
-        async def emoji(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            emoji: int | str | hikari.Emoji | None,
-            guild: int | hikari.Guild | None = None,
-        ) -> hikari.Emoji | None:
-            """Retrieve an emoji from the cache or fetch from Discord. Return None if not found."""
-            return await _either_emoji(bot, emoji, guild)
+@traced("resolve_many")
+async def resolve_many(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    requests: typing.Iterable[typing.Sequence[typing.Any]],
+    concurrency: int = 10,
+    priority: Priority | None = None,
+) -> list[typing.Any]:
+    """Resolve objects of any kind from requests such as `("member", guild, user)` or `("channel", channel)`.
 
-    class Cache:
-        """Retrieve an object from the cache. Return None if not found."""
+    Duplicate requests are resolved once. Cache hits are served immediately and the rest are fetched from Discord, at most `concurrency` at a time.
+    Return the results in the order requested: the object, None if not found, or the exception raised for that request.
+    """
+    if priority is not None:
+        with use_priority(priority):
+            return await _resolve_many(bot, requests, concurrency)
 
-        @staticmethod
-        async def guild(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.GatewayGuild | None:
-            """Retrieve a guild from the cache. Return None if not found."""
-            return await _cache_guild(bot, guild)
+    return await _resolve_many(bot, requests, concurrency)
 
-        @staticmethod
-        async def user(
-            bot: hikari.GatewayBot,
-            user: int | hikari.User | None,
-        ) -> hikari.User | None:
-            """Retrieve a user from the cache. Return None if not found."""
-            return await _cache_user(bot, user)
 
-        @staticmethod
-        async def member(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.Member | None:
-            """Retrieve a member from the cache. Return None if not found."""
-            return await _cache_member(bot, guild, user)
+@traced("resolve_emojis")
+async def resolve_emojis(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild | None,
+    emojis: typing.Iterable[int | str | hikari.Emoji],
+    priority: Priority | None = None,
+) -> list[hikari.Emoji | None]:
+    """Resolve many references to emojis: unicode emojis, and custom emojis of a guild by object, ID, `<:name:id>` mention or case-insensitive name.
 
-        @staticmethod
-        async def members(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-            """Retrieve members from the cache. Return None if not found."""
-            return await _cache_members(bot, guild)
+    The emojis of the guild come from the cache or, if not found, from a single fetch of all of them. Return the results in the order given, None for those not found.
+    """
+    if priority is not None:
+        with use_priority(priority):
+            return await _resolve_emojis(bot, guild, emojis)
 
-        @staticmethod
-        async def boosters(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-            """Retrieve boosters from the cache. Return None if not found."""
-            return await _cache_boosters(bot, guild)
+    return await _resolve_emojis(bot, guild, emojis)
 
-        @staticmethod
-        async def channel(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildChannel | None:
-            """Retrieve a channel from the cache. Return None if not found."""
-            return await _cache_channel(bot, channel)
 
-        @staticmethod
-        async def channels(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
-            """Retrieve channels from the cache. Return None if not found."""
-            return await _cache_channels(bot, guild)
+WARM_KINDS: tuple[str, ...] = ("guild", "roles", "channels", "emojis")
 
-        @staticmethod
-        async def textable(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.TextableGuildChannel | None:
-            """Retrieve a textable channel from the cache. Return None if not found."""
-            return await _cache_textable(bot, channel)
 
-        @staticmethod
-        async def textables(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
-            """Retrieve textable channels from the cache. Return None if not found."""
-            return await _cache_textables(bot, guild)
+@traced("warm")
+async def warm(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild_ids: typing.Iterable[int | hikari.Guild],
+    kinds: typing.Iterable[str] = WARM_KINDS,
+    concurrency: int = 5,
+    progress: typing.Callable[[int, int], None] | None = None,
+    priority: Priority = Priority.BACKGROUND,
+) -> dict[tuple[hikari.Snowflake, str], Exception]:
+    """Prefetch guilds and their roles, channels and emojis into the resolver cache, attaching one if none is attached.
 
-        @staticmethod
-        async def permissible(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.PermissibleGuildChannel | None:
-            """Retrieve a permissible channel from the cache. Return None if not found."""
-            return await _cache_permissible(bot, channel)
+    At most `concurrency` fetches run at a time, at background priority by default. Roles and emojis come with a guild, so warming them alongside it costs no extra requests, and nothing more is fetched for a guild Discord reports as not found.
+    `progress` is called with the number of lookups done and the total after each one.
+    Return the exception raised by each lookup that failed, keyed by guild ID and kind.
+    """
+    if unknown_kinds := set(kinds := tuple(kinds)) - set(WARM_KINDS):
+        raise ValueError(f"Cannot warm unknown kinds: {', '.join(sorted(unknown_kinds))}")
 
-        @staticmethod
-        async def permissibles(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
-            """Retrieve permissible channels from the cache. Return None if not found."""
-            return await _cache_permissibles(bot, guild)
+    if get_cache(bot) is None:
+        attach_cache(bot)
 
-        @staticmethod
-        async def category(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildCategory | None:
-            """Retrieve a category channel from the cache. Return None if not found."""
-            return await _cache_category(bot, channel)
+    ordered_kinds = tuple(kind for kind in WARM_KINDS if kind in kinds)
+    guilds = list(dict.fromkeys(hikari.Snowflake(guild) for guild in guild_ids))
+    semaphore = asyncio.Semaphore(concurrency)
+    failures: dict[tuple[hikari.Snowflake, str], Exception] = {}
+    total = len(guilds) * len(ordered_kinds)
+    done = 0
 
-        @staticmethod
-        async def categories(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
-            """Retrieve category channels from the cache. Return None if not found."""
-            return await _cache_categories(bot, guild)
+    async def warm_guild(guild: hikari.Snowflake) -> None:
+        nonlocal done
 
-        @staticmethod
-        async def voice(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildVoiceChannel | None:
-            """Retrieve a voice channel from the cache. Return None if not found."""
-            return await _cache_voice(bot, channel)
+        found = True
 
-        @staticmethod
-        async def voices(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
-            """Retrieve voice channels from the cache. Return None if not found."""
-            return await _cache_voices(bot, guild)
+        for kind in ordered_kinds:
+            try:
+                if found:
+                    async with semaphore:
+                        found = await _warm_kind(bot, guild, kind, ordered_kinds) is not None or kind != "guild"
+            except Exception as error:
+                failures[(guild, kind)] = error
+
+            done += 1
+
+            if progress is not None:
+                progress(done, total)
+
+    with use_priority(priority):
+        await asyncio.gather(*(warm_guild(guild) for guild in guilds))
+
+    return failures
+
+
+class Spec:
+    """Describe one kind of object: how to find it in the cache, how to fetch it from Discord and what its resolvers look like.
+
+    - `cache` is a plain function taking the bot and the arguments, or None if the kind can't be found in the cache.
+    - `rest` is a coroutine function taking the bot and the arguments.
+    - `required` is how many leading arguments must be truthy for a lookup to be attempted, by default those without a default.
+    - `cache_returns` and `rest_returns` narrow `returns` for the resolvers which only use one source.
+    """
+
+    __slots__ = ("name", "noun", "parameters", "returns", "exception", "cache", "rest", "required", "cache_returns", "rest_returns")
+
+    def __init__(
+        self,
+        name: str,
+        noun: str,
+        parameters: tuple[inspect.Parameter, ...],
+        returns: typing.Any,
+        exception: type[HikariUtilsError],
+        cache: typing.Callable[..., typing.Any] | None,
+        rest: typing.Callable[..., typing.Awaitable[typing.Any]],
+        required: int | None = None,
+        cache_returns: typing.Any = None,
+        rest_returns: typing.Any = None,
+    ) -> None:
+        self.name = name
+        self.noun = noun
+        self.parameters = parameters
+        self.returns = returns
+        self.exception = exception
+        self.cache = cache
+        self.rest = rest
+        self.required = required if required is not None else sum(parameter.default is inspect.Parameter.empty for parameter in parameters)
+        self.cache_returns = cache_returns if cache_returns is not None else returns
+        self.rest_returns = rest_returns if rest_returns is not None else returns
+
+    def __repr__(self) -> str:
+        return f"Spec(name={self.name!r})"
+
+
+def _resolver(
+    spec: Spec,
+    mode: str,
+    mandatory: bool,
+    qualname: str,
+    synchronous: bool = False,
+) -> typing.Callable[..., typing.Any]:
+    if mode != "cache":
+        resolver = _fetch_resolver(spec, spec.cache if mode == "either" else None, mandatory)
+    elif synchronous:
+        resolver = _cache_resolver(spec, mandatory)
+    else:
+        lookup = _cache_resolver(spec, mandatory)
+
+        async def resolver(bot: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            return lookup(bot, *args, **kwargs)
+
+    returns = {"either": spec.returns, "cache": spec.cache_returns, "rest": spec.rest_returns}[mode]
+    bot_parameter = _parameter("bot", hikari.GatewayBot if mode == "cache" else hikari.GatewayBot | hikari.RESTBot)
+    priority_parameters = [inspect.Parameter("priority", inspect.Parameter.KEYWORD_ONLY, annotation=Priority | None, default=None)] if mode != "cache" else []
+    signature = inspect.Signature([bot_parameter, *spec.parameters, *priority_parameters], return_annotation=returns if mandatory else returns | None)
+    resolver.__name__ = spec.name
+    resolver.__qualname__ = f"{qualname}.{spec.name}"
+    resolver.__doc__ = _docstring(spec, mode, mandatory)
+    resolver.__signature__ = signature
+    resolver.__annotations__ = {parameter.name: parameter.annotation for parameter in signature.parameters.values()} | {"return": signature.return_annotation}
+    return resolver
+
+
+def _cache_resolver(
+    spec: Spec,
+    mandatory: bool,
+) -> typing.Callable[..., typing.Any]:
+    cache = typing.cast(typing.Callable[..., typing.Any], spec.cache)
+    count = len(spec.parameters)
+    minimum, defaults = _defaults(spec)
+    required = spec.required
+
+    def resolver(bot: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        if kwargs or not minimum <= len(args) <= count:
+            args = _bind(spec, args, kwargs)
+        elif len(args) < count:
+            args += defaults[len(args) - minimum :]
+
+        observed = _observe(spec.name, args) if HOOKS.active and all(args[:required]) else None
 
-        @staticmethod
-        async def stage(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildStageChannel | None:
-            """Retrieve a stage channel from the cache. Return None if not found."""
-            return await _cache_stage(bot, channel)
+        try:
+            if not all(args[:required]):
+                resolved = None
+            elif not isinstance(bot, hikari.GatewayBot):
+                raise InvalidBot
+            else:
+                resolved = cache(bot, *args)
+        except Exception:
+            if observed is not None:
+                _finish(observed, "error")
 
-        @staticmethod
-        async def stages(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
-            """Retrieve stage channels from the cache. Return None if not found."""
-            return await _cache_stages(bot, guild)
+            raise
 
-        @staticmethod
-        async def text(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildTextChannel | None:
-            """Retrieve a text channel from the cache. Return None if not found."""
-            return await _cache_text(bot, channel)
+        if observed is not None:
+            _finish(observed, _observed_path("cache", observed[0], resolved))
 
-        @staticmethod
-        async def texts(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
-            """Retrieve text channels from the cache. Return None if not found."""
-            return await _cache_texts(bot, guild)
+        if mandatory and not resolved:
+            raise spec.exception
 
-        @staticmethod
-        async def thread(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildThreadChannel | None:
-            """Retrieve a thread channel from the cache. Return None if not found."""
-            return await _cache_thread(bot, channel)
+        return resolved
 
-        @staticmethod
-        async def threads(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
-            """Retrieve thread channels from the cache. Return None if not found."""
-            return await _cache_threads(bot, guild)
+    return resolver
 
-        @staticmethod
-        async def public(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
-            """Retrieve a public thread or news thread from the cache. Return None if not found."""
-            return await _cache_public(bot, channel)
 
-        @staticmethod
-        async def publics(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
-            """Retrieve public/news threads from the cache. Return None if not found."""
-            return await _cache_publics(bot, guild)
+def _fetch_resolver(
+    spec: Spec,
+    cache: typing.Callable[..., typing.Any] | None,
+    mandatory: bool,
+) -> typing.Callable[..., typing.Awaitable[typing.Any]]:
+    rest = spec.rest
+    count = len(spec.parameters)
+    minimum, defaults = _defaults(spec)
+    required = spec.required
+    mode = "rest" if cache is None else "either"
 
-        @staticmethod
-        async def private(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPrivateThread | None:
-            """Retrieve a private thread from the cache. Return None if not found."""
-            return await _cache_private(bot, channel)
+    async def resolver(bot: typing.Any, *args: typing.Any, priority: Priority | None = None, **kwargs: typing.Any) -> typing.Any:
+        if priority is not None:
+            with use_priority(priority):
+                return await resolver(bot, *args, **kwargs)
 
-        @staticmethod
-        async def privates(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
-            """Retrieve private threads from the cache. Return None if not found."""
-            return await _cache_privates(bot, guild)
+        if kwargs or not minimum <= len(args) <= count:
+            args = _bind(spec, args, kwargs)
+        elif len(args) < count:
+            args += defaults[len(args) - minimum :]
 
-        @staticmethod
-        async def forum(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildForumChannel | None:
-            """Retrieve a forum channel from the cache. Return None if not found."""
-            return await _cache_forum(bot, channel)
+        observed = _observe(spec.name, args) if HOOKS.active and all(args[:required]) else None
 
-        @staticmethod
-        async def forums(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
-            """Retrieve forum channels from the cache. Return None if not found."""
-            return await _cache_forums(bot, guild)
+        try:
+            if not all(args[:required]):
+                resolved = None
+            elif cache is None or not (isinstance(bot, hikari.GatewayBot) and (resolved := cache(bot, *args))):
+                resolved = await rest(bot, *args)
+        except Exception:
+            if observed is not None:
+                _finish(observed, "error")
 
-        @staticmethod
-        async def news(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildNewsChannel | None:
-            """Retrieve a news channel from the cache. Return None if not found."""
-            return await _cache_news(bot, channel)
+            raise
 
-        @staticmethod
-        async def newses(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
-            """Retrieve news channels from the cache. Return None if not found."""
-            return await _cache_newses(bot, guild)
+        if observed is not None:
+            _finish(observed, _observed_path(mode, observed[0], resolved))
 
-        @staticmethod
-        async def role(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            role: int | hikari.Role | None,
-        ) -> hikari.Role | None:
-            """Retrieve a role from the cache. Return None if not found."""
-            return await _cache_role(bot, guild, role)
+        if mandatory and not resolved:
+            raise spec.exception
 
-        @staticmethod
-        async def roles(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
-            """Retrieve roles belonging to a member or a guild from the cache. Return None if not found."""
-            return await _cache_roles(bot, guild, member)
+        return resolved
 
-        @staticmethod
-        async def top_role(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> hikari.Role | None:
-            """Retrieve the top role of a member or guild from the cache. Return None if not found."""
-            return await _cache_top_role(bot, guild, member)
+    return resolver
 
-        @staticmethod
-        async def booster_role(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.Role | None:
-            """Retrieve the booster role of a guild from the cache. Return None if not found."""
-            return await _cache_booster_role(bot, guild)
 
-        @staticmethod
-        async def emoji(
-            bot: hikari.GatewayBot,
-            emoji: int | str | hikari.Emoji | None,
-        ) -> hikari.Emoji | None:
-            """Retrieve an emoji from the cache. Return None if not found."""
-            return await _cache_emoji(bot, emoji)
+def _defaults(
+    spec: Spec,
+) -> tuple[int, tuple[typing.Any, ...]]:
+    minimum = sum(parameter.default is inspect.Parameter.empty for parameter in spec.parameters)
+    return minimum, tuple(parameter.default for parameter in spec.parameters[minimum:])
 
-    class Rest:
-        """Retrieve an object by fetching it from Discord. Return None if not found."""
 
-        @staticmethod
-        async def guild(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.RESTGuild | None:
-            """Retrieve a guild by fetching it from Discord. Return None if not found."""
-            return await _rest_guild(bot, guild)
+def _bind(
+    spec: Spec,
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+) -> tuple[typing.Any, ...]:
+    if len(args) > len(spec.parameters):
+        raise TypeError(f"{spec.name}() takes {len(spec.parameters) + 1} positional arguments but {len(args) + 1} were given")
 
-        @staticmethod
-        async def banned(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.GuildBan | None:
-            """Retrieve a ban by fetching it from Discord. Return None if not found."""
-            return await _rest_banned(bot, guild, user)
+    values = list(args)
 
-        @staticmethod
-        async def user(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            user: int | hikari.User | None,
-        ) -> hikari.User | None:
-            """Retrieve a user by fetching it from Discord. Return None if not found."""
-            return await _rest_user(bot, user)
+    for parameter in spec.parameters[len(args) :]:
+        if parameter.name in kwargs:
+            values.append(kwargs.pop(parameter.name))
+        elif parameter.default is not inspect.Parameter.empty:
+            values.append(parameter.default)
+        else:
+            raise TypeError(f"{spec.name}() missing required argument: '{parameter.name}'")
+
+    if kwargs:
+        name = next(iter(kwargs))
+        raise TypeError(f"{spec.name}() got multiple values for argument '{name}'" if any(parameter.name == name for parameter in spec.parameters) else f"{spec.name}() got an unexpected keyword argument '{name}'")
+
+    return tuple(values)
+
+
+def _observe(
+    kind: str,
+    key: tuple[typing.Any, ...],
+) -> tuple[HookCall, contextvars.Token[HookCall | None]]:
+    call = HOOKS.start(kind, key)
+    return call, _CALL.set(call)
+
+
+def _finish(
+    observed: tuple[HookCall, contextvars.Token[HookCall | None]],
+    path: str,
+) -> None:
+    call, token = observed
+    _CALL.reset(token)
+    HOOKS.end(call, path)
+
+
+def _observed_path(
+    mode: str,
+    call: HookCall,
+    resolved: typing.Any,
+) -> str:
+    if call.path == "resolver_cache":
+        return "resolver_cache_hit"
+    elif call.path == "local":
+        return "local"
+    elif mode == "cache" or (mode == "either" and resolved and call.path is None):
+        return "cache_hit" if resolved else "cache_miss"
+    else:
+        return "rest_hit" if resolved else "rest_404"
 
-        @staticmethod
-        async def member(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.Member | None:
-            """Retrieve a member by fetching it from Discord. Return None if not found."""
-            return await _rest_member(bot, guild, user)
 
-        @staticmethod
-        async def members(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-            """Retrieve members by fetching them from Discord. Return None if not found."""
-            return await _rest_members(bot, guild)
+def _mark(
+    path: str,
+) -> None:
+    if (call := _CALL.get()) is not None and call.path != "fetch":
+        call.path = path
 
-        @staticmethod
-        async def boosters(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-            """Retrieve boosters by fetching them from Discord. Return None if not found."""
-            return await _rest_boosters(bot, guild)
 
-        @staticmethod
-        async def channel(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildChannel | None:
-            """Retrieve a channel by fetching it from Discord. Return None if not found."""
-            return await _rest_channel(bot, channel)
+def _bind_request(
+    request: tuple[typing.Any, ...],
+) -> tuple[Spec, tuple[typing.Any, ...]]:
+    if not request or (spec := SPECS.get(request[0])) is None:
+        raise ValueError(f"Unknown kind in request {request!r}")
 
-        @staticmethod
-        async def channels(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
-            """Retrieve channels by fetching them from Discord. Return None if not found."""
-            return await _rest_channels(bot, guild)
+    args = request[1:]
+    minimum = sum(parameter.default is inspect.Parameter.empty for parameter in spec.parameters)
 
-        @staticmethod
-        async def dms(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.PrivateChannel | None,
-        ) -> hikari.PrivateChannel | None:
-            """Retrieve a private channel by fetching it from Discord. Return None if not found."""
-            return await _rest_dms(bot, channel)
+    if not minimum <= len(args) <= len(spec.parameters):
+        expected = f"{minimum} to {len(spec.parameters)}" if minimum != len(spec.parameters) else f"{minimum}"
+        raise TypeError(f"{spec.name} takes {expected} arguments but {len(args)} were given")
 
-        @staticmethod
-        async def dm(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.DMChannel | None,
-        ) -> hikari.DMChannel | None:
-            """Retrieve a DM channel by fetching it from Discord. Return None if not found."""
-            return await _rest_dm(bot, channel)
+    return spec, (*args, *(parameter.default for parameter in spec.parameters[len(args) :]))
 
-        @staticmethod
-        async def group(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GroupDMChannel | None,
-        ) -> hikari.GroupDMChannel | None:
-            """Retrieve a group DM channel by fetching it from Discord. Return None if not found."""
-            return await _rest_group(bot, channel)
 
-        @staticmethod
-        async def textable(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.TextableGuildChannel | None:
-            """Retrieve a textable channel by fetching it from Discord. Return None if not found."""
-            return await _rest_textable(bot, channel)
+def _docstring(
+    spec: Spec,
+    mode: str,
+    mandatory: bool,
+) -> str:
+    pronoun = "them" if typing.get_origin(spec.returns) is collections.abc.Mapping else "it"
+    outcome = "Raise an exception" if mandatory else "Return None"
 
-        @staticmethod
-        async def textables(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
-            """Retrieve textable channels by fetching them from Discord. Return None if not found."""
-            return await _rest_textables(bot, guild)
+    if mode == "cache":
+        return f"Retrieve {spec.noun} from the cache. {outcome} if not found."
+    elif mode == "rest" or spec.cache is None:
+        return f"Retrieve {spec.noun} by fetching {pronoun} from Discord. {outcome} if not found."
+    else:
+        return f"Retrieve {spec.noun} from the cache. If not found, fetch {pronoun} from Discord. {outcome} if still not found."
 
-        @staticmethod
-        async def permissible(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.PermissibleGuildChannel | None:
-            """Retrieve a permissible channel by fetching it from Discord. Return None if not found."""
-            return await _rest_permissible(bot, channel)
 
-        @staticmethod
-        async def permissibles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
-            """Retrieve permissible channels by fetching them from Discord. Return None if not found."""
-            return await _rest_permissibles(bot, guild)
+def _parameter(
+    name: str,
+    annotation: typing.Any,
+    default: typing.Any = inspect.Parameter.empty,
+) -> inspect.Parameter:
+    return inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation, default=default)
 
-        @staticmethod
-        async def category(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildCategory | None:
-            """Retrieve a category channel by fetching it from Discord. Return None if not found."""
-            return await _rest_category(bot, channel)
 
-        @staticmethod
-        async def categories(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
-            """Retrieve category channels by fetching them from Discord. Return None if not found."""
-            return await _rest_categories(bot, guild)
+async def _fetch(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    kind: str,
+    key: typing.Hashable,
+    fetcher: typing.Callable[[], typing.Awaitable[T]],
+) -> T | None:
+    cache = get_cache(bot)
 
-        @staticmethod
-        async def voice(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildVoiceChannel | None:
-            """Retrieve a voice channel by fetching it from Discord. Return None if not found."""
-            return await _rest_voice(bot, channel)
+    if cache is not None:
+        if (cached := cache.get(kind, key)) is not None:
+            if cache.is_stale(kind, key):
+                _IN_FLIGHT.start((bot, kind, key), lambda: _fetch_and_store(bot, kind, key, fetcher))
 
-        @staticmethod
-        async def voices(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
-            """Retrieve voice channels by fetching them from Discord. Return None if not found."""
-            return await _rest_voices(bot, guild)
+            if HOOKS.active:
+                _mark("resolver_cache")
 
-        @staticmethod
-        async def stage(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildStageChannel | None:
-            """Retrieve a stage channel by fetching it from Discord. Return None if not found."""
-            return await _rest_stage(bot, channel)
+            return cached
 
-        @staticmethod
-        async def stages(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
-            """Retrieve stage channels by fetching them from Discord. Return None if not found."""
-            return await _rest_stages(bot, guild)
+        if cache.is_missing(kind, key):
+            if HOOKS.active:
+                _mark("resolver_cache")
 
-        @staticmethod
-        async def text(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildTextChannel | None:
-            """Retrieve a text channel by fetching it from Discord. Return None if not found."""
-            return await _rest_text(bot, channel)
+            return None
 
-        @staticmethod
-        async def texts(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
-            """Retrieve text channels by fetching them from Discord. Return None if not found."""
-            return await _rest_texts(bot, guild)
+    if HOOKS.active:
+        _mark("fetch")
 
-        @staticmethod
-        async def thread(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildThreadChannel | None:
-            """Retrieve a thread channel by fetching it from Discord. Return None if not found."""
-            return await _rest_thread(bot, channel)
+    if (bot, kind, key) in _IN_FLIGHT and (scheduler := get_scheduler(bot)) is not None:
+        scheduler.promote((kind, key), current_priority())
 
-        @staticmethod
-        async def threads(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
-            """Retrieve thread channels by fetching them from Discord. Return None if not found."""
-            return await _rest_threads(bot, guild)
+    try:
+        return await _IN_FLIGHT.do((bot, kind, key), lambda: _fetch_and_store(bot, kind, key, fetcher))
+    except hikari.NotFoundError:
+        return None
 
-        @staticmethod
-        async def public(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
-            """Retrieve a public thread or news thread by fetching it from Discord. Return None if not found."""
-            return await _rest_public(bot, channel)
 
-        @staticmethod
-        async def publics(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
-            """Retrieve public/news threads by fetching them from Discord. Return None if not found."""
-            return await _rest_publics(bot, guild)
-
-        @staticmethod
-        async def private(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPrivateThread | None:
-            """Retrieve a private thread by fetching it from Discord. Return None if not found."""
-            return await _rest_private(bot, channel)
-
-        @staticmethod
-        async def privates(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
-            """Retrieve private threads by fetching them from Discord. Return None if not found."""
-            return await _rest_privates(bot, guild)
-
-        @staticmethod
-        async def forum(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildForumChannel | None:
-            """Retrieve a forum channel by fetching it from Discord. Return None if not found."""
-            return await _rest_forum(bot, channel)
-
-        @staticmethod
-        async def forums(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
-            """Retrieve forum channels by fetching them from Discord. Return None if not found."""
-            return await _rest_forums(bot, guild)
-
-        @staticmethod
-        async def news(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildNewsChannel | None:
-            """Retrieve a news channel by fetching it from Discord. Return None if not found."""
-            return await _rest_news(bot, channel)
-
-        @staticmethod
-        async def newses(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
-            """Retrieve news channels by fetching them from Discord. Return None if not found."""
-            return await _rest_newses(bot, guild)
-
-        @staticmethod
-        async def role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            role: int | hikari.Role | None,
-        ) -> hikari.Role | None:
-            """Retrieve a role by fetching it from Discord. Return None if not found."""
-            return await _rest_role(bot, guild, role)
-
-        @staticmethod
-        async def roles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
-            """Retrieve roles belonging to a member or a guild by fetching them from Discord. Return None if not found."""
-            return await _rest_roles(bot, guild, member)
-
-        @staticmethod
-        async def top_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> hikari.Role | None:
-            """Retrieve the top role of a member or guild by fetching it from Discord. Return None if not found."""
-            return await _rest_top_role(bot, guild, member)
-
-        @staticmethod
-        async def booster_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.Role | None:
-            """Retrieve the booster role of a guild by fetching it from Discord. Return None if not found."""
-            return await _rest_booster_role(bot, guild)
-
-        @staticmethod
-        async def emoji(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            emoji: int | str | hikari.Emoji | None,
-            guild: int | hikari.Guild | None = None,
-        ) -> hikari.Emoji | None:
-            """Retrieve an emoji by fetching it from Discord. Return None if not found."""
-            return await _rest_emoji(bot, emoji, guild)
-
-
-class Mandatory:
-    class Either:
-        """Retrieve an object from the cache or fetch it from Discord if not found. Raise an exception if still not found."""
-
-        @staticmethod
-        async def guild(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.GatewayGuild | hikari.RESTGuild:
-            """Retrieve a guild from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
-            if not (resolved_guild := await _either_guild(bot, guild)):
-                raise MandatoryGuildNotFound
-
-            return resolved_guild
-
-        @staticmethod
-        async def banned(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.GuildBan:
-            """Retrieve a ban by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_ban := await _rest_banned(bot, guild, user)):
-                raise MandatoryBanNotFound
-
-            return resolved_ban
-
-        @staticmethod
-        async def user(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            user: int | hikari.User | None,
-        ) -> hikari.User:
-            """Retrieve a user from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
-            if not (resolved_user := await _either_user(bot, user)):
-                raise MandatoryUserNotFound
-
-            return resolved_user
-
-        @staticmethod
-        async def member(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.Member:
-            """Retrieve a member from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
-            if not (resolved_member := await _either_member(bot, guild, user)):
-                raise MandatoryMemberNotFound
-
-            return resolved_member
-
-        @staticmethod
-        async def members(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
-            """Retrieve members from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
-            if not (resolved_members := await _either_members(bot, guild)):
-                raise MandatoryMemberNotFound
-
-            return resolved_members
-
-        @staticmethod
-        async def boosters(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
-            """Retrieve boosters from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
-            if not (resolved_members := await _either_boosters(bot, guild)):
-                raise MandatoryMemberNotFound
-
-            return resolved_members
-
-        @staticmethod
-        async def channel(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildChannel:
-            """Retrieve a channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
-            if not (resolved_channel := await _either_channel(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def channels(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel]:
-            """Retrieve channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
-            if not (resolved_channels := await _either_channels(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def dms(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.PrivateChannel | None,
-        ) -> hikari.PrivateChannel:
-            """Retrieve a private channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
-            if not (resolved_channel := await _rest_dms(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def dm(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.DMChannel | None,
-        ) -> hikari.DMChannel:
-            """Retrieve a DM channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
-            if not (resolved_channel := await _rest_dm(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def group(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GroupDMChannel | None,
-        ) -> hikari.GroupDMChannel:
-            """Retrieve a group DM channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
-            if not (resolved_channel := await _rest_group(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def textable(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.TextableGuildChannel:
-            """Retrieve a textable channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_textable(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def textables(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel]:
-            """Retrieve textable channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_textables(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def permissible(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.PermissibleGuildChannel:
-            """Retrieve a permissible channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_permissible(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def permissibles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel]:
-            """Retrieve permissible channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_permissibles(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def category(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildCategory:
-            """Retrieve a category channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_category(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def categories(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory]:
-            """Retrieve category channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_categories(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def voice(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildVoiceChannel:
-            """Retrieve a voice channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_voice(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def voices(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel]:
-            """Retrieve voice channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_voices(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def stage(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildStageChannel:
-            """Retrieve a stage channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_stage(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def stages(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel]:
-            """Retrieve stage channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_stages(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def text(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildTextChannel:
-            """Retrieve a text channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_text(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def texts(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel]:
-            """Retrieve text channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_texts(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def thread(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildThreadChannel:
-            """Retrieve a thread channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_thread(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def threads(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel]:
-            """Retrieve thread channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_threads(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def public(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPublicThread | hikari.GuildNewsThread:
-            """Retrieve a public thread or news thread from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_public(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def publics(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread]:
-            """Retrieve public/news threads from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_publics(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def private(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPrivateThread:
-            """Retrieve a private thread from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_private(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def privates(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread]:
-            """Retrieve private threads from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_privates(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def forum(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildForumChannel:
-            """Retrieve a forum channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_forum(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def forums(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel]:
-            """Retrieve forum channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_forums(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def news(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildNewsChannel:
-            """Retrieve a news channel from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _either_news(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def newses(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel]:
-            """Retrieve news channels from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _either_newses(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            role: int | hikari.Role | None,
-        ) -> hikari.Role:
-            """Retrieve a role from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_role := await _either_role(bot, guild, role)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def roles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
-            """Retrieve roles belonging to a member or a guild from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_roles := await _either_roles(bot, guild, member)):
-                raise MandatoryRoleNotFound
-
-            return resolved_roles
-
-        @staticmethod
-        async def top_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> hikari.Role:
-            """Retrieve the top role of a member or guild from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_role := await _either_top_role(bot, guild, member)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def booster_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.Role:
-            """Retrieve the booster role of a guild from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_role := await _either_booster_role(bot, guild)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def emoji(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            emoji: int | str | hikari.Emoji | None,
-            guild: int | hikari.Guild | None = None,
-        ) -> hikari.Emoji:
-            """Retrieve an emoji from the cache or fetch from Discord. Raise an exception if not found."""
-            if not (resolved_emoji := await _either_emoji(bot, emoji, guild)):
-                raise MandatoryEmojiNotFound
-
-            return resolved_emoji
-
-    class Cache:
-        """Retrieve an object from the cache. Raise an exception if not found."""
-
-        @staticmethod
-        async def guild(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.GatewayGuild:
-            """Retrieve a guild from the cache. Raise an exception if not found."""
-            if not (resolved_guild := await _cache_guild(bot, guild)):
-                raise MandatoryGuildNotFound
-
-            return resolved_guild
-
-        @staticmethod
-        async def user(
-            bot: hikari.GatewayBot,
-            user: int | hikari.User | None,
-        ) -> hikari.User:
-            """Retrieve a user from the cache. Raise an exception if not found."""
-            if not (resolved_user := await _cache_user(bot, user)):
-                raise MandatoryUserNotFound
-
-            return resolved_user
-
-        @staticmethod
-        async def member(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.Member:
-            """Retrieve a member from the cache. Raise an exception if not found."""
-            if not (resolved_member := await _cache_member(bot, guild, user)):
-                raise MandatoryMemberNotFound
-
-            return resolved_member
-
-        @staticmethod
-        async def members(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
-            """Retrieve members from the cache. Raise an exception if not found."""
-            if not (resolved_members := await _cache_members(bot, guild)):
-                raise MandatoryMemberNotFound
-
-            return resolved_members
-
-        @staticmethod
-        async def boosters(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
-            """Retrieve boosters from the cache. Raise an exception if not found."""
-            if not (resolved_members := await _cache_boosters(bot, guild)):
-                raise MandatoryMemberNotFound
-
-            return resolved_members
-
-        @staticmethod
-        async def channel(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildChannel:
-            """Retrieve a channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_channel(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def channels(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel]:
-            """Retrieve channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_channels(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def textable(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.TextableGuildChannel:
-            """Retrieve a textable channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_textable(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def textables(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel]:
-            """Retrieve textable channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_textables(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def permissible(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.PermissibleGuildChannel:
-            """Retrieve a permissible channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_permissible(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def permissibles(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel]:
-            """Retrieve permissible channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_permissibles(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def category(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildCategory:
-            """Retrieve a category channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_category(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def categories(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory]:
-            """Retrieve category channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_categories(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def voice(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildVoiceChannel:
-            """Retrieve a voice channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_voice(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def voices(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel]:
-            """Retrieve voice channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_voices(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def stage(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildStageChannel:
-            """Retrieve a stage channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_stage(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def stages(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel]:
-            """Retrieve stage channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_stages(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def text(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildTextChannel:
-            """Retrieve a text channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_text(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def texts(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel]:
-            """Retrieve text channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_texts(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def thread(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildThreadChannel:
-            """Retrieve a thread channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_thread(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def threads(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel]:
-            """Retrieve thread channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_threads(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def public(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPublicThread | hikari.GuildNewsThread:
-            """Retrieve a public thread or news thread from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_public(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def publics(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread]:
-            """Retrieve public/news threads from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_publics(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def private(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPrivateThread:
-            """Retrieve a private thread from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_private(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def privates(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread]:
-            """Retrieve private threads from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_privates(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def forum(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildForumChannel:
-            """Retrieve a forum channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_forum(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def forums(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel]:
-            """Retrieve forum channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_forums(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def news(
-            bot: hikari.GatewayBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildNewsChannel:
-            """Retrieve a news channel from the cache. Raise an exception if not found."""
-            if not (resolved_channel := await _cache_news(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def newses(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel]:
-            """Retrieve news channels from the cache. Raise an exception if not found."""
-            if not (resolved_channels := await _cache_newses(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def role(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            role: int | hikari.Role | None,
-        ) -> hikari.Role:
-            """Retrieve a role from the cache. Raise an exception if not found."""
-            if not (resolved_role := await _cache_role(bot, guild, role)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def roles(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
-            """Retrieve roles belonging to a member or a guild from the cache. Raise an exception if not found."""
-            if not (resolved_roles := await _cache_roles(bot, guild, member)):
-                raise MandatoryRoleNotFound
-
-            return resolved_roles
-
-        @staticmethod
-        async def top_role(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> hikari.Role:
-            """Retrieve the top role of a member or guild from the cache. Raise an exception if not found."""
-            if not (resolved_role := await _cache_top_role(bot, guild, member)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def booster_role(
-            bot: hikari.GatewayBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.Role:
-            """Retrieve the booster role of a guild from the cache. Raise an exception if not found."""
-            if not (resolved_role := await _cache_booster_role(bot, guild)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def emoji(
-            bot: hikari.GatewayBot,
-            emoji: int | str | hikari.Emoji | None,
-        ) -> hikari.Emoji:
-            """Retrieve an emoji from the cache. Raise an exception if not found."""
-            if not (resolved_emoji := await _cache_emoji(bot, emoji)):
-                raise MandatoryEmojiNotFound
-
-            return resolved_emoji
-
-    class Rest:
-        """Retrieve an object by fetching it from Discord. Raise an exception if not found."""
-
-        @staticmethod
-        async def guild(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.RESTGuild:
-            """Retrieve a guild by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_guild := await _rest_guild(bot, guild)):
-                raise MandatoryGuildNotFound
-
-            return resolved_guild
-
-        @staticmethod
-        async def banned(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.GuildBan:
-            """Retrieve a ban by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_ban := await _rest_banned(bot, guild, user)):
-                raise MandatoryBanNotFound
-
-            return resolved_ban
-
-        @staticmethod
-        async def user(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            user: int | hikari.User | None,
-        ) -> hikari.User:
-            """Retrieve a user by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_user := await _rest_user(bot, user)):
-                raise MandatoryUserNotFound
-
-            return resolved_user
-
-        @staticmethod
-        async def member(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            user: int | hikari.User | None,
-        ) -> hikari.Member:
-            """Retrieve a member by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_member := await _rest_member(bot, guild, user)):
-                raise MandatoryMemberNotFound
-
-            return resolved_member
-
-        @staticmethod
-        async def members(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
-            """Retrieve members by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_members := await _rest_members(bot, guild)):
-                raise MandatoryMemberNotFound
-
-            return resolved_members
-
-        @staticmethod
-        async def boosters(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
-            """Retrieve boosters by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_members := await _rest_boosters(bot, guild)):
-                raise MandatoryMemberNotFound
-
-            return resolved_members
-
-        @staticmethod
-        async def channel(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildChannel:
-            """Retrieve a channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_channel(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def channels(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel]:
-            """Retrieve channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_channels(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def dms(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.PrivateChannel | None,
-        ) -> hikari.PrivateChannel:
-            """Retrieve a private channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_dms(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def dm(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.DMChannel | None,
-        ) -> hikari.DMChannel:
-            """Retrieve a DM channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_dm(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def group(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GroupDMChannel | None,
-        ) -> hikari.GroupDMChannel:
-            """Retrieve a group DM channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_group(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def textable(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.TextableGuildChannel:
-            """Retrieve a textable channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_textable(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def textables(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel]:
-            """Retrieve textable channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_textables(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def permissible(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.PermissibleGuildChannel:
-            """Retrieve a permissible channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_permissible(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def permissibles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel]:
-            """Retrieve permissible channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_permissibles(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def category(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildCategory:
-            """Retrieve a category channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_category(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def categories(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory]:
-            """Retrieve category channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_categories(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def voice(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildVoiceChannel:
-            """Retrieve a voice channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_voice(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def voices(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel]:
-            """Retrieve voice channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_voices(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def stage(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildStageChannel:
-            """Retrieve a stage channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_stage(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def stages(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel]:
-            """Retrieve stage channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_stages(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def text(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildTextChannel:
-            """Retrieve a text channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_text(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def texts(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel]:
-            """Retrieve text channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_texts(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def thread(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildThreadChannel:
-            """Retrieve a thread channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_thread(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def threads(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel]:
-            """Retrieve thread channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_threads(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def public(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPublicThread | hikari.GuildNewsThread:
-            """Retrieve a public thread or news thread by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_public(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def publics(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread]:
-            """Retrieve public/news threads by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_publics(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def private(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildPrivateThread:
-            """Retrieve a private thread by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_private(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def privates(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread]:
-            """Retrieve private threads by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_privates(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def forum(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildForumChannel:
-            """Retrieve a forum channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_forum(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def forums(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel]:
-            """Retrieve forum channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_forums(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def news(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            channel: int | hikari.GuildChannel | None,
-        ) -> hikari.GuildNewsChannel:
-            """Retrieve a news channel by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_channel := await _rest_news(bot, channel)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channel
-
-        @staticmethod
-        async def newses(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel]:
-            """Retrieve news channels by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_channels := await _rest_newses(bot, guild)):
-                raise MandatoryChannelNotFound
-
-            return resolved_channels
-
-        @staticmethod
-        async def role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            role: int | hikari.Role | None,
-        ) -> hikari.Role:
-            """Retrieve a role by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_role := await _rest_role(bot, guild, role)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def roles(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
-            """Retrieve roles belonging to a member or a guild by fetching them from Discord. Raise an exception if not found."""
-            if not (resolved_roles := await _rest_roles(bot, guild, member)):
-                raise MandatoryRoleNotFound
-
-            return resolved_roles
-
-        @staticmethod
-        async def top_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-            member: int | hikari.Member | None,
-        ) -> hikari.Role:
-            """Retrieve the top role of a member or guild by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_role := await _rest_top_role(bot, guild, member)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def booster_role(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            guild: int | hikari.Guild | None,
-        ) -> hikari.Role:
-            """Retrieve the booster role of a guild by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_role := await _rest_booster_role(bot, guild)):
-                raise MandatoryRoleNotFound
-
-            return resolved_role
-
-        @staticmethod
-        async def emoji(
-            bot: hikari.GatewayBot | hikari.RESTBot,
-            emoji: int | str | hikari.Emoji | None,
-            guild: int | hikari.Guild | None = None,
-        ) -> hikari.Emoji:
-            """Retrieve an emoji by fetching it from Discord. Raise an exception if not found."""
-            if not (resolved_emoji := await _rest_emoji(bot, emoji, guild)):
-                raise MandatoryEmojiNotFound
-
-            return resolved_emoji
-
-
-async def _either_guild(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> hikari.GatewayGuild | hikari.RESTGuild | None:
-    if not guild:
-        return None
-
-    return (await _cache_guild(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_guild(bot, guild))
-
-
-async def _cache_guild(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> hikari.GatewayGuild | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    return bot.cache.get_guild(guild)
-
-
-async def _rest_guild(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> hikari.RESTGuild | None:
-    if not guild:
-        return None
-
-    try:
-        return await bot.rest.fetch_guild(guild)
-    except hikari.NotFoundError:
-        return None
-
-
-async def _rest_banned(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-    user: int | hikari.User | None,
-) -> hikari.GuildBan | None:
-    if not guild or not user:
-        return None
-
-    try:
-        return await bot.rest.fetch_ban(guild, user)
-    except hikari.NotFoundError:
-        return None
-
-
-async def _either_user(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    user: int | hikari.User | None,
-) -> hikari.User | None:
-    if not user:
-        return None
-
-    return (await _cache_user(bot, user) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_user(bot, user))
-
-
-async def _cache_user(
-    bot: hikari.GatewayBot,
-    user: int | hikari.User | None,
-) -> hikari.User | None:
-    if not user:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    return bot.cache.get_user(user)
-
-
-async def _rest_user(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    user: int | hikari.User | None,
-) -> hikari.User | None:
-    if not user:
-        return None
-
-    try:
-        return await bot.rest.fetch_user(user)
-    except hikari.NotFoundError:
-        return None
-
-
-async def _either_member(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-    user: int | hikari.User | None,
-) -> hikari.Member | None:
-    if not guild or not user:
-        return None
-
-    return (await _cache_member(bot, guild, user) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_member(bot, guild, user))
-
-
-async def _cache_member(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-    user: int | hikari.User | None,
-) -> hikari.Member | None:
-    if not guild or not user:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    return bot.cache.get_member(guild, user)
-
-
-async def _rest_member(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-    user: int | hikari.User | None,
-) -> hikari.Member | None:
-    if not guild or not user:
-        return None
-
-    try:
-        return await bot.rest.fetch_member(guild, user)
-    except hikari.NotFoundError:
-        return None
-
-
-async def _either_members(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-    if not guild:
-        return None
-
-    return (await _cache_members(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_members(bot, guild))
-
-
-async def _cache_members(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    return bot.cache.get_members_view_for_guild(guild if isinstance(guild, int) else guild.id)
-
-
-async def _rest_members(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-    if not guild:
-        return None
-
-    try:
-        return {member.id: member async for member in bot.rest.fetch_members(guild)}
-    except hikari.NotFoundError:
-        return None
-
-
-async def _either_boosters(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-    if not guild:
-        return None
-
-    return (await _cache_boosters(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_boosters(bot, guild))
-
-
-async def _cache_boosters(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_members = await _cache_members(bot, guild)
-    return {member.id: member for member in resolved_members.values() if member.premium_since} if resolved_members else None
-
-
-async def _rest_boosters(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
-    if not guild:
-        return None
-
-    resolved_members = await _rest_members(bot, guild)
-    return {member.id: member for member in resolved_members.values() if member.premium_since} if resolved_members else None
-
-
-async def _either_channel(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildChannel | None:
-    if not channel:
-        return None
-
-    return (await _cache_channel(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_channel(bot, channel))
-
-
-async def _cache_channel(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildChannel | None:
-    if not channel:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channel = bot.cache.get_guild_channel(channel)
-    return resolved_channel
-
-
-async def _rest_channel(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildChannel | None:
-    if not channel:
-        return None
-
-    try:
-        resolved_channel = await bot.rest.fetch_channel(channel)
-
-        if not isinstance(resolved_channel, hikari.GuildChannel):
-            resolved_channel = None
-    except hikari.NotFoundError:
-        resolved_channel = None
-
-    return resolved_channel
-
-
-async def _either_channels(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
-    if not guild:
-        return None
-
-    return (await _cache_channels(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_channels(bot, guild))
-
-
-async def _cache_channels(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    return bot.cache.get_guild_channels_view_for_guild(guild)
-
-
-async def _rest_channels(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
-    if not guild:
-        return None
-
-    try:
-        return {channel.id: channel for channel in await bot.rest.fetch_guild_channels(guild)}
-    except hikari.NotFoundError:
-        return None
-
-
-async def _rest_dms(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.PrivateChannel | None,
-) -> hikari.PrivateChannel | None:
-    if not channel:
-        return None
-
-    try:
-        resolved_channel = await bot.rest.fetch_channel(channel)
-
-        if not isinstance(resolved_channel, hikari.PrivateChannel):
-            resolved_channel = None
-    except hikari.NotFoundError:
-        resolved_channel = None
-
-    return resolved_channel
-
-
-async def _rest_dm(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.DMChannel | None,
-) -> hikari.DMChannel | None:
-    if not channel:
-        return None
-
-    resolved_dm = await _rest_dms(bot, channel)
-    return resolved_dm if isinstance(resolved_dm, hikari.DMChannel) else None
-
-
-async def _rest_group(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GroupDMChannel | None,
-) -> hikari.GroupDMChannel | None:
-    if not channel:
-        return None
-
-    resolved_group = await _rest_dms(bot, channel)
-    return resolved_group if isinstance(resolved_group, hikari.GroupDMChannel) else None
-
-
-async def _either_textable(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.TextableGuildChannel | None:
-    if not channel:
-        return None
-
-    return (await _cache_textable(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_textable(bot, channel))
-
-
-async def _cache_textable(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.TextableGuildChannel | None:
-    if not channel:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.TextableGuildChannel) else None
-
-
-async def _rest_textable(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.TextableGuildChannel | None:
-    if not channel:
-        return None
-
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.TextableGuildChannel) else None
-
-
-async def _either_textables(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
-    if not guild:
-        return None
-
-    return (await _cache_textables(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_textables(bot, guild))
-
-
-async def _cache_textables(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.TextableGuildChannel)} if resolved_channels else None
-
-
-async def _rest_textables(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
-    if not guild:
-        return None
-
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.TextableGuildChannel)} if resolved_channels else None
-
-
-async def _either_permissible(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.PermissibleGuildChannel | None:
-    if not channel:
-        return None
-
-    return (await _cache_permissible(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_permissible(bot, channel))
-
-
-async def _cache_permissible(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.PermissibleGuildChannel | None:
-    if not channel:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.PermissibleGuildChannel) else None
-
-
-async def _rest_permissible(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.PermissibleGuildChannel | None:
-    if not channel:
-        return None
-
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.PermissibleGuildChannel) else None
-
-
-async def _either_permissibles(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
-    if not guild:
-        return None
-
-    return (await _cache_permissibles(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_permissibles(bot, guild))
-
-
-async def _cache_permissibles(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.PermissibleGuildChannel)} if resolved_channels else None
-
-
-async def _rest_permissibles(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
-    if not guild:
-        return None
-
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.PermissibleGuildChannel)} if resolved_channels else None
-
-
-async def _either_category(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildCategory | None:
-    if not channel:
-        return None
-
-    return (await _cache_category(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_category(bot, channel))
-
-
-async def _cache_category(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildCategory | None:
-    if not channel:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildCategory) else None
-
-
-async def _rest_category(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildCategory | None:
-    if not channel:
-        return None
-
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildCategory) else None
-
-
-async def _either_categories(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
-    if not guild:
-        return None
-
-    return (await _cache_categories(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_categories(bot, guild))
-
-
-async def _cache_categories(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildCategory)} if resolved_channels else None
-
-
-async def _rest_categories(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
-    if not guild:
-        return None
-
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildCategory)} if resolved_channels else None
-
-
-async def _either_voice(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildVoiceChannel | None:
-    if not channel:
-        return None
-
-    return (await _cache_voice(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_voice(bot, channel))
-
-
-async def _cache_voice(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildVoiceChannel | None:
-    if not channel:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildVoiceChannel) else None
-
-
-async def _rest_voice(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildVoiceChannel | None:
-    if not channel:
-        return None
-
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildVoiceChannel) else None
-
-
-async def _either_voices(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
-    if not guild:
-        return None
-
-    return (await _cache_voices(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_voices(bot, guild))
-
-
-async def _cache_voices(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildVoiceChannel)} if resolved_channels else None
-
-
-async def _rest_voices(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
-    if not guild:
-        return None
-
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildVoiceChannel)} if resolved_channels else None
-
-
-async def _either_stage(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildStageChannel | None:
-    if not channel:
-        return None
-
-    return (await _cache_stage(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_stage(bot, channel))
-
-
-async def _cache_stage(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildStageChannel | None:
-    if not channel:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildStageChannel) else None
-
-
-async def _rest_stage(
+async def _fetch_and_store(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildStageChannel | None:
-    if not channel:
-        return None
-
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildStageChannel) else None
-
-
-async def _either_stages(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
-    if not guild:
-        return None
-
-    return (await _cache_stages(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_stages(bot, guild))
-
-
-async def _cache_stages(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+    kind: str,
+    key: typing.Hashable,
+    fetcher: typing.Callable[[], typing.Awaitable[T]],
+) -> T:
+    cache = get_cache(bot)
 
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildStageChannel)} if resolved_channels else None
+    try:
+        resolved = await (scheduler.run(kind, fetcher, key=(kind, key)) if (scheduler := get_scheduler(bot)) is not None else fetcher())
+    except hikari.NotFoundError:
+        if cache is not None:
+            cache.set_missing(kind, key)
 
+        raise
 
-async def _rest_stages(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
-    if not guild:
-        return None
+    if cache is not None:
+        cache.set(kind, key, resolved)
 
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildStageChannel)} if resolved_channels else None
+    return resolved
 
 
-async def _either_text(
+async def _iter_pages(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildTextChannel | None:
-    if not channel:
-        return None
-
-    return (await _cache_text(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_text(bot, channel))
+    route: str,
+    iterator: hikari.LazyIterator[T],
+    predicate: typing.Callable[[T], bool] | None = None,
+    priority: Priority | None = None,
+) -> typing.AsyncIterator[T]:
+    if (scheduler := get_scheduler(bot)) is None:
+        async for item in iterator.filter(predicate) if predicate else iterator:
+            yield item
 
+        return
 
-async def _cache_text(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildTextChannel | None:
-    if not channel:
-        return None
+    pages = iterator.chunk(_PAGE_SIZE)
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+    async def next_page() -> typing.Sequence[T]:
+        try:
+            return await pages.__anext__()
+        except StopAsyncIteration:
+            return ()
 
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildTextChannel) else None
+    while page := await scheduler.run(route, next_page, priority):
+        for item in page:
+            if predicate is None or predicate(item):
+                yield item
 
 
-async def _rest_text(
+async def _resolve_many(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildTextChannel | None:
-    if not channel:
-        return None
+    requests: typing.Iterable[typing.Sequence[typing.Any]],
+    concurrency: int,
+) -> list[typing.Any]:
+    request_keys = [tuple(request) for request in requests]
+    resolved: dict[tuple[typing.Any, ...], typing.Any] = {}
+    unresolved: dict[tuple[typing.Any, ...], tuple[Spec, tuple[typing.Any, ...]]] = {}
 
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildTextChannel) else None
+    for request_key in request_keys:
+        if request_key in resolved or request_key in unresolved:
+            continue
 
+        try:
+            spec, args = _bind_request(request_key)
 
-async def _either_texts(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
-    if not guild:
-        return None
-
-    return (await _cache_texts(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_texts(bot, guild))
+            if not all(args[: spec.required]):
+                resolved[request_key] = None
+            elif spec.cache is not None and isinstance(bot, hikari.GatewayBot) and (cached := spec.cache(bot, *args)):
+                resolved[request_key] = cached
+            else:
+                unresolved[request_key] = (spec, args)
+        except Exception as error:
+            resolved[request_key] = error
 
+    if unresolved:
+        semaphore = asyncio.Semaphore(concurrency)
 
-async def _cache_texts(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
-    if not guild:
-        return None
+        async def fetch(spec: Spec, args: tuple[typing.Any, ...]) -> typing.Any:
+            async with semaphore:
+                return await spec.rest(bot, *args)
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+        resolved.update(zip(unresolved, await asyncio.gather(*(fetch(spec, args) for spec, args in unresolved.values()), return_exceptions=True)))
 
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildTextChannel)} if resolved_channels else None
+    return [resolved[request_key] for request_key in request_keys]
 
 
-async def _rest_texts(
+async def _resolve_emojis(
     bot: hikari.GatewayBot | hikari.RESTBot,
     guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
-    if not guild:
-        return None
+    emojis: typing.Iterable[int | str | hikari.Emoji],
+) -> list[hikari.Emoji | None]:
+    references = [parsed if isinstance(emoji, str) and not isinstance(emoji, hikari.Emoji) and (parsed := _parse_emoji(emoji)) is not None else emoji for emoji in emojis]
+    snapshot: EmojiSnapshot | None = None
 
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildTextChannel)} if resolved_channels else None
+    if guild and not all(isinstance(emoji, hikari.UnicodeEmoji) for emoji in references):
+        if isinstance(bot, hikari.GatewayBot):
+            snapshot = _cache_emoji_snapshot(bot, guild)
 
+        if snapshot is None:
+            snapshot = await _rest_emoji_snapshot(bot, guild)
 
-async def _either_thread(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildThreadChannel | None:
-    if not channel:
-        return None
+    return [_snapshot_emoji(snapshot, emoji) for emoji in references]
 
-    return (await _cache_thread(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_thread(bot, channel))
 
+async def _warm_kind(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: hikari.Snowflake,
+    kind: str,
+    kinds: tuple[str, ...],
+) -> typing.Any | None:
+    if kind == "guild":
+        return await _fetch(bot, "guild", guild, lambda: _fetch_guild_with_extras(bot, guild, kinds))
+    elif kind == "roles":
+        return await _rest_role_snapshot(bot, guild)
+    elif kind == "channels":
+        return await _rest_channel_partitions(bot, guild)
+    else:
+        return await _rest_emoji_snapshot(bot, guild)
 
-async def _cache_thread(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildThreadChannel | None:
-    if not channel:
-        return None
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+async def _fetch_guild_with_extras(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: hikari.Snowflake,
+    kinds: tuple[str, ...],
+) -> hikari.RESTGuild:
+    resolved_guild = await bot.rest.fetch_guild(guild)
 
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildThreadChannel) else None
+    if (cache := get_cache(bot)) is not None:
+        if "roles" in kinds:
+            cache.set("roles", guild, RoleSnapshot(guild, resolved_guild.roles.values()))
 
+        if "emojis" in kinds:
+            _store_emojis(cache, EmojiSnapshot(guild, resolved_guild.emojis.values()))
 
-async def _rest_thread(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildThreadChannel | None:
-    if not channel:
-        return None
+    return resolved_guild
 
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildThreadChannel) else None
 
+def _cache_guild(
+    bot: hikari.GatewayBot,
+    guild: int | hikari.Guild,
+) -> hikari.GatewayGuild | None:
+    return bot.cache.get_guild(guild)
 
-async def _either_threads(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
-    if not guild:
-        return None
 
-    return (await _cache_threads(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_threads(bot, guild))
+async def _rest_guild(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild,
+) -> hikari.RESTGuild | None:
+    return await _fetch(bot, "guild", int(guild), lambda: bot.rest.fetch_guild(guild))
 
 
-async def _cache_threads(
+def _cache_banned(
     bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
-    if not guild:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+    guild: int | hikari.Guild,
+    user: int | hikari.User,
+) -> hikari.GuildBan | None:
+    if (index := get_index(bot, BanIndex)) is not None and (bans := index.bans(guild)) is not None:
+        return bans.get(hikari.Snowflake(user))
 
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildThreadChannel)} if resolved_channels else None
+    return None
 
 
-async def _rest_threads(
+async def _rest_banned(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
-    if not guild:
-        return None
+    guild: int | hikari.Guild,
+    user: int | hikari.User,
+) -> hikari.GuildBan | None:
+    if (index := get_index(bot, BanIndex)) is not None and (indexed_bans := index.bans(guild)) is not None:
+        return indexed_bans.get(hikari.Snowflake(user))
 
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildThreadChannel)} if resolved_channels else None
+    # Only look for a cached ban list the backend reports holding, so a single ban lookup doesn't count a miss for the whole list.
+    if isinstance(cache := get_cache(bot), collections.abc.Container) and ("bans", int(guild)) in cache and (cached_bans := cache.get("bans", int(guild))) is not None:
+        return cached_bans.get(hikari.Snowflake(user))
 
+    return await _fetch(bot, "ban", (int(guild), int(user)), lambda: bot.rest.fetch_ban(guild, user))
 
-async def _either_public(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
-    if not channel:
-        return None
 
-    return (await _cache_public(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_public(bot, channel))
+async def _rest_bans(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.GuildBan] | None:
+    if (index := get_index(bot, BanIndex)) is None:
+        return await _fetch(bot, "bans", int(guild), lambda: _fetch_bans(bot, guild))
 
+    if (indexed_bans := index.bans(guild)) is not None:
+        return indexed_bans
 
-async def _cache_public(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
-    if not channel:
-        return None
+    index.begin_load(guild)
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+    try:
+        if (bans := await _fetch(bot, "bans", int(guild), lambda: _fetch_bans(bot, guild))) is None:
+            return None
 
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, (hikari.GuildPublicThread, hikari.GuildNewsThread)) else None
+        return index.load(guild, bans.values())
+    finally:
+        index.end_load(guild)
 
 
-async def _rest_public(
+async def _fetch_bans(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
-    if not channel:
-        return None
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.GuildBan]:
+    return await bot.rest.fetch_bans(guild).collect(lambda bans: {ban.user.id: ban for ban in bans})
 
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, (hikari.GuildPublicThread, hikari.GuildNewsThread)) else None
 
-
-async def _either_publics(
+async def _rest_iter_bans(
     bot: hikari.GatewayBot | hikari.RESTBot,
     guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
+    predicate: typing.Callable[[hikari.GuildBan], bool] | None = None,
+    priority: Priority | None = None,
+) -> typing.AsyncIterator[hikari.GuildBan]:
     if not guild:
-        return None
+        return
 
-    return (await _cache_publics(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_publics(bot, guild))
+    try:
+        async for ban in _iter_pages(bot, "bans", bot.rest.fetch_bans(guild), predicate, priority):
+            yield ban
+    except hikari.NotFoundError:
+        return
 
 
-async def _cache_publics(
-    bot: hikari.GatewayBot,
+async def _either_banned_many(
+    bot: hikari.GatewayBot | hikari.RESTBot,
     guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
-    if not guild:
-        return None
+    users: typing.Iterable[int | hikari.User],
+    priority: Priority | None = None,
+) -> typing.Mapping[hikari.Snowflake, hikari.GuildBan]:
+    if priority is not None:
+        with use_priority(priority):
+            return await _either_banned_many(bot, guild, users)
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+    if not guild or (bans := await _rest_bans(bot, guild)) is None:
+        return {}
 
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, (hikari.GuildPublicThread, hikari.GuildNewsThread))} if resolved_channels else None
+    return {user_id: ban for user_id in dict.fromkeys(hikari.Snowflake(user) for user in users) if (ban := bans.get(user_id)) is not None}
 
 
-async def _rest_publics(
+async def _either_dm_for_user(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
-    if not guild:
-        return None
+    user: int | hikari.User | None,
+    priority: Priority | None = None,
+) -> hikari.DMChannel | None:
+    if priority is not None:
+        with use_priority(priority):
+            return await _either_dm_for_user(bot, user)
 
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, (hikari.GuildPublicThread, hikari.GuildNewsThread))} if resolved_channels else None
+    if not user:
+        return None
 
+    user_id = hikari.Snowflake(user)
+    if (dm_cache := get_dm_cache(bot)) is None:
+        dm_cache = attach_dm_cache(bot)
 
-async def _either_private(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildPrivateThread | None:
-    if not channel:
-        return None
+    if (dm_channel := dm_cache.get(user_id)) is not None:
+        return dm_channel
 
-    return (await _cache_private(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_private(bot, channel))
+    async def create_dm_channel() -> hikari.DMChannel:
+        fetcher = functools.partial(bot.rest.create_dm_channel, user_id)
+        dm_channel = await (scheduler.run("dm_for_user", fetcher, key=("dm_for_user", user_id)) if (scheduler := get_scheduler(bot)) is not None else fetcher())
+        dm_cache.set(user_id, dm_channel)
+        return dm_channel
 
+    if (bot, "dm_for_user", user_id) in _IN_FLIGHT and (scheduler := get_scheduler(bot)) is not None:
+        scheduler.promote(("dm_for_user", user_id), current_priority())
 
-async def _cache_private(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildPrivateThread | None:
-    if not channel:
+    try:
+        return await _IN_FLIGHT.do((bot, "dm_for_user", user_id), create_dm_channel)
+    except hikari.NotFoundError:
         return None
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
 
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildPrivateThread) else None
+def _cache_user(
+    bot: hikari.GatewayBot,
+    user: int | hikari.User,
+) -> hikari.User | None:
+    return bot.cache.get_user(user)
 
 
-async def _rest_private(
+async def _rest_user(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildPrivateThread | None:
-    if not channel:
-        return None
+    user: int | hikari.User,
+) -> hikari.User | None:
+    return await _fetch(bot, "user", int(user), lambda: bot.rest.fetch_user(user))
 
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildPrivateThread) else None
 
+def _cache_member(
+    bot: hikari.GatewayBot,
+    guild: int | hikari.Guild,
+    user: int | hikari.User,
+) -> hikari.Member | CompactMember | None:
+    if (resolved_member := bot.cache.get_member(guild, user)) is not None:
+        return resolved_member
+
+    return index.member(guild, user) if (index := get_index(bot, MemberIndex)) is not None else None
 
-async def _either_privates(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
-    if not guild:
-        return None
 
-    return (await _cache_privates(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_privates(bot, guild))
+async def _rest_member(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild,
+    user: int | hikari.User,
+) -> hikari.Member | None:
+    return await _fetch(bot, "member", (int(guild), int(user)), lambda: bot.rest.fetch_member(guild, user))
 
 
-async def _cache_privates(
+def _cache_members(
     bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
-    if not guild:
-        return None
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+    if resolved_members := bot.cache.get_members_view_for_guild(hikari.Snowflake(guild)):
+        return resolved_members
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+    return index.members(guild) if (index := get_index(bot, MemberIndex)) is not None else None
 
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildPrivateThread)} if resolved_channels else None
+
+async def _rest_members(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
+    return await _fetch(bot, "members", int(guild), lambda: bot.rest.fetch_members(guild).collect(lambda members: {member.id: member for member in members}))
 
 
-async def _rest_privates(
+async def _rest_iter_members(
     bot: hikari.GatewayBot | hikari.RESTBot,
     guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
+    predicate: typing.Callable[[hikari.Member], bool] | None = None,
+    priority: Priority | None = None,
+) -> typing.AsyncIterator[hikari.Member]:
     if not guild:
-        return None
+        return
 
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildPrivateThread)} if resolved_channels else None
+    try:
+        async for member in _iter_pages(bot, "members", bot.rest.fetch_members(guild), predicate, priority):
+            yield member
+    except hikari.NotFoundError:
+        return
 
 
-async def _either_forum(
+async def _either_members_by_ids(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildForumChannel | None:
-    if not channel:
-        return None
+    guild: int | hikari.Guild | None,
+    users: typing.Iterable[int | hikari.User],
+    concurrency: int = 10,
+    timeout: float = 10.0,
+    priority: Priority | None = None,
+) -> tuple[typing.Mapping[hikari.Snowflake, hikari.Member | CompactMember], set[hikari.Snowflake]]:
+    if priority is not None:
+        with use_priority(priority):
+            return await _either_members_by_ids(bot, guild, users, concurrency, timeout)
 
-    return (await _cache_forum(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_forum(bot, channel))
+    user_ids = list(dict.fromkeys(hikari.Snowflake(user) for user in users))
 
+    if not guild:
+        return {}, set(user_ids)
+
+    guild_id = hikari.Snowflake(guild)
+    resolved_members: dict[hikari.Snowflake, hikari.Member | CompactMember] = {}
+    missing_members: set[hikari.Snowflake] = set()
+    unresolved_ids: list[hikari.Snowflake] = []
+    cache = get_cache(bot)
+
+    for user_id in user_ids:
+        if isinstance(bot, hikari.GatewayBot) and (resolved_member := _cache_member(bot, guild_id, user_id)):
+            resolved_members[user_id] = resolved_member
+        elif cache is not None and (resolved_member := cache.get("member", (guild_id, user_id))) is not None:
+            resolved_members[user_id] = resolved_member
+        elif cache is not None and cache.is_missing("member", (guild_id, user_id)):
+            missing_members.add(user_id)
+        else:
+            unresolved_ids.append(user_id)
 
-async def _cache_forum(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildForumChannel | None:
-    if not channel:
-        return None
+    if unresolved_ids and isinstance(bot, hikari.GatewayBot) and bot.intents & hikari.Intents.GUILD_MEMBERS:
+        chunks = [unresolved_ids[index : index + 100] for index in range(0, len(unresolved_ids), 100)]
+        chunked_members = await asyncio.gather(*(_chunk_members(bot, guild_id, chunk, timeout) for chunk in chunks))
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+        for chunk_members, chunk_missing in chunked_members:
+            resolved_members.update(chunk_members)
+            missing_members.update(chunk_missing)
 
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildForumChannel) else None
+        unresolved_ids = [user_id for user_id in unresolved_ids if user_id not in resolved_members and user_id not in missing_members]
 
+    if unresolved_ids:
+        semaphore = asyncio.Semaphore(concurrency)
 
-async def _rest_forum(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildForumChannel | None:
-    if not channel:
-        return None
+        async def fetch_member(user_id: hikari.Snowflake) -> hikari.Member | None:
+            async with semaphore:
+                return await _rest_member(bot, guild_id, user_id)
 
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildForumChannel) else None
+        for user_id, resolved_member in zip(unresolved_ids, await asyncio.gather(*(fetch_member(user_id) for user_id in unresolved_ids))):
+            if resolved_member:
+                resolved_members[user_id] = resolved_member
+            else:
+                missing_members.add(user_id)
 
+    return resolved_members, missing_members
 
-async def _either_forums(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
-    if not guild:
-        return None
 
-    return (await _cache_forums(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_forums(bot, guild))
+async def _chunk_members(
+    bot: hikari.GatewayBot,
+    guild: hikari.Snowflake,
+    users: typing.Sequence[hikari.Snowflake],
+    timeout: float,
+) -> tuple[typing.Mapping[hikari.Snowflake, hikari.Member], set[hikari.Snowflake]]:
+    nonce = secrets.token_hex(16)
+    resolved_members: dict[hikari.Snowflake, hikari.Member] = {}
+    missing_members: set[hikari.Snowflake] = set()
+    received_chunks = 0
 
+    with bot.stream(hikari.MemberChunkEvent, timeout=timeout).filter(lambda event: event.nonce == nonce) as stream:
+        await bot.request_guild_members(guild, users=users, nonce=nonce)
 
-async def _cache_forums(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
-    if not guild:
-        return None
+        async for event in stream:
+            resolved_members.update(event.members)
+            missing_members.update(event.not_found)
+            received_chunks += 1
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+            if received_chunks >= event.chunk_count:
+                break
 
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildForumChannel)} if resolved_channels else None
+    return resolved_members, missing_members
 
 
-async def _rest_forums(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
-    if not guild:
-        return None
+def _cache_boosters(
+    bot: hikari.GatewayBot,
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+    if (index := get_index(bot, BoosterIndex)) is not None and (indexed_boosters := index.boosters(guild)) is not None:
+        return indexed_boosters
+
+    if resolved_members := bot.cache.get_members_view_for_guild(hikari.Snowflake(guild)):
+        return {member.id: member for member in resolved_members.values() if _is_booster(member)}
 
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildForumChannel)} if resolved_channels else None
+    return member_index.boosters(guild) if (member_index := get_index(bot, MemberIndex)) is not None else None
 
 
-async def _either_news(
+async def _rest_boosters(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildNewsChannel | None:
-    if not channel:
-        return None
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
+    if (cache := get_cache(bot)) is not None and (resolved_members := cache.get("members", int(guild))) is not None:
+        return {member.id: member for member in resolved_members.values() if _is_booster(member)}
 
-    return (await _cache_news(bot, channel) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_news(bot, channel))
+    return await _fetch(bot, "boosters", int(guild), lambda: bot.rest.fetch_members(guild).filter(_is_booster).collect(lambda members: {member.id: member for member in members}))
 
 
-async def _cache_news(
-    bot: hikari.GatewayBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildNewsChannel | None:
-    if not channel:
-        return None
+def _is_booster(
+    member: hikari.Member | CompactMember,
+) -> bool:
+    return member.premium_since is not None
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
 
-    resolved_channel = await _cache_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildNewsChannel) else None
+def _cache_typed_channel(
+    channel_types: tuple[type[hikari.GuildChannel], ...],
+    bot: hikari.GatewayBot,
+    channel: int | hikari.GuildChannel,
+) -> hikari.GuildChannel | None:
+    resolved_channel = bot.cache.get_guild_channel(channel)
+    return resolved_channel if isinstance(resolved_channel, channel_types) else None
 
 
-async def _rest_news(
+async def _rest_typed_channel(
+    channel_types: tuple[type[hikari.PartialChannel], ...],
     bot: hikari.GatewayBot | hikari.RESTBot,
-    channel: int | hikari.GuildChannel | None,
-) -> hikari.GuildNewsChannel | None:
-    if not channel:
-        return None
+    channel: int | hikari.PartialChannel,
+) -> hikari.PartialChannel | None:
+    resolved_channel = await _fetch(bot, "channel", int(channel), lambda: bot.rest.fetch_channel(channel))
+    return resolved_channel if isinstance(resolved_channel, channel_types) else None
 
-    resolved_channel = await _rest_channel(bot, channel)
-    return resolved_channel if isinstance(resolved_channel, hikari.GuildNewsChannel) else None
 
+def _cache_partition(
+    partition: str,
+    bot: hikari.GatewayBot,
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
+    if (resolved_partitions := _indexed_channels(bot, guild)) is not None:
+        return resolved_partitions.view(partition)
 
-async def _either_newses(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
-    if not guild:
-        return None
+    resolved_channels = bot.cache.get_guild_channels_view_for_guild(guild)
 
-    return (await _cache_newses(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_newses(bot, guild))
+    if partition == "channels":
+        return resolved_channels
 
+    channel_types = CHANNEL_PARTITIONS[partition]
+    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, channel_types)} if resolved_channels else None
 
-async def _cache_newses(
-    bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
-    if not guild:
-        return None
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+async def _rest_partition(
+    partition: str,
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild,
+) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
+    resolved_partitions = await _rest_channel_partitions(bot, guild)
+    return resolved_partitions.view(partition) if resolved_partitions else None
+
 
-    resolved_channels = await _cache_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildNewsChannel)} if resolved_channels else None
+def _indexed_channels(
+    bot: hikari.GatewayBot,
+    guild: int | hikari.Guild,
+) -> ChannelPartitions | None:
+    index = get_index(bot, ChannelIndex)
+    return index.partitions(guild) if index is not None else None
 
 
-async def _rest_newses(
+async def _rest_channel_partitions(
     bot: hikari.GatewayBot | hikari.RESTBot,
     guild: int | hikari.Guild | None,
-) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
+) -> ChannelPartitions | None:
     if not guild:
         return None
 
-    resolved_channels = await _rest_channels(bot, guild)
-    return {channel.id: channel for channel in resolved_channels.values() if isinstance(channel, hikari.GuildNewsChannel)} if resolved_channels else None
+    return await _fetch(bot, "channels", int(guild), lambda: _fetch_channel_partitions(bot, guild))
 
 
-async def _either_role(
+async def _fetch_channel_partitions(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-    role: int | hikari.Role | None,
-) -> hikari.Role | None:
-    if not guild or not role:
-        return None
+    guild: int | hikari.Guild,
+) -> ChannelPartitions:
+    return ChannelPartitions(guild, await bot.rest.fetch_guild_channels(guild))
 
-    return (await _cache_role(bot, guild, role) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_role(bot, guild, role))
 
-
-async def _cache_role(
+def _cache_role(
     bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-    role: int | hikari.Role | None,
+    guild: int | hikari.Guild,
+    role: int | hikari.Role,
 ) -> hikari.Role | None:
-    if not guild or not role:
-        return None
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
     resolved_role = bot.cache.get_role(role)
     return resolved_role if isinstance(resolved_role, hikari.Role) else None
 
 
 async def _rest_role(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-    role: int | hikari.Role | None,
+    guild: int | hikari.Guild,
+    role: int | hikari.Role,
 ) -> hikari.Role | None:
-    if not guild or not role:
-        return None
+    resolved_snapshot = await _rest_role_snapshot(bot, guild)
+    return resolved_snapshot.roles.get(hikari.Snowflake(role)) if resolved_snapshot else None
 
-    try:
-        resolved_role = await bot.rest.fetch_role(guild, role)
-        return resolved_role if isinstance(resolved_role, hikari.Role) else None
-    except hikari.NotFoundError:
-        return None
 
+def _cache_role_snapshot(
+    bot: hikari.GatewayBot,
+    guild: int | hikari.Guild,
+) -> RoleSnapshot | None:
+    if (index := get_index(bot, RoleIndex)) is not None:
+        return index.snapshot(guild)
+
+    guild_roles = bot.cache.get_roles_view_for_guild(guild)
+    return RoleSnapshot(guild, guild_roles.values()) if guild_roles else None
 
-async def _either_roles(
+
+async def _rest_role_snapshot(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-    member: int | hikari.Member | None = None,
-) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
-    if not guild:
-        return None
+    guild: int | hikari.Guild,
+) -> RoleSnapshot | None:
+    return await _fetch(bot, "roles", int(guild), lambda: _fetch_role_snapshot(bot, guild))
+
 
-    return (await _cache_roles(bot, guild, member) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_roles(bot, guild, member))
+async def _fetch_role_snapshot(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild,
+) -> RoleSnapshot:
+    return RoleSnapshot(guild, await bot.rest.fetch_roles(guild))
 
 
-async def _cache_roles(
+def _cache_roles(
     bot: hikari.GatewayBot,
     guild: int | hikari.Guild | None,
-    member: int | hikari.Member | None = None,
+    member: int | hikari.Member | CompactMember | None,
 ) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
-    if not guild and not member:
+    if not (guild := guild or _member_guild(member)):
         return None
-    elif not guild:
-        guild = await _cache_guild(bot, member.guild_id if isinstance(member, hikari.Member) else member)
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
 
-    guild_roles = await _cache_roles(bot, guild)
+    index = get_index(bot, RoleIndex)
+    resolved_snapshot = index.snapshot(guild) if index is not None else None
+    guild_roles = resolved_snapshot.roles if resolved_snapshot else bot.cache.get_roles_view_for_guild(guild)
 
     if not member:
-        return guild_roles
+        return guild_roles or None
     else:
-        resolved_member = await _cache_member(bot, guild, member)
-        return {role.id: role for role in guild_roles.values() if role.id in resolved_member.role_ids} if guild_roles and resolved_member else None
+        resolved_member = _cache_member(bot, guild, member)
+        return {role_id: guild_roles[role_id] for role_id in resolved_member.role_ids if role_id in guild_roles} if guild_roles and resolved_member else None
 
 
 async def _rest_roles(
     bot: hikari.GatewayBot | hikari.RESTBot,
     guild: int | hikari.Guild | None,
-    member: int | hikari.Member | None = None,
+    member: int | hikari.Member | CompactMember | None,
 ) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
-    if not guild and not member:
+    if not (guild := guild or _member_guild(member)) or not (resolved_snapshot := await _rest_role_snapshot(bot, guild)):
         return None
-    elif not guild:
-        guild = await _rest_guild(bot, member.guild_id if isinstance(member, hikari.Member) else member)
-
-    try:
-        guild_roles = await _rest_roles(bot, guild)
 
-        if not member:
-            resolved_roles = guild_roles
-        else:
-            resolved_member = await _rest_member(bot, guild, member)
-            resolved_roles = {role.id: role for role in guild_roles.values() if role.id in resolved_member.role_ids} if guild_roles and resolved_member else None
-
-        return resolved_roles
-    except hikari.NotFoundError:
-        return None
+    if not member:
+        return resolved_snapshot.roles
+    else:
+        resolved_member = await _rest_member(bot, guild, member)
+        return {role_id: resolved_snapshot.roles[role_id] for role_id in resolved_member.role_ids if role_id in resolved_snapshot.roles} if resolved_member else None
 
 
-async def _either_top_role(
-    bot: hikari.GatewayBot | hikari.RESTBot,
+def _cache_top_role(
+    bot: hikari.GatewayBot,
     guild: int | hikari.Guild | None,
-    member: int | hikari.Member | None,
+    member: int | hikari.Member | CompactMember | None,
 ) -> hikari.Role | None:
-    if not guild or not member:
+    if not (guild := guild or _member_guild(member)) or not (resolved_snapshot := _cache_role_snapshot(bot, guild)):
         return None
 
-    return (await _cache_top_role(bot, guild, member) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_top_role(bot, guild, member))
+    if not member:
+        return resolved_snapshot.top_role()
+    else:
+        resolved_member = _cache_member(bot, guild, member)
+        return resolved_snapshot.top_role(resolved_member.role_ids) if resolved_member else None
 
 
-async def _cache_top_role(
-    bot: hikari.GatewayBot,
+async def _rest_top_role(
+    bot: hikari.GatewayBot | hikari.RESTBot,
     guild: int | hikari.Guild | None,
-    member: int | hikari.Member | None,
+    member: int | hikari.Member | CompactMember | None,
 ) -> hikari.Role | None:
-    if not guild and not member:
+    if not (guild := guild or _member_guild(member)) or not (resolved_snapshot := await _rest_role_snapshot(bot, guild)):
         return None
-    elif not guild:
-        guild = await _cache_guild(bot, member.guild_id if isinstance(member, hikari.Member) else member)
-
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
-
-    guild_roles = await _cache_roles(bot, guild)
-    sorted_roles = sorted(guild_roles.values(), key=lambda role: role.position, reverse=True) if guild_roles else []
 
     if not member:
-        top_role = sorted_roles[0] if sorted_roles else None
+        return resolved_snapshot.top_role()
     else:
-        resolved_member = await _cache_member(bot, guild, member)
-        top_role = next((role for role in sorted_roles if role.id in resolved_member.role_ids), None) if resolved_member else None
+        resolved_member = await _rest_member(bot, guild, member)
+        return resolved_snapshot.top_role(resolved_member.role_ids) if resolved_member else None
 
-    return top_role
 
+def _member_guild(
+    member: int | hikari.Member | CompactMember | None,
+) -> hikari.Snowflake | None:
+    return member.guild_id if isinstance(member, (hikari.Member, CompactMember)) else None
 
-async def _rest_top_role(
+
+def _cache_booster_role(
+    bot: hikari.GatewayBot,
+    guild: int | hikari.Guild,
+) -> hikari.Role | None:
+    resolved_snapshot = _cache_role_snapshot(bot, guild)
+    return resolved_snapshot.booster_role() if resolved_snapshot else None
+
+
+async def _rest_booster_role(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-    member: int | hikari.Member | None,
+    guild: int | hikari.Guild,
 ) -> hikari.Role | None:
-    if not guild and not member:
-        return None
-    elif not guild:
-        guild = await _rest_guild(bot, member.guild_id if isinstance(member, hikari.Member) else member)
+    resolved_snapshot = await _rest_role_snapshot(bot, guild)
+    return resolved_snapshot.booster_role() if resolved_snapshot else None
 
-    try:
-        guild_roles = await _rest_roles(bot, guild)
-        sorted_roles = sorted(guild_roles.values(), key=lambda role: role.position, reverse=True) if guild_roles else []
 
-        if not member:
-            top_role = sorted_roles[0] if sorted_roles else None
-        else:
-            resolved_member = await _rest_member(bot, guild, member)
-            top_role = next((role for role in sorted_roles if role.id in resolved_member.role_ids), None) if resolved_member else None
+def _cache_emoji(
+    bot: hikari.GatewayBot,
+    emoji: int | str | hikari.Emoji,
+    guild: int | hikari.Guild | None = None,
+) -> hikari.Emoji | None:
+    if isinstance(emoji, hikari.CustomEmoji):
+        return bot.cache.get_emoji(emoji)
 
-        return top_role
-    except hikari.NotFoundError:
-        return None
+    if HOOKS.active:
+        _mark("local")
 
+    return _parse_emoji(emoji)
 
-async def _either_booster_role(
+
+async def _rest_emoji(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> hikari.Role | None:
-    if not guild:
-        return None
+    emoji: int | str | hikari.Emoji,
+    guild: int | hikari.Guild | None = None,
+) -> hikari.Emoji | None:
+    if isinstance(emoji, str) and not is_unicode_emoji(emoji):
+        emoji = _parse_emoji(emoji)
 
-    return (await _cache_booster_role(bot, guild) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_booster_role(bot, guild))
+    if not isinstance(emoji, hikari.CustomEmoji):
+        if HOOKS.active:
+            _mark("local")
 
+        return _parse_emoji(emoji) if emoji else None
 
-async def _cache_booster_role(
+    custom_emoji = emoji
+    return (await _fetch(bot, "emoji", (int(guild), int(custom_emoji)), lambda: bot.rest.fetch_emoji(guild, custom_emoji))) if guild else None
+
+
+def _cache_emoji_snapshot(
     bot: hikari.GatewayBot,
-    guild: int | hikari.Guild | None,
-) -> hikari.Role | None:
-    if not guild:
-        return None
+    guild: int | hikari.Guild,
+) -> EmojiSnapshot | None:
+    if (index := get_index(bot, EmojiIndex)) is not None:
+        return index.snapshot(guild)
 
-    if not isinstance(bot, hikari.GatewayBot):
-        raise InvalidBot
+    return EmojiSnapshot(guild, bot.cache.get_emojis_view_for_guild(guild).values()) if bot.cache.get_guild(guild) else None
 
-    resolved_roles = await _cache_roles(bot, guild)
-    return next((role for role in resolved_roles.values() if role.is_premium_subscriber_role), None) if resolved_roles else None
 
+async def _rest_emoji_snapshot(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    guild: int | hikari.Guild,
+) -> EmojiSnapshot | None:
+    return await _fetch(bot, "emojis", int(guild), lambda: _fetch_emoji_snapshot(bot, guild))
 
-async def _rest_booster_role(
+
+async def _fetch_emoji_snapshot(
     bot: hikari.GatewayBot | hikari.RESTBot,
-    guild: int | hikari.Guild | None,
-) -> hikari.Role | None:
-    if not guild:
-        return None
+    guild: int | hikari.Guild,
+) -> EmojiSnapshot:
+    resolved_snapshot = EmojiSnapshot(guild, await bot.rest.fetch_guild_emojis(guild))
 
-    try:
-        resolved_roles = await _rest_roles(bot, guild)
-        return next((role for role in resolved_roles.values() if role.is_premium_subscriber_role), None) if resolved_roles else None
-    except hikari.NotFoundError:
-        return None
+    if (cache := get_cache(bot)) is not None:
+        _store_emojis(cache, resolved_snapshot)
 
+    return resolved_snapshot
 
-async def _either_emoji(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    emoji: int | str | hikari.Emoji | None,
-    guild: int | hikari.Guild | None = None,
-) -> hikari.Emoji | None:
-    if not emoji:
-        return None
 
-    return (await _cache_emoji(bot, emoji) if isinstance(bot, hikari.GatewayBot) else None) or (await _rest_emoji(bot, emoji, guild))
+def _store_emojis(
+    cache: CacheBackend,
+    snapshot: EmojiSnapshot,
+) -> None:
+    cache.set("emojis", int(snapshot.guild_id), snapshot)
 
+    for emoji in snapshot.emojis.values():
+        cache.set("emoji", (int(snapshot.guild_id), int(emoji)), emoji)
 
-async def _cache_emoji(
-    bot: hikari.GatewayBot,
-    emoji: int | str | hikari.Emoji | None,
+
+def _snapshot_emoji(
+    snapshot: EmojiSnapshot | None,
+    emoji: int | str | hikari.Emoji,
 ) -> hikari.Emoji | None:
-    resolved_emoji = None
+    if isinstance(emoji, hikari.UnicodeEmoji):
+        return emoji
 
-    if isinstance(emoji, hikari.CustomEmoji):
-        resolved_emoji = bot.cache.get_emoji(emoji)
-    elif isinstance(emoji, hikari.UnicodeEmoji):
-        resolved_emoji = hikari.UnicodeEmoji.parse(emoji.name)
-    elif isinstance(emoji, str):
-        if emoji in emojis.EMOJI_DATA:
-            resolved_emoji = hikari.UnicodeEmoji.parse(emoji)
-        else:
-            try:
-                resolved_emoji = hikari.CustomEmoji.parse(emoji)
-            except ValueError:
-                resolved_emoji = None
-    elif isinstance(emoji, int):
-        try:
-            if (unicode_char := chr(emoji)) in emojis.EMOJI_DATA:
-                resolved_emoji = hikari.UnicodeEmoji.parse(unicode_char)
-        except ValueError:
-            resolved_emoji = None
+    if (custom_emoji := snapshot.get(emoji) if snapshot is not None else None) is not None or not isinstance(emoji, int):
+        return custom_emoji
 
-    return resolved_emoji
+    return _parse_emoji(emoji)
 
 
-async def _rest_emoji(
-    bot: hikari.GatewayBot | hikari.RESTBot,
-    emoji: int | str | hikari.Emoji | None,
-    guild: int | hikari.Guild | None = None,
+def _parse_emoji(
+    emoji: int | str | hikari.Emoji,
 ) -> hikari.Emoji | None:
-    resolved_emoji = None
+    if isinstance(emoji, hikari.UnicodeEmoji):
+        return hikari.UnicodeEmoji.parse(emoji.name)
+    elif isinstance(emoji, str):
+        if is_unicode_emoji(emoji):
+            return hikari.UnicodeEmoji.parse(emoji)
 
-    if isinstance(emoji, hikari.CustomEmoji):
         try:
-            resolved_emoji = (await bot.rest.fetch_emoji(guild, emoji)) if guild else None
-        except hikari.NotFoundError:
-            resolved_emoji = None
-    elif isinstance(emoji, hikari.UnicodeEmoji):
-        resolved_emoji = hikari.UnicodeEmoji.parse(emoji.name)
-    elif isinstance(emoji, str):
-        if emoji in emojis.EMOJI_DATA:
-            resolved_emoji = hikari.UnicodeEmoji.parse(emoji)
-        else:
-            try:
-                resolved_emoji = hikari.CustomEmoji.parse(emoji)
-                resolved_emoji = (await bot.rest.fetch_emoji(guild, resolved_emoji)) if guild else None
-            except (ValueError, hikari.NotFoundError):
-                resolved_emoji = None
+            return hikari.CustomEmoji.parse(emoji)
+        except ValueError:
+            return None
     elif isinstance(emoji, int):
         try:
-            if (unicode_char := chr(emoji)) in emojis.EMOJI_DATA:
-                resolved_emoji = hikari.UnicodeEmoji.parse(unicode_char)
-        except ValueError:
-            resolved_emoji = None
-
-    return resolved_emoji
+            if is_unicode_emoji(unicode_char := chr(emoji)):
+                return hikari.UnicodeEmoji.parse(unicode_char)
+        except (ValueError, OverflowError):
+            return None
+
+    return None
+
+
+def _channel_specs(
+    singular: str,
+    singular_noun: str,
+    plural: str,
+    plural_noun: str,
+) -> tuple[Spec, Spec]:
+    channel_types = CHANNEL_PARTITIONS[plural]
+    channel_type = functools.reduce(operator.or_, channel_types)
+    return (
+        Spec(singular, singular_noun, (_CHANNEL,), channel_type, MandatoryChannelNotFound, functools.partial(_cache_typed_channel, channel_types), functools.partial(_rest_typed_channel, channel_types)),
+        Spec(plural, plural_noun, (_GUILD,), typing.Mapping[hikari.Snowflake, channel_type], MandatoryChannelNotFound, functools.partial(_cache_partition, plural), functools.partial(_rest_partition, plural)),
+    )
+
+
+def _private_spec(
+    name: str,
+    noun: str,
+    channel_type: type[hikari.PrivateChannel],
+) -> Spec:
+    return Spec(name, noun, (_parameter("channel", int | channel_type | None),), channel_type, MandatoryChannelNotFound, None, functools.partial(_rest_typed_channel, (channel_type,)))
+
+
+_GUILD = _parameter("guild", int | hikari.Guild | None)
+_USER = _parameter("user", int | hikari.User | None)
+_CHANNEL = _parameter("channel", int | hikari.GuildChannel | None)
+_ROLE = _parameter("role", int | hikari.Role | None)
+_MEMBER = _parameter("member", int | hikari.Member | CompactMember | None)
+_EMOJI = _parameter("emoji", int | str | hikari.Emoji | None)
+_EMOJI_GUILD = _parameter("guild", int | hikari.Guild | None, None)
+_MEMBERS = typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember]
+
+SPECS: dict[str, Spec] = {
+    spec.name: spec
+    for spec in (
+        Spec("guild", "a guild", (_GUILD,), hikari.GatewayGuild | hikari.RESTGuild, MandatoryGuildNotFound, _cache_guild, _rest_guild, cache_returns=hikari.GatewayGuild, rest_returns=hikari.RESTGuild),
+        Spec("banned", "a ban", (_GUILD, _USER), hikari.GuildBan, MandatoryBanNotFound, _cache_banned, _rest_banned),
+        Spec("user", "a user", (_USER,), hikari.User, MandatoryUserNotFound, _cache_user, _rest_user),
+        Spec("member", "a member", (_GUILD, _USER), hikari.Member | CompactMember, MandatoryMemberNotFound, _cache_member, _rest_member, rest_returns=hikari.Member),
+        Spec("members", "members", (_GUILD,), _MEMBERS, MandatoryMemberNotFound, _cache_members, _rest_members, rest_returns=typing.Mapping[hikari.Snowflake, hikari.Member]),
+        Spec("boosters", "boosters", (_GUILD,), _MEMBERS, MandatoryMemberNotFound, _cache_boosters, _rest_boosters, rest_returns=typing.Mapping[hikari.Snowflake, hikari.Member]),
+        *_channel_specs("channel", "a channel", "channels", "channels"),
+        _private_spec("dms", "a private channel", hikari.PrivateChannel),
+        _private_spec("dm", "a DM channel", hikari.DMChannel),
+        _private_spec("group", "a group DM channel", hikari.GroupDMChannel),
+        *_channel_specs("textable", "a textable channel", "textables", "textable channels"),
+        *_channel_specs("permissible", "a permissible channel", "permissibles", "permissible channels"),
+        *_channel_specs("category", "a category channel", "categories", "category channels"),
+        *_channel_specs("voice", "a voice channel", "voices", "voice channels"),
+        *_channel_specs("stage", "a stage channel", "stages", "stage channels"),
+        *_channel_specs("text", "a text channel", "texts", "text channels"),
+        *_channel_specs("thread", "a thread channel", "threads", "thread channels"),
+        *_channel_specs("public", "a public thread or news thread", "publics", "public/news threads"),
+        *_channel_specs("private", "a private thread", "privates", "private threads"),
+        *_channel_specs("forum", "a forum channel", "forums", "forum channels"),
+        *_channel_specs("news", "a news channel", "newses", "news channels"),
+        Spec("role", "a role", (_GUILD, _ROLE), hikari.Role, MandatoryRoleNotFound, _cache_role, _rest_role),
+        Spec("roles", "roles belonging to a member or a guild", (_GUILD, _MEMBER), typing.Mapping[hikari.Snowflake, hikari.Role], MandatoryRoleNotFound, _cache_roles, _rest_roles, required=0),
+        Spec("top_role", "the top role of a member or guild", (_GUILD, _MEMBER), hikari.Role, MandatoryRoleNotFound, _cache_top_role, _rest_top_role, required=0),
+        Spec("booster_role", "the booster role of a guild", (_GUILD,), hikari.Role, MandatoryRoleNotFound, _cache_booster_role, _rest_booster_role),
+        Spec("role_snapshot", "the role ranking of a guild", (_GUILD,), RoleSnapshot, MandatoryRoleNotFound, _cache_role_snapshot, _rest_role_snapshot),
+        Spec("emoji", "an emoji", (_EMOJI, _EMOJI_GUILD), hikari.Emoji, MandatoryEmojiNotFound, _cache_emoji, _rest_emoji),
+        Spec("emoji_snapshot", "the emojis of a guild", (_GUILD,), EmojiSnapshot, MandatoryEmojiNotFound, _cache_emoji_snapshot, _rest_emoji_snapshot),
+    )
+}
+
+
+def _generate_facades() -> None:
+    # The facades are declared for type checkers in getfetch.pyi, regenerate it with `python -m stubgen` after changing SPECS.
+    for facade, mode, mandatory in (
+        (Optional.Either, "either", False),
+        (Optional.Cache, "cache", False),
+        (Optional.Rest, "rest", False),
+        (Mandatory.Either, "either", True),
+        (Mandatory.Cache, "cache", True),
+        (Mandatory.Rest, "rest", True),
+    ):
+        for spec in SPECS.values():
+            if mode != "cache" or spec.cache is not None:
+                setattr(facade, spec.name, staticmethod(_resolver(spec, mode, mandatory, facade.__qualname__)))
+
+    for facade, mandatory in ((Sync.Cache, False), (Sync.MandatoryCache, True)):
+        for spec in SPECS.values():
+            if spec.cache is not None:
+                setattr(facade, spec.name, staticmethod(_resolver(spec, "cache", mandatory, facade.__qualname__, synchronous=True)))
+
+
+_generate_facades()
@@ -0,0 +1,1363 @@
+# Generated by `python -m stubgen` from the resolvers attached at import time. Do not edit.
+import inspect
+import typing
+
+import hikari
+
+from hikariutils.errors import HikariUtilsError
+from hikariutils.index import CompactMember, EmojiSnapshot, RoleSnapshot
+from hikariutils.scheduler import Priority
+
+T = typing.TypeVar("T")
+
+WARM_KINDS: tuple[str, ...]
+
+SPECS: dict[str, Spec]
+
+class Optional:
+    class Either:
+        """Retrieve an object from the cache or fetch it from Discord if not found. Return None if still not found."""
+
+        @staticmethod
+        async def members_by_ids(
+            bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, users: typing.Iterable[int | hikari.User], concurrency: int = ..., timeout: float = ..., priority: Priority | None = ...
+        ) -> tuple[typing.Mapping[hikari.Snowflake, hikari.Member | CompactMember], set[hikari.Snowflake]]:
+            """Retrieve many members from the cache. Request the rest in chunks from the gateway or fetch them from Discord. Return the members found and the IDs not found."""
+
+        @staticmethod
+        async def banned_many(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, users: typing.Iterable[int | hikari.User], priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildBan]:
+            """Check many users against the ban list of a guild, fetching it from Discord once if not indexed. Return the bans of the users banned."""
+
+        @staticmethod
+        async def dm_for_user(bot: hikari.GatewayBot | hikari.RESTBot, user: int | hikari.User | None, priority: Priority | None = ...) -> hikari.DMChannel | None:
+            """Retrieve the DM channel with a user from the DM cache or open it through Discord if not found. Return None if still not found."""
+
+        @staticmethod
+        async def guild(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.GatewayGuild | hikari.RESTGuild | None:
+            """Retrieve a guild from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def banned(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.GuildBan | None:
+            """Retrieve a ban from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def user(bot: hikari.GatewayBot | hikari.RESTBot, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.User | None:
+            """Retrieve a user from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def member(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.Member | CompactMember | None:
+            """Retrieve a member from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def members(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+            """Retrieve members from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def boosters(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+            """Retrieve boosters from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def channel(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildChannel | None:
+            """Retrieve a channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def channels(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
+            """Retrieve channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def dms(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.PrivateChannel | None, *, priority: Priority | None = ...) -> hikari.PrivateChannel | None:
+            """Retrieve a private channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def dm(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.DMChannel | None, *, priority: Priority | None = ...) -> hikari.DMChannel | None:
+            """Retrieve a DM channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def group(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GroupDMChannel | None, *, priority: Priority | None = ...) -> hikari.GroupDMChannel | None:
+            """Retrieve a group DM channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def textable(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.TextableGuildChannel | None:
+            """Retrieve a textable channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def textables(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
+            """Retrieve textable channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def permissible(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.PermissibleGuildChannel | None:
+            """Retrieve a permissible channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def permissibles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
+            """Retrieve permissible channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def category(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildCategory | None:
+            """Retrieve a category channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def categories(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
+            """Retrieve category channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def voice(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildVoiceChannel | None:
+            """Retrieve a voice channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def voices(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
+            """Retrieve voice channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def stage(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildStageChannel | None:
+            """Retrieve a stage channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def stages(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
+            """Retrieve stage channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def text(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildTextChannel | None:
+            """Retrieve a text channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def texts(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
+            """Retrieve text channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def thread(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildThreadChannel | None:
+            """Retrieve a thread channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def threads(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
+            """Retrieve thread channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def public(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
+            """Retrieve a public thread or news thread from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def publics(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
+            """Retrieve public/news threads from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def private(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPrivateThread | None:
+            """Retrieve a private thread from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def privates(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
+            """Retrieve private threads from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def forum(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildForumChannel | None:
+            """Retrieve a forum channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def forums(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
+            """Retrieve forum channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def news(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildNewsChannel | None:
+            """Retrieve a news channel from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def newses(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
+            """Retrieve news channels from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None, *, priority: Priority | None = ...) -> hikari.Role | None:
+            """Retrieve a role from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def roles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
+            """Retrieve roles belonging to a member or a guild from the cache. If not found, fetch them from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def top_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> hikari.Role | None:
+            """Retrieve the top role of a member or guild from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def booster_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.Role | None:
+            """Retrieve the booster role of a guild from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def role_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> RoleSnapshot | None:
+            """Retrieve the role ranking of a guild from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def emoji(bot: hikari.GatewayBot | hikari.RESTBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ..., *, priority: Priority | None = ...) -> hikari.Emoji | None:
+            """Retrieve an emoji from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+        @staticmethod
+        async def emoji_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> EmojiSnapshot | None:
+            """Retrieve the emojis of a guild from the cache. If not found, fetch it from Discord. Return None if still not found."""
+
+    class Cache:
+        """Retrieve an object from the cache. Return None if not found."""
+
+        @staticmethod
+        async def guild(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.GatewayGuild | None:
+            """Retrieve a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        async def banned(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.GuildBan | None:
+            """Retrieve a ban from the cache. Return None if not found."""
+
+        @staticmethod
+        async def user(bot: hikari.GatewayBot, user: int | hikari.User | None) -> hikari.User | None:
+            """Retrieve a user from the cache. Return None if not found."""
+
+        @staticmethod
+        async def member(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.Member | CompactMember | None:
+            """Retrieve a member from the cache. Return None if not found."""
+
+        @staticmethod
+        async def members(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+            """Retrieve members from the cache. Return None if not found."""
+
+        @staticmethod
+        async def boosters(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+            """Retrieve boosters from the cache. Return None if not found."""
+
+        @staticmethod
+        async def channel(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildChannel | None:
+            """Retrieve a channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def channels(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
+            """Retrieve channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def textable(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.TextableGuildChannel | None:
+            """Retrieve a textable channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def textables(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
+            """Retrieve textable channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def permissible(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.PermissibleGuildChannel | None:
+            """Retrieve a permissible channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def permissibles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
+            """Retrieve permissible channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def category(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildCategory | None:
+            """Retrieve a category channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def categories(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
+            """Retrieve category channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def voice(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildVoiceChannel | None:
+            """Retrieve a voice channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def voices(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
+            """Retrieve voice channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def stage(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildStageChannel | None:
+            """Retrieve a stage channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def stages(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
+            """Retrieve stage channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def text(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildTextChannel | None:
+            """Retrieve a text channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def texts(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
+            """Retrieve text channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def thread(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildThreadChannel | None:
+            """Retrieve a thread channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def threads(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
+            """Retrieve thread channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def public(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
+            """Retrieve a public thread or news thread from the cache. Return None if not found."""
+
+        @staticmethod
+        async def publics(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
+            """Retrieve public/news threads from the cache. Return None if not found."""
+
+        @staticmethod
+        async def private(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPrivateThread | None:
+            """Retrieve a private thread from the cache. Return None if not found."""
+
+        @staticmethod
+        async def privates(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
+            """Retrieve private threads from the cache. Return None if not found."""
+
+        @staticmethod
+        async def forum(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildForumChannel | None:
+            """Retrieve a forum channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def forums(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
+            """Retrieve forum channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def news(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildNewsChannel | None:
+            """Retrieve a news channel from the cache. Return None if not found."""
+
+        @staticmethod
+        async def newses(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
+            """Retrieve news channels from the cache. Return None if not found."""
+
+        @staticmethod
+        async def role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None) -> hikari.Role | None:
+            """Retrieve a role from the cache. Return None if not found."""
+
+        @staticmethod
+        async def roles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
+            """Retrieve roles belonging to a member or a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        async def top_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> hikari.Role | None:
+            """Retrieve the top role of a member or guild from the cache. Return None if not found."""
+
+        @staticmethod
+        async def booster_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.Role | None:
+            """Retrieve the booster role of a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        async def role_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> RoleSnapshot | None:
+            """Retrieve the role ranking of a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        async def emoji(bot: hikari.GatewayBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ...) -> hikari.Emoji | None:
+            """Retrieve an emoji from the cache. Return None if not found."""
+
+        @staticmethod
+        async def emoji_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> EmojiSnapshot | None:
+            """Retrieve the emojis of a guild from the cache. Return None if not found."""
+
+    class Rest:
+        """Retrieve an object by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        def iter_members(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, predicate: typing.Callable[[hikari.Member], bool] | None = ..., priority: Priority | None = ...) -> typing.AsyncIterator[hikari.Member]:
+            """Stream members matching an optional predicate from Discord as each page arrives. Yield nothing if not found."""
+
+        @staticmethod
+        def iter_boosters(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, predicate: typing.Callable[[hikari.Member], bool] | None = ..., priority: Priority | None = ...) -> typing.AsyncIterator[hikari.Member]:
+            """Stream boosters matching an optional predicate from Discord as each page arrives. Yield nothing if not found."""
+
+        @staticmethod
+        def iter_bans(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, predicate: typing.Callable[[hikari.GuildBan], bool] | None = ..., priority: Priority | None = ...) -> typing.AsyncIterator[hikari.GuildBan]:
+            """Stream bans matching an optional predicate from Discord as each page arrives. Yield nothing if not found."""
+
+        @staticmethod
+        async def guild(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.RESTGuild | None:
+            """Retrieve a guild by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def banned(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.GuildBan | None:
+            """Retrieve a ban by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def user(bot: hikari.GatewayBot | hikari.RESTBot, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.User | None:
+            """Retrieve a user by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def member(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.Member | None:
+            """Retrieve a member by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def members(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
+            """Retrieve members by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def boosters(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
+            """Retrieve boosters by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def channel(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildChannel | None:
+            """Retrieve a channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def channels(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
+            """Retrieve channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def dms(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.PrivateChannel | None, *, priority: Priority | None = ...) -> hikari.PrivateChannel | None:
+            """Retrieve a private channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def dm(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.DMChannel | None, *, priority: Priority | None = ...) -> hikari.DMChannel | None:
+            """Retrieve a DM channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def group(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GroupDMChannel | None, *, priority: Priority | None = ...) -> hikari.GroupDMChannel | None:
+            """Retrieve a group DM channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def textable(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.TextableGuildChannel | None:
+            """Retrieve a textable channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def textables(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
+            """Retrieve textable channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def permissible(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.PermissibleGuildChannel | None:
+            """Retrieve a permissible channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def permissibles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
+            """Retrieve permissible channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def category(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildCategory | None:
+            """Retrieve a category channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def categories(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
+            """Retrieve category channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def voice(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildVoiceChannel | None:
+            """Retrieve a voice channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def voices(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
+            """Retrieve voice channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def stage(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildStageChannel | None:
+            """Retrieve a stage channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def stages(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
+            """Retrieve stage channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def text(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildTextChannel | None:
+            """Retrieve a text channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def texts(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
+            """Retrieve text channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def thread(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildThreadChannel | None:
+            """Retrieve a thread channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def threads(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
+            """Retrieve thread channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def public(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
+            """Retrieve a public thread or news thread by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def publics(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
+            """Retrieve public/news threads by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def private(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPrivateThread | None:
+            """Retrieve a private thread by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def privates(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
+            """Retrieve private threads by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def forum(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildForumChannel | None:
+            """Retrieve a forum channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def forums(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
+            """Retrieve forum channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def news(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildNewsChannel | None:
+            """Retrieve a news channel by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def newses(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
+            """Retrieve news channels by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None, *, priority: Priority | None = ...) -> hikari.Role | None:
+            """Retrieve a role by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def roles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
+            """Retrieve roles belonging to a member or a guild by fetching them from Discord. Return None if not found."""
+
+        @staticmethod
+        async def top_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> hikari.Role | None:
+            """Retrieve the top role of a member or guild by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def booster_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.Role | None:
+            """Retrieve the booster role of a guild by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def role_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> RoleSnapshot | None:
+            """Retrieve the role ranking of a guild by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def emoji(bot: hikari.GatewayBot | hikari.RESTBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ..., *, priority: Priority | None = ...) -> hikari.Emoji | None:
+            """Retrieve an emoji by fetching it from Discord. Return None if not found."""
+
+        @staticmethod
+        async def emoji_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> EmojiSnapshot | None:
+            """Retrieve the emojis of a guild by fetching it from Discord. Return None if not found."""
+
+class Mandatory:
+    class Either:
+        """Retrieve an object from the cache or fetch it from Discord if not found. Raise an exception if still not found."""
+
+        @staticmethod
+        async def members_by_ids(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, users: typing.Iterable[int | hikari.User], concurrency: int = ..., timeout: float = ..., priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member | CompactMember]:
+            """Retrieve many members from the cache. Request the rest in chunks from the gateway or fetch them from Discord. Raise an exception if any are not found."""
+
+        @staticmethod
+        async def dm_for_user(bot: hikari.GatewayBot | hikari.RESTBot, user: int | hikari.User | None, priority: Priority | None = ...) -> hikari.DMChannel:
+            """Retrieve the DM channel with a user from the DM cache or open it through Discord if not found. Raise an exception if still not found."""
+
+        @staticmethod
+        async def guild(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.GatewayGuild | hikari.RESTGuild:
+            """Retrieve a guild from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def banned(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.GuildBan:
+            """Retrieve a ban from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def user(bot: hikari.GatewayBot | hikari.RESTBot, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.User:
+            """Retrieve a user from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def member(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.Member | CompactMember:
+            """Retrieve a member from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def members(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember]:
+            """Retrieve members from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def boosters(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember]:
+            """Retrieve boosters from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def channel(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildChannel:
+            """Retrieve a channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def channels(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel]:
+            """Retrieve channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def dms(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.PrivateChannel | None, *, priority: Priority | None = ...) -> hikari.PrivateChannel:
+            """Retrieve a private channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def dm(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.DMChannel | None, *, priority: Priority | None = ...) -> hikari.DMChannel:
+            """Retrieve a DM channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def group(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GroupDMChannel | None, *, priority: Priority | None = ...) -> hikari.GroupDMChannel:
+            """Retrieve a group DM channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def textable(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.TextableGuildChannel:
+            """Retrieve a textable channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def textables(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel]:
+            """Retrieve textable channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def permissible(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.PermissibleGuildChannel:
+            """Retrieve a permissible channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def permissibles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel]:
+            """Retrieve permissible channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def category(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildCategory:
+            """Retrieve a category channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def categories(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory]:
+            """Retrieve category channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def voice(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildVoiceChannel:
+            """Retrieve a voice channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def voices(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel]:
+            """Retrieve voice channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def stage(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildStageChannel:
+            """Retrieve a stage channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def stages(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel]:
+            """Retrieve stage channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def text(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildTextChannel:
+            """Retrieve a text channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def texts(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel]:
+            """Retrieve text channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def thread(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildThreadChannel:
+            """Retrieve a thread channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def threads(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel]:
+            """Retrieve thread channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def public(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPublicThread | hikari.GuildNewsThread:
+            """Retrieve a public thread or news thread from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def publics(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread]:
+            """Retrieve public/news threads from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def private(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPrivateThread:
+            """Retrieve a private thread from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def privates(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread]:
+            """Retrieve private threads from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def forum(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildForumChannel:
+            """Retrieve a forum channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def forums(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel]:
+            """Retrieve forum channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def news(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildNewsChannel:
+            """Retrieve a news channel from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def newses(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel]:
+            """Retrieve news channels from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None, *, priority: Priority | None = ...) -> hikari.Role:
+            """Retrieve a role from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def roles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
+            """Retrieve roles belonging to a member or a guild from the cache. If not found, fetch them from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def top_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> hikari.Role:
+            """Retrieve the top role of a member or guild from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def booster_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.Role:
+            """Retrieve the booster role of a guild from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def role_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> RoleSnapshot:
+            """Retrieve the role ranking of a guild from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def emoji(bot: hikari.GatewayBot | hikari.RESTBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ..., *, priority: Priority | None = ...) -> hikari.Emoji:
+            """Retrieve an emoji from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+        @staticmethod
+        async def emoji_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> EmojiSnapshot:
+            """Retrieve the emojis of a guild from the cache. If not found, fetch it from Discord. Raise an exception if still not found."""
+
+    class Cache:
+        """Retrieve an object from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def guild(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.GatewayGuild:
+            """Retrieve a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def banned(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.GuildBan:
+            """Retrieve a ban from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def user(bot: hikari.GatewayBot, user: int | hikari.User | None) -> hikari.User:
+            """Retrieve a user from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def member(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.Member | CompactMember:
+            """Retrieve a member from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def members(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember]:
+            """Retrieve members from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def boosters(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember]:
+            """Retrieve boosters from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def channel(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildChannel:
+            """Retrieve a channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def channels(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel]:
+            """Retrieve channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def textable(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.TextableGuildChannel:
+            """Retrieve a textable channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def textables(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel]:
+            """Retrieve textable channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def permissible(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.PermissibleGuildChannel:
+            """Retrieve a permissible channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def permissibles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel]:
+            """Retrieve permissible channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def category(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildCategory:
+            """Retrieve a category channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def categories(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory]:
+            """Retrieve category channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def voice(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildVoiceChannel:
+            """Retrieve a voice channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def voices(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel]:
+            """Retrieve voice channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def stage(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildStageChannel:
+            """Retrieve a stage channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def stages(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel]:
+            """Retrieve stage channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def text(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildTextChannel:
+            """Retrieve a text channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def texts(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel]:
+            """Retrieve text channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def thread(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildThreadChannel:
+            """Retrieve a thread channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def threads(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel]:
+            """Retrieve thread channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def public(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPublicThread | hikari.GuildNewsThread:
+            """Retrieve a public thread or news thread from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def publics(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread]:
+            """Retrieve public/news threads from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def private(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPrivateThread:
+            """Retrieve a private thread from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def privates(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread]:
+            """Retrieve private threads from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def forum(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildForumChannel:
+            """Retrieve a forum channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def forums(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel]:
+            """Retrieve forum channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def news(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildNewsChannel:
+            """Retrieve a news channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def newses(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel]:
+            """Retrieve news channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None) -> hikari.Role:
+            """Retrieve a role from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def roles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
+            """Retrieve roles belonging to a member or a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def top_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> hikari.Role:
+            """Retrieve the top role of a member or guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def booster_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.Role:
+            """Retrieve the booster role of a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def role_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> RoleSnapshot:
+            """Retrieve the role ranking of a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def emoji(bot: hikari.GatewayBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ...) -> hikari.Emoji:
+            """Retrieve an emoji from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        async def emoji_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> EmojiSnapshot:
+            """Retrieve the emojis of a guild from the cache. Raise an exception if not found."""
+
+    class Rest:
+        """Retrieve an object by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def guild(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.RESTGuild:
+            """Retrieve a guild by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def banned(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.GuildBan:
+            """Retrieve a ban by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def user(bot: hikari.GatewayBot | hikari.RESTBot, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.User:
+            """Retrieve a user by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def member(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, user: int | hikari.User | None, *, priority: Priority | None = ...) -> hikari.Member:
+            """Retrieve a member by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def members(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
+            """Retrieve members by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def boosters(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Member]:
+            """Retrieve boosters by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def channel(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildChannel:
+            """Retrieve a channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def channels(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel]:
+            """Retrieve channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def dms(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.PrivateChannel | None, *, priority: Priority | None = ...) -> hikari.PrivateChannel:
+            """Retrieve a private channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def dm(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.DMChannel | None, *, priority: Priority | None = ...) -> hikari.DMChannel:
+            """Retrieve a DM channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def group(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GroupDMChannel | None, *, priority: Priority | None = ...) -> hikari.GroupDMChannel:
+            """Retrieve a group DM channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def textable(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.TextableGuildChannel:
+            """Retrieve a textable channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def textables(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel]:
+            """Retrieve textable channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def permissible(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.PermissibleGuildChannel:
+            """Retrieve a permissible channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def permissibles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel]:
+            """Retrieve permissible channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def category(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildCategory:
+            """Retrieve a category channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def categories(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory]:
+            """Retrieve category channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def voice(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildVoiceChannel:
+            """Retrieve a voice channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def voices(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel]:
+            """Retrieve voice channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def stage(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildStageChannel:
+            """Retrieve a stage channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def stages(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel]:
+            """Retrieve stage channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def text(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildTextChannel:
+            """Retrieve a text channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def texts(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel]:
+            """Retrieve text channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def thread(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildThreadChannel:
+            """Retrieve a thread channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def threads(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel]:
+            """Retrieve thread channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def public(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPublicThread | hikari.GuildNewsThread:
+            """Retrieve a public thread or news thread by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def publics(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread]:
+            """Retrieve public/news threads by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def private(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildPrivateThread:
+            """Retrieve a private thread by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def privates(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread]:
+            """Retrieve private threads by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def forum(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildForumChannel:
+            """Retrieve a forum channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def forums(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel]:
+            """Retrieve forum channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def news(bot: hikari.GatewayBot | hikari.RESTBot, channel: int | hikari.GuildChannel | None, *, priority: Priority | None = ...) -> hikari.GuildNewsChannel:
+            """Retrieve a news channel by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def newses(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel]:
+            """Retrieve news channels by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None, *, priority: Priority | None = ...) -> hikari.Role:
+            """Retrieve a role by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def roles(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
+            """Retrieve roles belonging to a member or a guild by fetching them from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def top_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None, *, priority: Priority | None = ...) -> hikari.Role:
+            """Retrieve the top role of a member or guild by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def booster_role(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> hikari.Role:
+            """Retrieve the booster role of a guild by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def role_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> RoleSnapshot:
+            """Retrieve the role ranking of a guild by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def emoji(bot: hikari.GatewayBot | hikari.RESTBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ..., *, priority: Priority | None = ...) -> hikari.Emoji:
+            """Retrieve an emoji by fetching it from Discord. Raise an exception if not found."""
+
+        @staticmethod
+        async def emoji_snapshot(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, *, priority: Priority | None = ...) -> EmojiSnapshot:
+            """Retrieve the emojis of a guild by fetching it from Discord. Raise an exception if not found."""
+
+class Sync:
+    class Cache:
+        """Retrieve an object from the cache without awaiting. Return None if not found."""
+
+        @staticmethod
+        def guild(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.GatewayGuild | None:
+            """Retrieve a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        def banned(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.GuildBan | None:
+            """Retrieve a ban from the cache. Return None if not found."""
+
+        @staticmethod
+        def user(bot: hikari.GatewayBot, user: int | hikari.User | None) -> hikari.User | None:
+            """Retrieve a user from the cache. Return None if not found."""
+
+        @staticmethod
+        def member(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.Member | CompactMember | None:
+            """Retrieve a member from the cache. Return None if not found."""
+
+        @staticmethod
+        def members(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+            """Retrieve members from the cache. Return None if not found."""
+
+        @staticmethod
+        def boosters(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember] | None:
+            """Retrieve boosters from the cache. Return None if not found."""
+
+        @staticmethod
+        def channel(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildChannel | None:
+            """Retrieve a channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def channels(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel] | None:
+            """Retrieve channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def textable(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.TextableGuildChannel | None:
+            """Retrieve a textable channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def textables(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel] | None:
+            """Retrieve textable channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def permissible(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.PermissibleGuildChannel | None:
+            """Retrieve a permissible channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def permissibles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel] | None:
+            """Retrieve permissible channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def category(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildCategory | None:
+            """Retrieve a category channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def categories(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory] | None:
+            """Retrieve category channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def voice(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildVoiceChannel | None:
+            """Retrieve a voice channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def voices(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel] | None:
+            """Retrieve voice channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def stage(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildStageChannel | None:
+            """Retrieve a stage channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def stages(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel] | None:
+            """Retrieve stage channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def text(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildTextChannel | None:
+            """Retrieve a text channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def texts(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel] | None:
+            """Retrieve text channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def thread(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildThreadChannel | None:
+            """Retrieve a thread channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def threads(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel] | None:
+            """Retrieve thread channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def public(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPublicThread | hikari.GuildNewsThread | None:
+            """Retrieve a public thread or news thread from the cache. Return None if not found."""
+
+        @staticmethod
+        def publics(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread] | None:
+            """Retrieve public/news threads from the cache. Return None if not found."""
+
+        @staticmethod
+        def private(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPrivateThread | None:
+            """Retrieve a private thread from the cache. Return None if not found."""
+
+        @staticmethod
+        def privates(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread] | None:
+            """Retrieve private threads from the cache. Return None if not found."""
+
+        @staticmethod
+        def forum(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildForumChannel | None:
+            """Retrieve a forum channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def forums(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel] | None:
+            """Retrieve forum channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def news(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildNewsChannel | None:
+            """Retrieve a news channel from the cache. Return None if not found."""
+
+        @staticmethod
+        def newses(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel] | None:
+            """Retrieve news channels from the cache. Return None if not found."""
+
+        @staticmethod
+        def role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None) -> hikari.Role | None:
+            """Retrieve a role from the cache. Return None if not found."""
+
+        @staticmethod
+        def roles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> typing.Mapping[hikari.Snowflake, hikari.Role] | None:
+            """Retrieve roles belonging to a member or a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        def top_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> hikari.Role | None:
+            """Retrieve the top role of a member or guild from the cache. Return None if not found."""
+
+        @staticmethod
+        def booster_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.Role | None:
+            """Retrieve the booster role of a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        def role_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> RoleSnapshot | None:
+            """Retrieve the role ranking of a guild from the cache. Return None if not found."""
+
+        @staticmethod
+        def emoji(bot: hikari.GatewayBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ...) -> hikari.Emoji | None:
+            """Retrieve an emoji from the cache. Return None if not found."""
+
+        @staticmethod
+        def emoji_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> EmojiSnapshot | None:
+            """Retrieve the emojis of a guild from the cache. Return None if not found."""
+
+    class MandatoryCache:
+        """Retrieve an object from the cache without awaiting. Raise an exception if not found."""
+
+        @staticmethod
+        def guild(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.GatewayGuild:
+            """Retrieve a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def banned(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.GuildBan:
+            """Retrieve a ban from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def user(bot: hikari.GatewayBot, user: int | hikari.User | None) -> hikari.User:
+            """Retrieve a user from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def member(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, user: int | hikari.User | None) -> hikari.Member | CompactMember:
+            """Retrieve a member from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def members(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember]:
+            """Retrieve members from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def boosters(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.Member] | typing.Mapping[hikari.Snowflake, CompactMember]:
+            """Retrieve boosters from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def channel(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildChannel:
+            """Retrieve a channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def channels(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildChannel]:
+            """Retrieve channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def textable(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.TextableGuildChannel:
+            """Retrieve a textable channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def textables(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.TextableGuildChannel]:
+            """Retrieve textable channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def permissible(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.PermissibleGuildChannel:
+            """Retrieve a permissible channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def permissibles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.PermissibleGuildChannel]:
+            """Retrieve permissible channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def category(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildCategory:
+            """Retrieve a category channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def categories(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildCategory]:
+            """Retrieve category channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def voice(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildVoiceChannel:
+            """Retrieve a voice channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def voices(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildVoiceChannel]:
+            """Retrieve voice channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def stage(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildStageChannel:
+            """Retrieve a stage channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def stages(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildStageChannel]:
+            """Retrieve stage channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def text(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildTextChannel:
+            """Retrieve a text channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def texts(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildTextChannel]:
+            """Retrieve text channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def thread(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildThreadChannel:
+            """Retrieve a thread channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def threads(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildThreadChannel]:
+            """Retrieve thread channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def public(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPublicThread | hikari.GuildNewsThread:
+            """Retrieve a public thread or news thread from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def publics(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPublicThread | hikari.GuildNewsThread]:
+            """Retrieve public/news threads from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def private(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildPrivateThread:
+            """Retrieve a private thread from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def privates(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildPrivateThread]:
+            """Retrieve private threads from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def forum(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildForumChannel:
+            """Retrieve a forum channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def forums(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildForumChannel]:
+            """Retrieve forum channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def news(bot: hikari.GatewayBot, channel: int | hikari.GuildChannel | None) -> hikari.GuildNewsChannel:
+            """Retrieve a news channel from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def newses(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> typing.Mapping[hikari.Snowflake, hikari.GuildNewsChannel]:
+            """Retrieve news channels from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, role: int | hikari.Role | None) -> hikari.Role:
+            """Retrieve a role from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def roles(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> typing.Mapping[hikari.Snowflake, hikari.Role]:
+            """Retrieve roles belonging to a member or a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def top_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None, member: int | hikari.Member | CompactMember | None) -> hikari.Role:
+            """Retrieve the top role of a member or guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def booster_role(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> hikari.Role:
+            """Retrieve the booster role of a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def role_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> RoleSnapshot:
+            """Retrieve the role ranking of a guild from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def emoji(bot: hikari.GatewayBot, emoji: int | str | hikari.Emoji | None, guild: int | hikari.Guild | None = ...) -> hikari.Emoji:
+            """Retrieve an emoji from the cache. Raise an exception if not found."""
+
+        @staticmethod
+        def emoji_snapshot(bot: hikari.GatewayBot, guild: int | hikari.Guild | None) -> EmojiSnapshot:
+            """Retrieve the emojis of a guild from the cache. Raise an exception if not found."""
+
+async def resolve_many(bot: hikari.GatewayBot | hikari.RESTBot, requests: typing.Iterable[typing.Sequence[typing.Any]], concurrency: int = ..., priority: Priority | None = ...) -> list[typing.Any]:
+    """Resolve objects of any kind from requests such as `("member", guild, user)` or `("channel", channel)`.
+
+    Duplicate requests are resolved once. Cache hits are served immediately and the rest are fetched from Discord, at most `concurrency` at a time.
+    Return the results in the order requested: the object, None if not found, or the exception raised for that request.
+    """
+
+async def resolve_emojis(bot: hikari.GatewayBot | hikari.RESTBot, guild: int | hikari.Guild | None, emojis: typing.Iterable[int | str | hikari.Emoji], priority: Priority | None = ...) -> list[hikari.Emoji | None]:
+    """Resolve many references to emojis: unicode emojis, and custom emojis of a guild by object, ID, `<:name:id>` mention or case-insensitive name.
+
+    The emojis of the guild come from the cache or, if not found, from a single fetch of all of them. Return the results in the order given, None for those not found.
+    """
+
+async def warm(bot: hikari.GatewayBot | hikari.RESTBot, guild_ids: typing.Iterable[int | hikari.Guild], kinds: typing.Iterable[str] = ..., concurrency: int = ..., progress: typing.Callable[[int, int], None] | None = ..., priority: Priority = ...) -> dict[tuple[hikari.Snowflake, str], Exception]:
+    """Prefetch guilds and their roles, channels and emojis into the resolver cache, attaching one if none is attached.
+
+    At most `concurrency` fetches run at a time, at background priority by default. Roles and emojis come with a guild, so warming them alongside it costs no extra requests, and nothing more is fetched for a guild Discord reports as not found.
+    `progress` is called with the number of lookups done and the total after each one.
+    Return the exception raised by each lookup that failed, keyed by guild ID and kind.
+    """
+
+class Spec:
+    """Describe one kind of object: how to find it in the cache, how to fetch it from Discord and what its resolvers look like.
+
+    - `cache` is a plain function taking the bot and the arguments, or None if the kind can't be found in the cache.
+    - `rest` is a coroutine function taking the bot and the arguments.
+    - `required` is how many leading arguments must be truthy for a lookup to be attempted, by default those without a default.
+    - `cache_returns` and `rest_returns` narrow `returns` for the resolvers which only use one source.
+    """
+
+    name: str
+    noun: str
+    parameters: tuple[inspect.Parameter, ...]
+    returns: typing.Any
+    exception: type[HikariUtilsError]
+    cache: typing.Callable[..., typing.Any] | None
+    rest: typing.Callable[..., typing.Awaitable[typing.Any]]
+    required: int
+    cache_returns: typing.Any
+    rest_returns: typing.Any
+
+    def __init__(
+        self,
+        name: str,
+        noun: str,
+        parameters: tuple[inspect.Parameter, ...],
+        returns: typing.Any,
+        exception: type[HikariUtilsError],
+        cache: typing.Callable[..., typing.Any] | None,
+        rest: typing.Callable[..., typing.Awaitable[typing.Any]],
+        required: int | None = ...,
+        cache_returns: typing.Any = ...,
+        rest_returns: typing.Any = ...,
+    ) -> None: ...
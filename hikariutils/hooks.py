@@ -0,0 +1,150 @@
+import functools
+import time
+import typing
+
+T = typing.TypeVar("T")
+
+
+class HookCall:
+    """One observed call, handed to the `on_start` hooks when it starts and to the `on_end` hooks once it finished.
+
+    - `kind` names what was called, such as `member` for the member resolvers or `perms.resolve_perms`.
+    - `key` holds the arguments it was called with, except the bot.
+    - `path` and `duration` are set when it finishes: how it was answered, see `hikariutils.metrics.PATHS`, and how many seconds it took.
+    - `data` is free for hooks to keep state in between start and end, such as a span.
+    """
+
+    __slots__ = ("kind", "key", "started", "path", "duration", "data")
+
+    def __init__(self, kind: str, key: tuple[typing.Any, ...], started: float) -> None:
+        self.kind = kind
+        self.key = key
+        self.started = started
+        self.path: str | None = None
+        self.duration: float | None = None
+        self.data: dict[str, typing.Any] = {}
+
+    def __repr__(self) -> str:
+        return f"HookCall(kind={self.kind!r}, key={self.key!r}, path={self.path!r}, duration={self.duration!r})"
+
+
+class Hooks:
+    """The callbacks run around every resolver and permission call.
+
+    Hooks run inline and in the order they were registered, so keep them fast. Exceptions they raise propagate to the caller.
+    While none are registered `active` is False, and the calls only pay for checking it.
+    """
+
+    def __init__(self) -> None:
+        self.active = False
+        self._start_hooks: list[typing.Callable[[HookCall], None]] = []
+        self._end_hooks: list[typing.Callable[[HookCall], None]] = []
+
+    def on_start(self, callback: typing.Callable[[HookCall], None]) -> typing.Callable[[HookCall], None]:
+        """Register a callback to run when a call starts. Return the callback, so this can be used as a decorator."""
+        self._start_hooks.append(callback)
+        self.active = True
+        return callback
+
+    def on_end(self, callback: typing.Callable[[HookCall], None]) -> typing.Callable[[HookCall], None]:
+        """Register a callback to run when a call finishes. Return the callback, so this can be used as a decorator."""
+        self._end_hooks.append(callback)
+        self.active = True
+        return callback
+
+    def remove(self, callback: typing.Callable[[HookCall], None]) -> None:
+        """Unregister a callback from both starts and ends."""
+        self._start_hooks = [hook for hook in self._start_hooks if hook != callback]
+        self._end_hooks = [hook for hook in self._end_hooks if hook != callback]
+        self.active = bool(self._start_hooks or self._end_hooks)
+
+    def start(self, kind: str, key: tuple[typing.Any, ...]) -> HookCall:
+        """Start a call and run the `on_start` hooks."""
+        call = HookCall(kind, key, time.perf_counter())
+
+        for hook in self._start_hooks:
+            hook(call)
+
+        return call
+
+    def end(self, call: HookCall, path: str) -> None:
+        """Finish a call and run the `on_end` hooks."""
+        call.path = path
+        call.duration = time.perf_counter() - call.started
+
+        for hook in self._end_hooks:
+            hook(call)
+
+
+HOOKS = Hooks()
+
+
+def on_start(callback: typing.Callable[[HookCall], None]) -> typing.Callable[[HookCall], None]:
+    """Register a callback to run when a resolver or permission call starts."""
+    return HOOKS.on_start(callback)
+
+
+def on_end(callback: typing.Callable[[HookCall], None]) -> typing.Callable[[HookCall], None]:
+    """Register a callback to run when a resolver or permission call finishes."""
+    return HOOKS.on_end(callback)
+
+
+def remove_hook(callback: typing.Callable[[HookCall], None]) -> None:
+    """Unregister a callback."""
+    HOOKS.remove(callback)
+
+
+def traced(kind: str) -> typing.Callable[[typing.Callable[..., typing.Awaitable[T]]], typing.Callable[..., typing.Awaitable[T]]]:
+    """Run the hooks around a coroutine function taking the bot first, ending with the `ok` or `error` path."""
+
+    def decorator(function: typing.Callable[..., typing.Awaitable[T]]) -> typing.Callable[..., typing.Awaitable[T]]:
+        @functools.wraps(function)
+        async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> T:
+            if not HOOKS.active:
+                return await function(*args, **kwargs)
+
+            call = HOOKS.start(kind, (*args[1:], *kwargs.values()))
+
+            try:
+                result = await function(*args, **kwargs)
+            except Exception:
+                HOOKS.end(call, "error")
+                raise
+
+            HOOKS.end(call, "ok")
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def traced_iterator(kind: str) -> typing.Callable[[typing.Callable[..., typing.AsyncIterator[T]]], typing.Callable[..., typing.AsyncIterator[T]]]:
+    """Run the hooks around iterating what a function taking the bot first returns, ending with the `ok` or `error` path once it's exhausted, closed or failed."""
+
+    def decorator(function: typing.Callable[..., typing.AsyncIterator[T]]) -> typing.Callable[..., typing.AsyncIterator[T]]:
+        @functools.wraps(function)
+        async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.AsyncIterator[T]:
+            if not HOOKS.active:
+                async for item in function(*args, **kwargs):
+                    yield item
+
+                return
+
+            call = HOOKS.start(kind, (*args[1:], *kwargs.values()))
+
+            try:
+                async for item in function(*args, **kwargs):
+                    yield item
+            except GeneratorExit:
+                HOOKS.end(call, "ok")
+                raise
+            except Exception:
+                HOOKS.end(call, "error")
+                raise
+
+            HOOKS.end(call, "ok")
+
+        return wrapper
+
+    return decorator
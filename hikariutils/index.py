@@ -0,0 +1,664 @@
+import collections
+import datetime
+import itertools
+import sys
+import types
+import typing
+
+import hikari
+
+from hikariutils.cache import approximate_size
+from hikariutils.errors import InvalidBot
+
+IndexT = typing.TypeVar("IndexT", bound="GatewayIndex")
+
+_SNAPSHOT_VERSIONS = itertools.count(1)
+
+CHANNEL_PARTITIONS: dict[str, tuple[type[hikari.GuildChannel], ...]] = {
+    "channels": (hikari.GuildChannel,),
+    "textables": (hikari.TextableGuildChannel,),
+    "permissibles": (hikari.PermissibleGuildChannel,),
+    "categories": (hikari.GuildCategory,),
+    "voices": (hikari.GuildVoiceChannel,),
+    "stages": (hikari.GuildStageChannel,),
+    "texts": (hikari.GuildTextChannel,),
+    "threads": (hikari.GuildThreadChannel,),
+    "publics": (hikari.GuildPublicThread, hikari.GuildNewsThread),
+    "privates": (hikari.GuildPrivateThread,),
+    "forums": (hikari.GuildForumChannel,),
+    "newses": (hikari.GuildNewsChannel,),
+}
+THREAD_PARTITIONS = frozenset({"threads", "publics", "privates"})
+
+_INDEXES: dict[hikari.GatewayBot | hikari.RESTBot, dict[type["GatewayIndex"], "GatewayIndex"]] = {}
+
+
+class GatewayIndex:
+    """Base class for opt-in lookup structures kept up to date from gateway events."""
+
+    def listeners(self) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+        """Return the event listeners which keep the index up to date."""
+        return []
+
+    def seed(self, bot: hikari.GatewayBot) -> None:
+        """Build the index from what is already in the cache."""
+
+    def clear(self) -> None:
+        """Forget everything in the index."""
+
+    def attach(self, bot: hikari.GatewayBot) -> typing.Self:
+        """Seed the index from the cache, subscribe it to events and let the resolvers use it. Return the index."""
+        if not isinstance(bot, hikari.GatewayBot):
+            raise InvalidBot
+
+        if (previous := get_index(bot, type(self))) is not None:
+            previous.detach(bot)
+
+        self._listeners = self.listeners()
+
+        for event_type, callback in self._listeners:
+            bot.subscribe(event_type, callback)
+
+        self.seed(bot)
+        _INDEXES.setdefault(bot, {})[type(self)] = self
+        return self
+
+    def detach(self, bot: hikari.GatewayBot) -> None:
+        """Unsubscribe the index from events and stop the resolvers from using it."""
+        if _INDEXES.get(bot, {}).get(type(self)) is not self:
+            return
+
+        for event_type, callback in self._listeners:
+            bot.unsubscribe(event_type, callback)
+
+        del _INDEXES[bot][type(self)]
+        self.clear()
+
+
+class RoleSnapshot:
+    """An immutable copy of the roles of a guild, ranked by their position in the hierarchy.
+
+    Every snapshot gets a new, increasing version, so comparing versions tells if the roles were refetched or rebuilt.
+    """
+
+    __slots__ = ("guild_id", "version", "roles", "ranks", "_ordered")
+
+    def __init__(self, guild_id: int | hikari.Guild, roles: typing.Iterable[hikari.Role]) -> None:
+        self.guild_id = hikari.Snowflake(guild_id)
+        self.version = next(_SNAPSHOT_VERSIONS)
+        self._ordered = tuple(sorted(roles, key=lambda role: (role.position, -role.id)))
+        self.roles: typing.Mapping[hikari.Snowflake, hikari.Role] = types.MappingProxyType({role.id: role for role in self._ordered})
+        self.ranks: typing.Mapping[hikari.Snowflake, int] = types.MappingProxyType({role.id: rank for rank, role in enumerate(self._ordered)})
+
+    def __len__(self) -> int:
+        return len(self._ordered)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (RoleSnapshot, (self.guild_id, self._ordered))
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + approximate_size(self._ordered) + sys.getsizeof(self.roles.copy()) + sys.getsizeof(self.ranks.copy())
+
+    def top_role(self, role_ids: typing.Iterable[int] | None = None) -> hikari.Role | None:
+        """Return the highest role out of the given role IDs, or the highest role of the guild if none are given."""
+        if role_ids is None:
+            return self._ordered[-1] if self._ordered else None
+
+        ranks = self.ranks
+        top_rank = max((ranks[role_id] for role_id in role_ids if role_id in ranks), default=None)
+        return self._ordered[top_rank] if top_rank is not None else None
+
+    def booster_role(self) -> hikari.Role | None:
+        """Return the role given to boosters of the guild, if any."""
+        return next((role for role in self._ordered if role.is_premium_subscriber_role), None)
+
+
+class EmojiSnapshot:
+    """An immutable copy of the custom emojis of a guild, looked up by ID or by case-insensitive name.
+
+    When several emojis share a name, the oldest one wins the name. A snapshot of a guild without emojis is still truthy, so it isn't mistaken for a miss.
+    """
+
+    __slots__ = ("guild_id", "emojis", "names")
+
+    def __init__(self, guild_id: int | hikari.Guild, emojis: typing.Iterable[hikari.KnownCustomEmoji]) -> None:
+        self.guild_id = hikari.Snowflake(guild_id)
+        by_id: dict[hikari.Snowflake, hikari.KnownCustomEmoji] = {}
+        by_name: dict[str, hikari.KnownCustomEmoji] = {}
+
+        for emoji in emojis:
+            by_id[emoji.id] = emoji
+
+            if emoji.name and ((named := by_name.get(name := emoji.name.lower())) is None or emoji.id < named.id):
+                by_name[name] = emoji
+
+        self.emojis: typing.Mapping[hikari.Snowflake, hikari.KnownCustomEmoji] = types.MappingProxyType(by_id)
+        self.names: typing.Mapping[str, hikari.KnownCustomEmoji] = types.MappingProxyType(by_name)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (EmojiSnapshot, (self.guild_id, tuple(self.emojis.values())))
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + approximate_size(self.emojis.copy()) + sys.getsizeof(self.names.copy()) + sum(sys.getsizeof(name) for name in self.names)
+
+    def get(self, emoji: int | str | hikari.CustomEmoji) -> hikari.KnownCustomEmoji | None:
+        """Return an emoji of the guild by its ID, or by its name with or without the surrounding colons."""
+        if isinstance(emoji, str):
+            return self.names.get(emoji.strip(":").lower())
+
+        return self.emojis.get(hikari.Snowflake(emoji))
+
+
+class ChannelPartitions:
+    """The channels of a guild split into the partitions of `CHANNEL_PARTITIONS`, each exposed as a read-only view.
+
+    Threads are only placed in the thread partitions, matching what Discord returns for a guild's channels.
+    """
+
+    __slots__ = ("guild_id", "_channel_ids", "_partitions", "_views")
+
+    def __init__(self, guild_id: int | hikari.Guild, channels: typing.Iterable[hikari.GuildChannel] = ()) -> None:
+        self.guild_id = hikari.Snowflake(guild_id)
+        self._channel_ids: set[hikari.Snowflake] = set()
+        self._partitions: dict[str, dict[hikari.Snowflake, hikari.GuildChannel]] = {partition: {} for partition in CHANNEL_PARTITIONS}
+        self._views: dict[str, typing.Mapping[hikari.Snowflake, hikari.GuildChannel]] = {partition: types.MappingProxyType(channels) for partition, channels in self._partitions.items()}
+
+        for channel in channels:
+            self.add(channel)
+
+    def __len__(self) -> int:
+        return len(self._channel_ids)
+
+    def __reduce__(self) -> tuple[typing.Any, ...]:
+        return (ChannelPartitions, (self.guild_id, tuple({channel.id: channel for channels in self._partitions.values() for channel in channels.values()}.values())))
+
+    def __sizeof__(self) -> int:
+        sample = next((channel for channels in self._partitions.values() for channel in channels.values()), None)
+        size = object.__sizeof__(self) + sys.getsizeof(self._channel_ids) + sys.getsizeof(self._partitions) + sys.getsizeof(self._views)
+        size += sum(sys.getsizeof(channels) for channels in self._partitions.values()) + sum(sys.getsizeof(view) for view in self._views.values())
+        return size + len(self._channel_ids) * (approximate_size(sample) if sample is not None else 0)
+
+    def view(self, partition: str) -> typing.Mapping[hikari.Snowflake, typing.Any]:
+        """Return the read-only view of a partition."""
+        return self._views[partition]
+
+    def add(self, channel: hikari.GuildChannel) -> None:
+        """Add a channel to every partition it belongs to, replacing any previous version of it."""
+        self.remove(channel.id)
+        is_thread = isinstance(channel, hikari.GuildThreadChannel)
+        self._channel_ids.add(channel.id)
+
+        for partition, channel_types in CHANNEL_PARTITIONS.items():
+            if (partition in THREAD_PARTITIONS) == is_thread and isinstance(channel, channel_types):
+                self._partitions[partition][channel.id] = channel
+
+    def remove(self, channel: int) -> None:
+        """Remove a channel from every partition."""
+        if (channel_id := hikari.Snowflake(channel)) not in self._channel_ids:
+            return
+
+        self._channel_ids.discard(channel_id)
+
+        for channels in self._partitions.values():
+            channels.pop(channel_id, None)
+
+
+def get_index(bot: hikari.GatewayBot | hikari.RESTBot, index_type: type[IndexT]) -> IndexT | None:
+    """Return the index of a type attached to a bot, if any."""
+    indexes = _INDEXES.get(bot)
+    return typing.cast(IndexT | None, indexes.get(index_type)) if indexes else None
+
+
+class BoosterIndex(GatewayIndex):
+    """The boosters of every guild, kept up to date from member events so lookups don't scan every member."""
+
+    def __init__(self) -> None:
+        self._boosters: dict[hikari.Snowflake, dict[hikari.Snowflake, hikari.Member]] = {}
+        self._views: dict[hikari.Snowflake, typing.Mapping[hikari.Snowflake, hikari.Member]] = {}
+
+    def boosters(self, guild: int | hikari.Guild) -> typing.Mapping[hikari.Snowflake, hikari.Member] | None:
+        """Return a read-only view of the boosters of a guild, or None if the guild hasn't been indexed."""
+        return self._views.get(hikari.Snowflake(guild))
+
+    def seed(self, bot: hikari.GatewayBot) -> None:
+        for guild_id in bot.cache.get_guilds_view():
+            self._add_members(self._guild(guild_id), bot.cache.get_members_view_for_guild(guild_id).values())
+
+    def clear(self) -> None:
+        self._boosters.clear()
+        self._views.clear()
+
+    def listeners(self) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+        async def on_guild(event: hikari.GuildJoinEvent | hikari.GuildAvailableEvent) -> None:
+            self._add_members(self._guild(event.guild_id), event.members.values())
+
+        async def on_guild_leave(event: hikari.GuildLeaveEvent) -> None:
+            self._boosters.pop(event.guild_id, None)
+            self._views.pop(event.guild_id, None)
+
+        # Member events for a guild that was never indexed are ignored, so lookups keep falling back to the gateway cache instead of a partial index.
+        async def on_chunk(event: hikari.MemberChunkEvent) -> None:
+            if (boosters := self._boosters.get(event.guild_id)) is not None:
+                self._add_members(boosters, event.members.values())
+
+        async def on_member(event: hikari.MemberCreateEvent | hikari.MemberUpdateEvent) -> None:
+            if (boosters := self._boosters.get(event.guild_id)) is not None:
+                self._add_members(boosters, [event.member])
+
+        async def on_member_delete(event: hikari.MemberDeleteEvent) -> None:
+            if (boosters := self._boosters.get(event.guild_id)) is not None:
+                boosters.pop(event.user_id, None)
+
+        return [
+            (hikari.GuildJoinEvent, on_guild),
+            (hikari.GuildAvailableEvent, on_guild),
+            (hikari.GuildLeaveEvent, on_guild_leave),
+            (hikari.MemberChunkEvent, on_chunk),
+            (hikari.MemberCreateEvent, on_member),
+            (hikari.MemberUpdateEvent, on_member),
+            (hikari.MemberDeleteEvent, on_member_delete),
+        ]
+
+    def _guild(self, guild_id: hikari.Snowflake) -> dict[hikari.Snowflake, hikari.Member]:
+        if (boosters := self._boosters.get(guild_id)) is None:
+            boosters = self._boosters[guild_id] = {}
+            self._views[guild_id] = types.MappingProxyType(boosters)
+
+        return boosters
+
+    def _add_members(self, boosters: dict[hikari.Snowflake, hikari.Member], members: typing.Iterable[hikari.Member]) -> None:
+        for member in members:
+            if member.premium_since is not None:
+                boosters[member.id] = member
+            else:
+                boosters.pop(member.id, None)
+
+
+class CompactMember:
+    """The parts of a member the resolvers and permission checks need, in a fraction of the memory of a `hikari.Member`.
+
+    Members with the same roles share a single `role_ids` tuple.
+    """
+
+    __slots__ = ("guild_id", "id", "role_ids", "premium_since", "raw_communication_disabled_until", "nickname")
+
+    def __init__(
+        self,
+        guild_id: hikari.Snowflake,
+        id: hikari.Snowflake,
+        role_ids: tuple[hikari.Snowflake, ...],
+        premium_since: datetime.datetime | None,
+        raw_communication_disabled_until: datetime.datetime | None,
+        nickname: str | None,
+    ) -> None:
+        self.guild_id = guild_id
+        self.id = id
+        self.role_ids = role_ids
+        self.premium_since = premium_since
+        self.raw_communication_disabled_until = raw_communication_disabled_until
+        self.nickname = nickname
+
+    def __int__(self) -> int:
+        return int(self.id)
+
+    def communication_disabled_until(self) -> datetime.datetime | None:
+        """Return when the timeout of the member ends, or None if they aren't timed out."""
+        if self.raw_communication_disabled_until is not None and self.raw_communication_disabled_until > datetime.datetime.now(datetime.timezone.utc):
+            return self.raw_communication_disabled_until
+
+        return None
+
+    def __repr__(self) -> str:
+        return f"CompactMember(guild_id={self.guild_id}, id={self.id}, role_ids={self.role_ids!r}, nickname={self.nickname!r})"
+
+
+class MemberIndex(GatewayIndex):
+    """Compact records of the members of every guild, kept up to date from member events.
+
+    While attached, the cache resolvers for members and boosters fall back to `CompactMember` records for members the hikari cache doesn't hold.
+    The memory is only saved if the bot doesn't also cache members, so disable `hikari.api.CacheComponents.MEMBERS` in its cache settings.
+    """
+
+    def __init__(self) -> None:
+        self._members: dict[hikari.Snowflake, dict[hikari.Snowflake, CompactMember]] = {}
+        self._boosters: dict[hikari.Snowflake, dict[hikari.Snowflake, CompactMember]] = {}
+        self._views: dict[hikari.Snowflake, tuple[typing.Mapping[hikari.Snowflake, CompactMember], typing.Mapping[hikari.Snowflake, CompactMember]]] = {}
+        self._role_ids: dict[tuple[hikari.Snowflake, ...], tuple[hikari.Snowflake, ...]] = {}
+        self._role_id_refs: collections.Counter[tuple[hikari.Snowflake, ...]] = collections.Counter()
+
+    def __len__(self) -> int:
+        return sum(len(members) for members in self._members.values())
+
+    def member(self, guild: int | hikari.Guild, user: int | hikari.User) -> CompactMember | None:
+        """Return the record of a member, or None if not found."""
+        members = self._members.get(hikari.Snowflake(guild))
+        return members.get(hikari.Snowflake(user)) if members is not None else None
+
+    def members(self, guild: int | hikari.Guild) -> typing.Mapping[hikari.Snowflake, CompactMember] | None:
+        """Return a read-only view of the members of a guild, or None if the guild hasn't been indexed."""
+        views = self._views.get(hikari.Snowflake(guild))
+        return views[0] if views is not None else None
+
+    def boosters(self, guild: int | hikari.Guild) -> typing.Mapping[hikari.Snowflake, CompactMember] | None:
+        """Return a read-only view of the boosters of a guild, or None if the guild hasn't been indexed."""
+        views = self._views.get(hikari.Snowflake(guild))
+        return views[1] if views is not None else None
+
+    def add(self, member: hikari.Member) -> CompactMember:
+        """Add a member, replacing any previous record of it. Return its record."""
+        members, boosters = self._guild(member.guild_id)
+        role_ids = self._intern(tuple(sorted(member.role_ids)))
+
+        if (previous := members.get(member.id)) is not None:
+            self._release(previous.role_ids)
+
+        compact_member = members[member.id] = CompactMember(member.guild_id, member.id, role_ids, member.premium_since, member.raw_communication_disabled_until, member.nickname)
+
+        if compact_member.premium_since is not None:
+            boosters[member.id] = compact_member
+        else:
+            boosters.pop(member.id, None)
+
+        return compact_member
+
+    def remove(self, guild: int | hikari.Guild, user: int | hikari.User) -> None:
+        """Remove the record of a member."""
+        if (guild_id := hikari.Snowflake(guild)) in self._members and (compact_member := self._members[guild_id].pop(hikari.Snowflake(user), None)) is not None:
+            self._boosters[guild_id].pop(compact_member.id, None)
+            self._release(compact_member.role_ids)
+
+    def seed(self, bot: hikari.GatewayBot) -> None:
+        for guild_id in bot.cache.get_guilds_view():
+            self._guild(guild_id)
+
+            for member in bot.cache.get_members_view_for_guild(guild_id).values():
+                self.add(member)
+
+    def clear(self) -> None:
+        self._members.clear()
+        self._boosters.clear()
+        self._views.clear()
+        self._role_ids.clear()
+        self._role_id_refs.clear()
+
+    def listeners(self) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+        async def on_guild(event: hikari.GuildJoinEvent | hikari.GuildAvailableEvent) -> None:
+            self._guild(event.guild_id)
+
+            for member in event.members.values():
+                self.add(member)
+
+        async def on_guild_leave(event: hikari.GuildLeaveEvent) -> None:
+            for compact_member in self._members.pop(event.guild_id, {}).values():
+                self._release(compact_member.role_ids)
+
+            self._boosters.pop(event.guild_id, None)
+            self._views.pop(event.guild_id, None)
+
+        # As in `BoosterIndex`, member events only update guilds that were indexed in full.
+        async def on_chunk(event: hikari.MemberChunkEvent) -> None:
+            if event.guild_id in self._members:
+                for member in event.members.values():
+                    self.add(member)
+
+        async def on_member(event: hikari.MemberCreateEvent | hikari.MemberUpdateEvent) -> None:
+            if event.guild_id in self._members:
+                self.add(event.member)
+
+        async def on_member_delete(event: hikari.MemberDeleteEvent) -> None:
+            self.remove(event.guild_id, event.user_id)
+
+        return [
+            (hikari.GuildJoinEvent, on_guild),
+            (hikari.GuildAvailableEvent, on_guild),
+            (hikari.GuildLeaveEvent, on_guild_leave),
+            (hikari.MemberChunkEvent, on_chunk),
+            (hikari.MemberCreateEvent, on_member),
+            (hikari.MemberUpdateEvent, on_member),
+            (hikari.MemberDeleteEvent, on_member_delete),
+        ]
+
+    def _guild(self, guild_id: hikari.Snowflake) -> tuple[dict[hikari.Snowflake, CompactMember], dict[hikari.Snowflake, CompactMember]]:
+        if (members := self._members.get(guild_id)) is None:
+            members = self._members[guild_id] = {}
+            boosters = self._boosters[guild_id] = {}
+            self._views[guild_id] = (types.MappingProxyType(members), types.MappingProxyType(boosters))
+
+        return members, self._boosters[guild_id]
+
+    # Role ID tuples are shared between members and counted, so one is dropped once no record holds it.
+    def _intern(self, role_ids: tuple[hikari.Snowflake, ...]) -> tuple[hikari.Snowflake, ...]:
+        role_ids = self._role_ids.setdefault(role_ids, role_ids)
+        self._role_id_refs[role_ids] += 1
+        return role_ids
+
+    def _release(self, role_ids: tuple[hikari.Snowflake, ...]) -> None:
+        if self._role_id_refs[role_ids] <= 1:
+            del self._role_id_refs[role_ids]
+            del self._role_ids[role_ids]
+        else:
+            self._role_id_refs[role_ids] -= 1
+
+
+class BanIndex(GatewayIndex):
+    """The bans of every guild loaded through the resolvers, kept up to date from ban events so checks are set lookups.
+
+    The gateway doesn't send ban lists, so a guild is only indexed once its bans are fetched, see `hikariutils.getfetch.Optional.Either.banned_many`.
+    Bans learned from events have no reason.
+    """
+
+    def __init__(self) -> None:
+        self._bans: dict[hikari.Snowflake, dict[hikari.Snowflake, hikari.GuildBan]] = {}
+        self._views: dict[hikari.Snowflake, typing.Mapping[hikari.Snowflake, hikari.GuildBan]] = {}
+        self._loading: dict[hikari.Snowflake, dict[hikari.Snowflake, hikari.GuildBan | None]] = {}
+        self._loaders: collections.Counter[hikari.Snowflake] = collections.Counter()
+
+    def bans(self, guild: int | hikari.Guild) -> typing.Mapping[hikari.Snowflake, hikari.GuildBan] | None:
+        """Return a read-only view of the bans of a guild keyed by user ID, or None if the guild hasn't been indexed."""
+        return self._views.get(hikari.Snowflake(guild))
+
+    def begin_load(self, guild: int | hikari.Guild) -> None:
+        """Start recording ban events for a guild whose bans are being fetched, to replay them over the fetched bans. Pair every call with `end_load`."""
+        guild_id = hikari.Snowflake(guild)
+        self._loaders[guild_id] += 1
+        self._loading.setdefault(guild_id, {})
+
+    def end_load(self, guild: int | hikari.Guild) -> None:
+        """Finish a fetch started with `begin_load`, whether it succeeded or not. Recording stops once no fetches for the guild are left."""
+        guild_id = hikari.Snowflake(guild)
+        self._loaders[guild_id] -= 1
+
+        if self._loaders[guild_id] <= 0:
+            del self._loaders[guild_id]
+            self._loading.pop(guild_id, None)
+
+    def load(self, guild: int | hikari.Guild, bans: typing.Iterable[hikari.GuildBan]) -> typing.Mapping[hikari.Snowflake, hikari.GuildBan]:
+        """Index the fetched bans of a guild, applying the ban events recorded since `begin_load`. Return the view of its bans, kept if already indexed."""
+        guild_id = hikari.Snowflake(guild)
+
+        if (view := self._views.get(guild_id)) is not None:
+            return view
+
+        guild_bans = self._bans[guild_id] = {ban.user.id: ban for ban in bans}
+
+        for user_id, ban in self._loading.get(guild_id, {}).items():
+            if ban is not None:
+                guild_bans[user_id] = ban
+            else:
+                guild_bans.pop(user_id, None)
+
+        view = self._views[guild_id] = types.MappingProxyType(guild_bans)
+        return view
+
+    def clear(self) -> None:
+        self._bans.clear()
+        self._views.clear()
+        self._loading.clear()
+        self._loaders.clear()
+
+    def listeners(self) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+        async def on_ban(event: hikari.BanCreateEvent) -> None:
+            self._apply(event.guild_id, event.user.id, hikari.GuildBan(reason=None, user=event.user))
+
+        async def on_unban(event: hikari.BanDeleteEvent) -> None:
+            self._apply(event.guild_id, event.user.id, None)
+
+        async def on_guild_leave(event: hikari.GuildLeaveEvent) -> None:
+            self._bans.pop(event.guild_id, None)
+            self._views.pop(event.guild_id, None)
+
+        return [
+            (hikari.BanCreateEvent, on_ban),
+            (hikari.BanDeleteEvent, on_unban),
+            (hikari.GuildLeaveEvent, on_guild_leave),
+        ]
+
+    def _apply(self, guild_id: hikari.Snowflake, user_id: hikari.Snowflake, ban: hikari.GuildBan | None) -> None:
+        if (guild_bans := self._bans.get(guild_id)) is not None:
+            if ban is not None:
+                guild_bans[user_id] = ban
+            else:
+                guild_bans.pop(user_id, None)
+        elif (loading := self._loading.get(guild_id)) is not None:
+            loading[user_id] = ban
+
+
+class RoleIndex(GatewayIndex):
+    """A ranked snapshot of the roles of every guild, rebuilt from the cache only after role events."""
+
+    def __init__(self) -> None:
+        self._bot: hikari.GatewayBot | None = None
+        self._snapshots: dict[hikari.Snowflake, RoleSnapshot] = {}
+
+    def snapshot(self, guild: int | hikari.Guild) -> RoleSnapshot | None:
+        """Return the ranked roles of a guild, or None if the guild has no cached roles."""
+        guild_id = hikari.Snowflake(guild)
+
+        if (snapshot := self._snapshots.get(guild_id)) is not None:
+            return snapshot
+
+        if self._bot is None or not (roles := self._bot.cache.get_roles_view_for_guild(guild_id)):
+            return None
+
+        snapshot = self._snapshots[guild_id] = RoleSnapshot(guild_id, roles.values())
+        return snapshot
+
+    def seed(self, bot: hikari.GatewayBot) -> None:
+        self._bot = bot
+
+    def clear(self) -> None:
+        self._bot = None
+        self._snapshots.clear()
+
+    def listeners(self) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+        async def on_change(event: hikari.RoleCreateEvent | hikari.RoleUpdateEvent | hikari.RoleDeleteEvent | hikari.GuildJoinEvent | hikari.GuildAvailableEvent | hikari.GuildUpdateEvent | hikari.GuildLeaveEvent) -> None:
+            self._snapshots.pop(event.guild_id, None)
+
+        return [
+            (hikari.RoleCreateEvent, on_change),
+            (hikari.RoleUpdateEvent, on_change),
+            (hikari.RoleDeleteEvent, on_change),
+            (hikari.GuildJoinEvent, on_change),
+            (hikari.GuildAvailableEvent, on_change),
+            (hikari.GuildUpdateEvent, on_change),
+            (hikari.GuildLeaveEvent, on_change),
+        ]
+
+
+class EmojiIndex(GatewayIndex):
+    """A snapshot of the custom emojis of every guild, built from the cache on first use and replaced on emoji events.
+
+    Without it, the cache resolvers for emoji snapshots and `hikariutils.getfetch.resolve_emojis` build a new snapshot from the cache on every call, in time linear in the guild's emojis.
+    """
+
+    def __init__(self) -> None:
+        self._bot: hikari.GatewayBot | None = None
+        self._snapshots: dict[hikari.Snowflake, EmojiSnapshot] = {}
+
+    def snapshot(self, guild: int | hikari.Guild) -> EmojiSnapshot | None:
+        """Return the emojis of a guild, or None if the guild isn't cached."""
+        guild_id = hikari.Snowflake(guild)
+
+        if (snapshot := self._snapshots.get(guild_id)) is not None:
+            return snapshot
+
+        if self._bot is None or self._bot.cache.get_guild(guild_id) is None:
+            return None
+
+        snapshot = self._snapshots[guild_id] = EmojiSnapshot(guild_id, self._bot.cache.get_emojis_view_for_guild(guild_id).values())
+        return snapshot
+
+    def seed(self, bot: hikari.GatewayBot) -> None:
+        self._bot = bot
+
+    def clear(self) -> None:
+        self._bot = None
+        self._snapshots.clear()
+
+    def listeners(self) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+        async def on_emojis(event: hikari.EmojisUpdateEvent) -> None:
+            self._snapshots[event.guild_id] = EmojiSnapshot(event.guild_id, event.emojis)
+
+        async def on_change(event: hikari.GuildJoinEvent | hikari.GuildAvailableEvent | hikari.GuildLeaveEvent) -> None:
+            self._snapshots.pop(event.guild_id, None)
+
+        return [
+            (hikari.EmojisUpdateEvent, on_emojis),
+            (hikari.GuildJoinEvent, on_change),
+            (hikari.GuildAvailableEvent, on_change),
+            (hikari.GuildLeaveEvent, on_change),
+        ]
+
+
+class ChannelIndex(GatewayIndex):
+    """The channels and threads of every guild partitioned by type, kept up to date from channel and thread events."""
+
+    def __init__(self) -> None:
+        self._guilds: dict[hikari.Snowflake, ChannelPartitions] = {}
+
+    def partitions(self, guild: int | hikari.Guild) -> ChannelPartitions | None:
+        """Return the partitioned channels of a guild, or None if the guild hasn't been indexed."""
+        return self._guilds.get(hikari.Snowflake(guild))
+
+    def seed(self, bot: hikari.GatewayBot) -> None:
+        for guild_id in bot.cache.get_guilds_view():
+            self._guilds[guild_id] = ChannelPartitions(guild_id, [*bot.cache.get_guild_channels_view_for_guild(guild_id).values(), *bot.cache.get_threads_view_for_guild(guild_id).values()])
+
+    def clear(self) -> None:
+        self._guilds.clear()
+
+    def listeners(self) -> list[tuple[type[hikari.Event], typing.Callable[[typing.Any], typing.Coroutine[typing.Any, typing.Any, None]]]]:
+        async def on_guild(event: hikari.GuildJoinEvent | hikari.GuildAvailableEvent) -> None:
+            self._guilds[event.guild_id] = ChannelPartitions(event.guild_id, [*event.channels.values(), *event.threads.values()])
+
+        async def on_guild_leave(event: hikari.GuildLeaveEvent) -> None:
+            self._guilds.pop(event.guild_id, None)
+
+        # Channel events for a guild that was never indexed are ignored, so lookups keep falling back to the gateway cache instead of partial partitions.
+        async def on_channel(event: hikari.GuildChannelCreateEvent | hikari.GuildChannelUpdateEvent) -> None:
+            if (partitions := self._guilds.get(event.guild_id)) is not None:
+                partitions.add(event.channel)
+
+        async def on_channel_delete(event: hikari.GuildChannelDeleteEvent) -> None:
+            if (partitions := self._guilds.get(event.guild_id)) is not None:
+                partitions.remove(event.channel_id)
+
+        async def on_thread(event: hikari.GuildThreadCreateEvent | hikari.GuildThreadUpdateEvent) -> None:
+            if (partitions := self._guilds.get(event.guild_id)) is not None:
+                partitions.add(event.thread)
+
+        async def on_thread_delete(event: hikari.GuildThreadDeleteEvent) -> None:
+            if (partitions := self._guilds.get(event.guild_id)) is not None:
+                partitions.remove(event.thread_id)
+
+        return [
+            (hikari.GuildJoinEvent, on_guild),
+            (hikari.GuildAvailableEvent, on_guild),
+            (hikari.GuildLeaveEvent, on_guild_leave),
+            (hikari.GuildChannelCreateEvent, on_channel),
+            (hikari.GuildChannelUpdateEvent, on_channel),
+            (hikari.GuildChannelDeleteEvent, on_channel_delete),
+            (hikari.GuildThreadCreateEvent, on_thread),
+            (hikari.GuildThreadUpdateEvent, on_thread),
+            (hikari.GuildThreadDeleteEvent, on_thread_delete),
+        ]
@@ -0,0 +1,149 @@
+import bisect
+import collections
+import typing
+
+from hikariutils.hooks import HookCall, on_end, remove_hook
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.000_01, 0.000_1, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PATHS: tuple[str, ...] = ("local", "cache_hit", "cache_miss", "resolver_cache_hit", "rest_hit", "rest_404", "ok", "error")
+
+
+class Histogram:
+    """A count, sum and bucketed distribution of durations in seconds."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a duration to the distribution."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> dict[float, int]:
+        """Return how many durations were at most each bound, including infinity."""
+        running = 0
+        cumulative: dict[float, int] = {}
+
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            running += count
+            cumulative[bound] = running
+
+        return cumulative
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls in, or 0.0 if nothing was observed."""
+        if not self.count:
+            return 0.0
+
+        target = q * self.count
+
+        for bound, count in self.cumulative().items():
+            if count >= target:
+                return bound
+
+        return float("inf")
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, sum={self.sum:.6f})"
+
+
+class Metrics:
+    """Call counts and latency histograms for every resolver and permission check, split by kind and by the path a call took.
+
+    - `local` is a lookup answered from its arguments alone, such as a unicode emoji, without touching any cache or Discord.
+    - `cache_hit` and `cache_miss` are lookups answered by the gateway cache.
+    - `resolver_cache_hit` is a lookup answered by the resolver cache without fetching, with the object or a not found record.
+    - `rest_hit` and `rest_404` are lookups that went on to fetch from Discord and found the object or not.
+    - `ok` is a permission check or a bulk call, such as `resolve_many`, that returned and `error` is any call that raised.
+
+    Calls are recorded through an `on_end` hook once `enable` is called. Until then the resolvers only pay for checking whether any hook is registered.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.enabled = False
+        self._buckets = buckets
+        self._histograms: dict[tuple[str, str], Histogram] = collections.defaultdict(lambda: Histogram(self._buckets))
+
+    def observe(self, kind: str, path: str, seconds: float) -> None:
+        """Record one call of a kind that took a path and lasted some seconds."""
+        self._histograms[(kind, path)].observe(seconds)
+
+    def histogram(self, kind: str, path: str) -> Histogram | None:
+        """Return the histogram of a kind and path, if any calls were recorded."""
+        return self._histograms.get((kind, path))
+
+    def snapshot(self) -> dict[str, dict[str, Histogram]]:
+        """Return a copy of every histogram, keyed by kind and then by path."""
+        snapshot: dict[str, dict[str, Histogram]] = {}
+
+        for (kind, path), histogram in self._histograms.items():
+            copied = snapshot.setdefault(kind, {})[path] = Histogram(histogram.bounds)
+            copied.counts = list(histogram.counts)
+            copied.count = histogram.count
+            copied.sum = histogram.sum
+
+        return snapshot
+
+    def reset(self) -> None:
+        """Forget every recorded call."""
+        self._histograms.clear()
+
+
+METRICS = Metrics()
+
+
+def enable() -> Metrics:
+    """Start recording resolver and permission calls. Return the recorder."""
+    if not METRICS.enabled:
+        on_end(_record)
+        METRICS.enabled = True
+
+    return METRICS
+
+
+def disable() -> None:
+    """Stop recording resolver and permission calls. What was recorded is kept."""
+    remove_hook(_record)
+    METRICS.enabled = False
+
+
+def snapshot() -> dict[str, dict[str, Histogram]]:
+    """Return a copy of every histogram recorded, keyed by kind and then by path."""
+    return METRICS.snapshot()
+
+
+def format_prometheus(
+    snapshot: typing.Mapping[str, typing.Mapping[str, Histogram]] | None = None,
+    prefix: str = "hikariutils",
+) -> str:
+    """Render a snapshot, or the current one if none is given, in the Prometheus text exposition format."""
+    snapshot = snapshot if snapshot is not None else METRICS.snapshot()
+    calls = [f"# HELP {prefix}_resolver_calls_total Resolver and permission calls by kind and path.", f"# TYPE {prefix}_resolver_calls_total counter"]
+    durations = [f"# HELP {prefix}_resolver_duration_seconds Resolver and permission call latency by kind and path.", f"# TYPE {prefix}_resolver_duration_seconds histogram"]
+
+    for kind, paths in sorted(snapshot.items()):
+        for path, histogram in sorted(paths.items()):
+            labels = f'kind="{_escape(kind)}",path="{_escape(path)}"'
+            calls.append(f"{prefix}_resolver_calls_total{{{labels}}} {histogram.count}")
+
+            for bound, count in histogram.cumulative().items():
+                durations.append(f'{prefix}_resolver_duration_seconds_bucket{{{labels},le="{"+Inf" if bound == float("inf") else repr(bound)}"}} {count}')
+
+            durations.append(f"{prefix}_resolver_duration_seconds_sum{{{labels}}} {histogram.sum!r}")
+            durations.append(f"{prefix}_resolver_duration_seconds_count{{{labels}}} {histogram.count}")
+
+    return "\n".join([*calls, *durations]) + "\n"
+
+
+def _record(call: HookCall) -> None:
+    METRICS.observe(call.kind, typing.cast(str, call.path), typing.cast(float, call.duration))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
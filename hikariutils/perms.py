@@ -1,30 +1,42 @@
 import hikari
 
+from hikariutils.errors import MandatoryRoleNotFound
 from hikariutils.getfetch import Mandatory
+from hikariutils.hooks import traced
+from hikariutils.index import RoleSnapshot
 
 
+@traced("perms.is_above")
 async def is_above(
     bot: hikari.GatewayBot,
     first: hikari.Member | hikari.Role,
     second: hikari.Member | hikari.Role,
 ) -> bool:
     """Check if the first member is above the second member in the hierarchy."""
-    first_role = await Mandatory.Either.role(bot, first.guild_id, first.id) if isinstance(first, hikari.Role) else await Mandatory.Either.top_role(bot, first.guild_id, first.id)
-    second_role = await Mandatory.Either.role(bot, second.guild_id, second.id) if isinstance(second, hikari.Role) else await Mandatory.Either.top_role(bot, second.guild_id, second.id)
+    first_snapshot = await Mandatory.Either.role_snapshot(bot, first.guild_id)
+    second_snapshot = first_snapshot if second.guild_id == first.guild_id else await Mandatory.Either.role_snapshot(bot, second.guild_id)
+    first_role = await _hierarchy_role(bot, first_snapshot, first)
+    second_role = await _hierarchy_role(bot, second_snapshot, second)
     return first_role.position > second_role.position
 
 
+@traced("perms.resolve_perms")
 async def resolve_perms(
     bot: hikari.GatewayBot,
     member: hikari.Member,
     channel: hikari.GuildChannel | None = None,
 ) -> hikari.Permissions:
     """Resolve the permissions for a member in a guild."""
-    base_role = await Mandatory.Either.role(bot, member.guild_id, member.guild_id)
-    member_roles = await Mandatory.Either.roles(bot, member.guild_id, member.id)
+    role_snapshot = await Mandatory.Either.role_snapshot(bot, member.guild_id)
+    resolved_member = await Mandatory.Either.member(bot, member.guild_id, member.id)
+
+    if not (base_role := role_snapshot.roles.get(member.guild_id)):
+        raise MandatoryRoleNotFound
+
+    member_roles = [role_snapshot.roles[role_id] for role_id in resolved_member.role_ids if role_id in role_snapshot.roles]
     permissions = base_role.permissions
 
-    for role in member_roles.values():
+    for role in member_roles:
         permissions |= role.permissions
 
     if permissions & hikari.Permissions.ADMINISTRATOR:
@@ -39,7 +51,7 @@ async def resolve_perms(
     everyone_overwrite = channel_overwrites.get(member.guild_id)
     role_overwrites = everyone_overwrite if everyone_overwrite else hikari.PermissionOverwrite(id=member.guild_id, type=hikari.PermissionOverwriteType.ROLE)
 
-    for role in member_roles.values():
+    for role in member_roles:
         if role_overwrite := channel_overwrites.get(role.id):
             role_overwrites.deny |= role_overwrite.deny
             role_overwrites.allow |= role_overwrite.allow
@@ -54,6 +66,7 @@ async def resolve_perms(
     return permissions
 
 
+@traced("perms.can_timeout")
 async def can_timeout(
     bot: hikari.GatewayBot,
     moderator: hikari.Member,
@@ -77,6 +90,7 @@ async def can_timeout(
     return False
 
 
+@traced("perms.can_kick")
 async def can_kick(
     bot: hikari.GatewayBot,
     moderator: hikari.Member,
@@ -104,6 +118,7 @@ async def can_kick(
     return False
 
 
+@traced("perms.can_ban")
 async def can_ban(
     bot: hikari.GatewayBot,
     moderator: hikari.Member,
@@ -129,3 +144,20 @@ async def can_ban(
         return await is_above(bot, moderator, target)
 
     return False
+
+
+async def _hierarchy_role(
+    bot: hikari.GatewayBot,
+    role_snapshot: RoleSnapshot,
+    entity: hikari.Member | hikari.Role,
+) -> hikari.Role:
+    if isinstance(entity, hikari.Role):
+        resolved_role = role_snapshot.roles.get(entity.id)
+    else:
+        resolved_member = await Mandatory.Either.member(bot, entity.guild_id, entity.id)
+        resolved_role = role_snapshot.top_role(resolved_member.role_ids)
+
+    if not resolved_role:
+        raise MandatoryRoleNotFound
+
+    return resolved_role
@@ -0,0 +1,259 @@
+import asyncio
+import bisect
+import collections
+import contextlib
+import contextvars
+import enum
+import operator
+import time
+import typing
+
+import hikari
+
+T = typing.TypeVar("T")
+
+
+class Priority(enum.IntEnum):
+    """How urgently a REST call is needed. Lower values are started first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+_PRIORITY: contextvars.ContextVar[Priority] = contextvars.ContextVar("hikariutils_priority", default=Priority.NORMAL)
+
+
+class SchedulerStats:
+    """Queue depth and wait time counters for a single priority."""
+
+    __slots__ = ("queued", "running", "started", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.queued = 0
+        self.running = 0
+        self.started = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """The average seconds a call waited before starting, or 0.0 if none started."""
+        return self.total_wait / self.started if self.started else 0.0
+
+    def __repr__(self) -> str:
+        return f"SchedulerStats(queued={self.queued}, running={self.running}, started={self.started}, mean_wait={self.mean_wait:.6f}, max_wait={self.max_wait:.6f})"
+
+
+class _Waiter:
+    __slots__ = ("route", "future", "queued_at", "priority", "key")
+
+    def __init__(self, route: str, future: asyncio.Future[None], queued_at: float, priority: Priority, key: typing.Hashable | None) -> None:
+        self.route = route
+        self.future = future
+        self.queued_at = queued_at
+        self.priority = priority
+        self.key = key
+
+
+class RestScheduler:
+    """Start REST calls in priority order while capping how many run at once, overall and per route.
+
+    - `max_concurrency` is the maximum number of calls running across all routes.
+    - `route_limits` caps individual routes, falling back to `default_route_limit`, or no cap if that is None.
+
+    A call only waits if its route or the scheduler is at its cap. When a slot frees up it goes to the
+    highest priority call whose route has room, oldest first. A waiting call given a key can be moved to a
+    higher priority with `promote`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 50,
+        route_limits: typing.Mapping[str, int] | None = None,
+        default_route_limit: int | None = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._route_limits: dict[str, int] = dict(route_limits or {})
+        self._default_route_limit = default_route_limit
+        self._clock = clock
+        self._running = 0
+        self._route_running: collections.Counter[str] = collections.Counter()
+        self._queues: dict[str, dict[Priority, collections.deque[_Waiter]]] = {}
+        self._stats: dict[Priority, SchedulerStats] = {priority: SchedulerStats() for priority in Priority}
+        self._keyed: dict[typing.Hashable, _Waiter] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of calls waiting to start."""
+        return sum(len(queue) for queues in self._queues.values() for queue in queues.values())
+
+    @property
+    def running(self) -> int:
+        """The number of calls currently running."""
+        return self._running
+
+    def route_limit(self, route: str) -> int | None:
+        """Return the maximum number of concurrent calls for a route, or None if it is uncapped."""
+        return self._route_limits.get(route, self._default_route_limit)
+
+    async def run(
+        self,
+        route: str,
+        fetcher: typing.Callable[[], typing.Awaitable[T]],
+        priority: Priority | None = None,
+        key: typing.Hashable | None = None,
+    ) -> T:
+        """Run a call once a slot is free. The priority defaults to the one set for the current context, see `use_priority`.
+
+        While the call waits, a key identifies it to `promote`.
+        """
+        priority = _PRIORITY.get() if priority is None else priority
+
+        if self._can_start(route):
+            self._acquire(route, self._stats[priority], 0.0)
+        else:
+            waiter = _Waiter(route, asyncio.get_running_loop().create_future(), self._clock(), priority, key)
+            self._queue(route, priority).append(waiter)
+            self._stats[priority].queued += 1
+
+            if key is not None:
+                self._keyed[key] = waiter
+
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    self._release(route, self._stats[waiter.priority])
+                elif waiter in (queue := self._queue(route, waiter.priority)):
+                    queue.remove(waiter)
+                    self._stats[waiter.priority].queued -= 1
+                    self._forget(waiter)
+
+                raise
+
+            priority = waiter.priority
+
+        try:
+            return await fetcher()
+        finally:
+            self._release(route, self._stats[priority])
+
+    def promote(self, key: typing.Hashable, priority: Priority) -> bool:
+        """Move the waiting call with a key up to a priority if it is queued at a lower one. Return whether it was moved."""
+        if (waiter := self._keyed.get(key)) is None or waiter.priority <= priority:
+            return False
+
+        self._queue(waiter.route, waiter.priority).remove(waiter)
+        self._stats[waiter.priority].queued -= 1
+        waiter.priority = priority
+        bisect.insort(self._queue(waiter.route, priority), waiter, key=operator.attrgetter("queued_at"))
+        self._stats[priority].queued += 1
+        return True
+
+    def stats(self) -> dict[Priority, SchedulerStats]:
+        """Return the statistics for every priority."""
+        return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """Reset the wait time counters to zero. Queued and running counts are kept."""
+        for stats in self._stats.values():
+            stats.started = 0
+            stats.total_wait = 0.0
+            stats.max_wait = 0.0
+
+    def _can_start(self, route: str) -> bool:
+        return self._running < self._max_concurrency and self._has_room(route)
+
+    def _has_room(self, route: str) -> bool:
+        return (limit := self.route_limit(route)) is None or self._route_running[route] < limit
+
+    def _queue(self, route: str, priority: Priority) -> collections.deque[_Waiter]:
+        if (queues := self._queues.get(route)) is None:
+            queues = self._queues[route] = {priority: collections.deque() for priority in Priority}
+
+        return queues[priority]
+
+    def _acquire(self, route: str, stats: SchedulerStats, waited: float) -> None:
+        self._running += 1
+        self._route_running[route] += 1
+        stats.running += 1
+        stats.started += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+    def _release(self, route: str, stats: SchedulerStats) -> None:
+        self._running -= 1
+        self._route_running[route] -= 1
+        stats.running -= 1
+        self._dispatch()
+
+    # Waiters are queued by route, then priority, so a slot only compares the oldest waiter of each priority on each route with room,
+    # however many are queued behind them.
+    def _dispatch(self) -> None:
+        while self._running < self._max_concurrency:
+            chosen: collections.deque[_Waiter] | None = None
+
+            for route, queues in list(self._queues.items()):
+                for priority, queue in queues.items():
+                    while queue and queue[0].future.cancelled():
+                        self._stats[priority].queued -= 1
+                        self._forget(queue.popleft())
+
+                if not any(queues.values()):
+                    del self._queues[route]
+                elif self._has_room(route):
+                    queue = next(queue for queue in queues.values() if queue)
+
+                    if chosen is None or (queue[0].priority, queue[0].queued_at) < (chosen[0].priority, chosen[0].queued_at):
+                        chosen = queue
+
+            if chosen is None:
+                return
+
+            waiter = chosen.popleft()
+            stats = self._stats[waiter.priority]
+            stats.queued -= 1
+            self._forget(waiter)
+            self._acquire(waiter.route, stats, self._clock() - waiter.queued_at)
+            waiter.future.set_result(None)
+
+    def _forget(self, waiter: _Waiter) -> None:
+        if waiter.key is not None and self._keyed.get(waiter.key) is waiter:
+            del self._keyed[waiter.key]
+
+
+@contextlib.contextmanager
+def use_priority(value: Priority) -> typing.Iterator[None]:
+    """Run the resolver calls made inside the block, and the fetches they start, at a priority."""
+    token = _PRIORITY.set(value)
+
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def current_priority() -> Priority:
+    """Return the priority resolver calls made now would run at."""
+    return _PRIORITY.get()
+
+
+_SCHEDULERS: dict[hikari.GatewayBot | hikari.RESTBot, RestScheduler] = {}
+
+
+def attach_scheduler(bot: hikari.GatewayBot | hikari.RESTBot, scheduler: RestScheduler | None = None) -> RestScheduler:
+    """Route every fetch the resolvers make for a bot through a scheduler. Return the attached scheduler."""
+    resolved_scheduler = _SCHEDULERS[bot] = scheduler if scheduler is not None else RestScheduler()
+    return resolved_scheduler
+
+
+def detach_scheduler(bot: hikari.GatewayBot | hikari.RESTBot) -> RestScheduler | None:
+    """Stop scheduling fetches for a bot. Return the previously attached scheduler, if any."""
+    return _SCHEDULERS.pop(bot, None)
+
+
+def get_scheduler(bot: hikari.GatewayBot | hikari.RESTBot) -> RestScheduler | None:
+    """Return the scheduler attached to a bot, if any."""
+    return _SCHEDULERS.get(bot)
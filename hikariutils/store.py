@@ -0,0 +1,339 @@
+import asyncio
+import collections.abc
+import contextlib
+import io
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing
+
+import hikari
+
+from hikariutils.cache import CacheBackend, ResolverCache, attach_cache, detach_cache, get_cache
+
+DEFAULT_KINDS: tuple[str, ...] = ("guild", "user", "channel", "channels", "roles")
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SnapshotStore:
+    """A SQLite file keeping the objects the resolvers fetched across restarts, keyed by kind and snowflake along with when each was stored.
+
+    - `kinds` are the kinds of object kept, by default guilds, users, channels and role rankings.
+    - `max_age` is how many seconds old a snapshot may be and still be restored.
+    - `load` reads the file in a thread, and snapshots are only unpickled once restored.
+    - Writes are queued in memory and written in batches by `flush`, also in a thread.
+
+    Objects are pickled with every reference to the bot left out, so only open files this bot wrote.
+    """
+
+    def __init__(
+        self,
+        bot: hikari.GatewayBot | hikari.RESTBot,
+        path: str | os.PathLike[str],
+        kinds: typing.Iterable[str] = DEFAULT_KINDS,
+        max_age: float = 3600.0,
+        clock: typing.Callable[[], float] = time.time,
+    ) -> None:
+        self._bot = bot
+        self._path = path
+        self._kinds = frozenset(kinds)
+        self._max_age = max_age
+        self._clock = clock
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._snapshots: dict[tuple[str, typing.Hashable], tuple[float, bytes]] = {}
+        self._pending: dict[tuple[str, typing.Hashable], tuple[float, typing.Any] | None] = {}
+        self._cleared_kinds: set[str] = set()
+        self._flusher: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    @property
+    def kinds(self) -> frozenset[str]:
+        """The kinds of object kept."""
+        return self._kinds
+
+    @property
+    def pending(self) -> int:
+        """The number of writes waiting for the next flush."""
+        return len(self._pending) + len(self._cleared_kinds)
+
+    async def load(self) -> int:
+        """Read the snapshots young enough to restore, dropping older ones from the file. Return how many were read."""
+        rows = await asyncio.to_thread(self._read, self._clock() - self._max_age)
+
+        for kind, key, stored_at, value in rows:
+            if (kind, entry_key := _decode_key(key)) not in self._pending:
+                self._snapshots[(kind, entry_key)] = (stored_at, value)
+
+        return len(rows)
+
+    def restore(self, kind: str, key: typing.Hashable) -> tuple[typing.Any, float] | None:
+        """Return a loaded snapshot along with how many seconds ago it was stored and forget it, or None if there is none young enough or it can't be unpickled."""
+        if (snapshot := self._snapshots.pop((kind, key), None)) is None or (age := self._clock() - snapshot[0]) >= self._max_age:
+            return None
+
+        try:
+            return _Unpickler(io.BytesIO(snapshot[1]), self._bot).load(), max(age, 0.0)
+        except Exception:
+            _LOGGER.debug("Dropping the %s snapshot %r, it can't be unpickled", kind, key, exc_info=True)
+            return None
+
+    def put(self, kind: str, key: typing.Hashable, value: typing.Any, age: float = 0.0) -> None:
+        """Queue an object fetched `age` seconds ago to be written, if its kind is kept."""
+        if kind in self._kinds:
+            self._snapshots.pop((kind, key), None)
+            self._pending[(kind, key)] = (self._clock() - age, value)
+
+    def delete(self, kind: str, key: typing.Hashable | None = None) -> None:
+        """Queue a single snapshot, or every one of a kind if no key is given, to be deleted."""
+        if kind not in self._kinds:
+            return
+
+        if key is not None:
+            self._snapshots.pop((kind, key), None)
+            self._pending[(kind, key)] = None
+            return
+
+        self._cleared_kinds.add(kind)
+
+        for entry_key in [entry_key for entry_key in self._snapshots if entry_key[0] == kind]:
+            del self._snapshots[entry_key]
+
+        for entry_key in [entry_key for entry_key in self._pending if entry_key[0] == kind]:
+            del self._pending[entry_key]
+
+    async def flush(self) -> None:
+        """Write every queued change in one transaction.
+
+        If the transaction fails, each change is written on its own instead. Changes that can't be pickled or written are logged and dropped, so one bad
+        object doesn't hold back the rest. Changes are only queued again if the flush is cancelled.
+        """
+        if not self._pending and not self._cleared_kinds:
+            return
+
+        pending, self._pending = self._pending, {}
+        cleared_kinds, self._cleared_kinds = self._cleared_kinds, set()
+
+        try:
+            await asyncio.to_thread(self._write, cleared_kinds, pending)
+        except asyncio.CancelledError:
+            self._pending = {**pending, **self._pending}
+            self._cleared_kinds |= cleared_kinds
+            raise
+
+    def start(self, interval: float = 5.0) -> None:
+        """Flush every `interval` seconds in the background until closed."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically(interval))
+
+    async def close(self) -> None:
+        """Stop flushing in the background, write what is still queued and close the file."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+
+            self._flusher = None
+
+        await self.flush()
+        await asyncio.to_thread(self._close)
+
+    async def _flush_periodically(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+
+            try:
+                await self.flush()
+            except Exception:
+                _LOGGER.exception("Flushing the snapshot store failed")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS snapshots (kind TEXT NOT NULL, key TEXT NOT NULL, stored_at REAL NOT NULL, value BLOB NOT NULL, PRIMARY KEY (kind, key))")
+
+        return self._connection
+
+    def _read(self, oldest: float) -> list[tuple[str, str, float, bytes]]:
+        with self._lock:
+            connection = self._connect()
+
+            with connection:
+                connection.execute("DELETE FROM snapshots WHERE stored_at <= ?", (oldest,))
+
+            return connection.execute("SELECT kind, key, stored_at, value FROM snapshots").fetchall()
+
+    def _write(self, cleared_kinds: set[str], pending: dict[tuple[str, typing.Hashable], tuple[float, typing.Any] | None]) -> None:
+        changes: list[tuple[str, tuple[typing.Any, ...]]] = [("DELETE FROM snapshots WHERE kind = ?", (kind,)) for kind in cleared_kinds]
+
+        for (kind, key), snapshot in pending.items():
+            buffer = io.BytesIO()
+
+            try:
+                encoded_key = _encode_key(key)
+
+                if snapshot is not None:
+                    _Pickler(buffer, self._bot).dump(snapshot[1])
+            except Exception:
+                _LOGGER.warning("Dropping the %s snapshot %r, it can't be encoded", kind, key, exc_info=True)
+                continue
+
+            if snapshot is None:
+                changes.append(("DELETE FROM snapshots WHERE kind = ? AND key = ?", (kind, encoded_key)))
+            else:
+                changes.append(("INSERT OR REPLACE INTO snapshots (kind, key, stored_at, value) VALUES (?, ?, ?, ?)", (kind, encoded_key, snapshot[0], buffer.getvalue())))
+
+        with self._lock:
+            try:
+                connection = self._connect()
+
+                with connection:
+                    for statement, parameters in changes:
+                        connection.execute(statement, parameters)
+
+                return
+            except sqlite3.Error:
+                _LOGGER.warning("Writing %d snapshot changes at once failed, writing them one by one", len(changes), exc_info=True)
+
+            for statement, parameters in changes:
+                try:
+                    connection = self._connect()
+
+                    with connection:
+                        connection.execute(statement, parameters)
+                except sqlite3.Error:
+                    _LOGGER.warning("Dropping the snapshot change %r on %s, it can't be written", statement, parameters[:2], exc_info=True)
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class PersistentCache:
+    """A cache backend serving objects from an in-memory cache first and restoring them from a snapshot store second.
+
+    Everything cached is also queued for the store, and invalidations and not found records delete from it.
+    """
+
+    def __init__(self, store: SnapshotStore, cache: CacheBackend | None = None) -> None:
+        self.store = store
+        self.cache = cache if cache is not None else ResolverCache()
+
+    def __contains__(self, item: tuple[str, typing.Hashable]) -> bool:
+        return isinstance(self.cache, collections.abc.Container) and item in self.cache
+
+    def get(self, kind: str, key: typing.Hashable) -> typing.Any | None:
+        """Return an object from the in-memory cache, or restore it from the store if not found.
+
+        A restored object keeps the age it was stored with, so it goes stale and expires when it would have. One already past its max age is dropped from the store.
+        """
+        if (cached := self.cache.get(kind, key)) is not None or (restored := self.store.restore(kind, key)) is None:
+            return cached
+
+        self.cache.set(kind, key, restored[0], restored[1])
+
+        if (cached := self.cache.get(kind, key)) is None:
+            self.store.delete(kind, key)
+
+        return cached
+
+    def is_stale(self, kind: str, key: typing.Hashable) -> bool:
+        """Check if a cached object should be refreshed."""
+        return self.cache.is_stale(kind, key)
+
+    def set(self, kind: str, key: typing.Hashable, value: typing.Any, age: float = 0.0) -> None:
+        """Store an object fetched `age` seconds ago in the in-memory cache and queue it for the store."""
+        self.cache.set(kind, key, value, age)
+        self.store.put(kind, key, value, age)
+
+    def invalidate(self, kind: str, key: typing.Hashable | None = None) -> None:
+        """Remove a single object, or every one of a kind if no key is given, from both the in-memory cache and the store."""
+        self.cache.invalidate(kind, key)
+        self.store.delete(kind, key)
+
+    def is_missing(self, kind: str, key: typing.Hashable) -> bool:
+        """Check if Discord recently reported an object as not found."""
+        return self.cache.is_missing(kind, key)
+
+    def set_missing(self, kind: str, key: typing.Hashable) -> None:
+        """Remember that Discord reported an object as not found and delete it from the store."""
+        self.cache.set_missing(kind, key)
+        self.store.delete(kind, key)
+
+
+class _Pickler(pickle.Pickler):
+    def __init__(self, file: typing.IO[bytes], bot: hikari.GatewayBot | hikari.RESTBot) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._bot = bot
+
+    def persistent_id(self, obj: typing.Any) -> str | None:
+        return "bot" if obj is self._bot else None
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, file: typing.IO[bytes], bot: hikari.GatewayBot | hikari.RESTBot) -> None:
+        super().__init__(file)
+        self._bot = bot
+
+    def persistent_load(self, pid: typing.Any) -> typing.Any:
+        if pid != "bot":
+            raise pickle.UnpicklingError(f"Unknown persistent ID {pid!r}")
+
+        return self._bot
+
+
+def _encode_key(key: typing.Hashable) -> str:
+    return json.dumps(key)
+
+
+def _decode_key(key: str) -> typing.Hashable:
+    decoded = json.loads(key)
+    return tuple(decoded) if isinstance(decoded, list) else decoded
+
+
+_STORES: dict[hikari.GatewayBot | hikari.RESTBot, SnapshotStore] = {}
+
+
+async def attach_store(
+    bot: hikari.GatewayBot | hikari.RESTBot,
+    path: str | os.PathLike[str],
+    cache: CacheBackend | None = None,
+    kinds: typing.Iterable[str] = DEFAULT_KINDS,
+    max_age: float = 3600.0,
+    flush_interval: float = 5.0,
+) -> SnapshotStore:
+    """Back the resolver cache of a bot with a snapshot store, loading what an earlier run stored and flushing every `flush_interval` seconds. Return the attached store."""
+    await detach_store(bot)
+    store = _STORES[bot] = SnapshotStore(bot, path, kinds, max_age)
+    await store.load()
+    attach_cache(bot, PersistentCache(store, cache))
+    store.start(flush_interval)
+    return store
+
+
+async def detach_store(bot: hikari.GatewayBot | hikari.RESTBot) -> SnapshotStore | None:
+    """Flush and close the snapshot store of a bot and detach the cache in front of it. Return the previously attached store, if any."""
+    if (store := _STORES.pop(bot, None)) is None:
+        return None
+
+    if isinstance(resolved_cache := get_cache(bot), PersistentCache) and resolved_cache.store is store:
+        detach_cache(bot)
+
+    await store.close()
+    return store
+
+
+def get_store(bot: hikari.GatewayBot | hikari.RESTBot) -> SnapshotStore | None:
+    """Return the snapshot store attached to a bot, if any."""
+    return _STORES.get(bot)
@@ -0,0 +1,448 @@
+import asyncio
+import base64
+import collections
+import itertools
+import random
+import typing
+
+import hikari
+import hikari.impl
+
+T = typing.TypeVar("T")
+
+_TOKEN = base64.b64encode(b"123456789012345678").decode() + ".fake.token"
+_TIMESTAMP = "2020-01-01T00:00:00+00:00"
+_SNOWFLAKES = itertools.count(100_000_000_000_000_000)
+
+
+class FakeRest:
+    """A stand-in for the REST client of a bot, serving the objects added to it with simulated latency and failures.
+
+    - `latency` and `jitter` are how many seconds every call takes, give or take.
+    - `not_found_rate` is the chance a call fails with a 404 even if the object exists.
+    - `rate_limit_rate` is the chance a call is rate limited, waiting `retry_after` seconds before going through as hikari would. `rate_limited` counts these.
+    - `page_size` is how many members or bans each page of `fetch_members` and `fetch_bans` holds, every page taking a call.
+
+    Its fetch methods mirror those of `hikari.api.RESTClient` the resolvers use. Objects are kept as JSON payloads and deserialized by the real entity factory on every fetch, like responses from Discord.
+    `calls` counts the calls made to each method, and `inject` queues exceptions for the next calls of a method.
+    """
+
+    def __init__(
+        self,
+        entity_factory: hikari.api.EntityFactory,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        not_found_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        page_size: int = 1_000,
+        seed: int | None = None,
+    ) -> None:
+        self.entity_factory = entity_factory
+        self.latency = latency
+        self.jitter = jitter
+        self.not_found_rate = not_found_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.page_size = page_size
+        self.calls: collections.Counter[str] = collections.Counter()
+        self.rate_limited = 0
+        self.guilds: dict[int, dict[str, typing.Any]] = {}
+        self.users: dict[int, dict[str, typing.Any]] = {}
+        self.channels: dict[int, dict[str, typing.Any]] = {}
+        self.guild_channels: dict[int, dict[int, dict[str, typing.Any]]] = collections.defaultdict(dict)
+        self.roles: dict[int, dict[int, dict[str, typing.Any]]] = collections.defaultdict(dict)
+        self.members: dict[int, dict[int, dict[str, typing.Any]]] = collections.defaultdict(dict)
+        self.emojis: dict[int, dict[int, dict[str, typing.Any]]] = collections.defaultdict(dict)
+        self.bans: dict[int, dict[int, dict[str, typing.Any]]] = collections.defaultdict(dict)
+        self.dm_channels: dict[int, dict[str, typing.Any]] = {}
+        self._random = random.Random(seed)
+        self._injected: dict[str, collections.deque[Exception]] = collections.defaultdict(collections.deque)
+
+    def inject(self, method: str, exception: Exception, times: int = 1) -> None:
+        """Raise an exception from the next calls of a method."""
+        self._injected[method].extend([exception] * times)
+
+    def add_guild(self, payload: dict[str, typing.Any]) -> None:
+        """Add a guild from its payload. Its roles and emojis are added separately."""
+        self.guilds[int(payload["id"])] = payload
+
+    def add_user(self, payload: dict[str, typing.Any]) -> None:
+        """Add a user from its payload."""
+        self.users[int(payload["id"])] = payload
+
+    def add_channel(self, payload: dict[str, typing.Any]) -> None:
+        """Add a channel from its payload, to its guild too if it has one."""
+        self.channels[int(payload["id"])] = payload
+
+        if guild_id := payload.get("guild_id"):
+            self.guild_channels[int(guild_id)][int(payload["id"])] = payload
+
+    def add_role(self, guild: int, payload: dict[str, typing.Any]) -> None:
+        """Add a role of a guild from its payload."""
+        self.roles[int(guild)][int(payload["id"])] = payload
+
+    def add_member(self, guild: int, payload: dict[str, typing.Any]) -> None:
+        """Add a member of a guild from its payload, and the user it holds."""
+        self.members[int(guild)][int(payload["user"]["id"])] = payload
+        self.add_user(payload["user"])
+
+    def add_emoji(self, guild: int, payload: dict[str, typing.Any]) -> None:
+        """Add a custom emoji of a guild from its payload."""
+        self.emojis[int(guild)][int(payload["id"])] = payload
+
+    def add_ban(self, guild: int, payload: dict[str, typing.Any]) -> None:
+        """Add a ban of a guild from its payload."""
+        self.bans[int(guild)][int(payload["user"]["id"])] = payload
+
+    async def fetch_guild(self, guild: int | hikari.Guild) -> hikari.RESTGuild:
+        payload = _found(self.guilds.get(int(guild)), await self._call("fetch_guild"))
+        return self.entity_factory.deserialize_rest_guild({**payload, "roles": list(self.roles[int(guild)].values()), "emojis": list(self.emojis[int(guild)].values())})
+
+    async def fetch_ban(self, guild: int | hikari.Guild, user: int | hikari.User) -> hikari.GuildBan:
+        return self.entity_factory.deserialize_guild_member_ban(_found(self.bans.get(int(guild), {}).get(int(user)), await self._call("fetch_ban")))
+
+    async def fetch_user(self, user: int | hikari.User) -> hikari.User:
+        return self.entity_factory.deserialize_user(_found(self.users.get(int(user)), await self._call("fetch_user")))
+
+    async def fetch_member(self, guild: int | hikari.Guild, user: int | hikari.User) -> hikari.Member:
+        payload = _found(self.members.get(int(guild), {}).get(int(user)), await self._call("fetch_member"))
+        return self.entity_factory.deserialize_member(payload, guild_id=hikari.Snowflake(guild))
+
+    def fetch_members(self, guild: int | hikari.Guild) -> hikari.LazyIterator[hikari.Member]:
+        guild_id = hikari.Snowflake(guild)
+        return _PageIterator(self, "fetch_members", guild_id, self.members, lambda payload: self.entity_factory.deserialize_member(payload, guild_id=guild_id))
+
+    def fetch_bans(self, guild: int | hikari.Guild) -> hikari.LazyIterator[hikari.GuildBan]:
+        return _PageIterator(self, "fetch_bans", hikari.Snowflake(guild), self.bans, self.entity_factory.deserialize_guild_member_ban)
+
+    async def create_dm_channel(self, user: int | hikari.User) -> hikari.DMChannel:
+        user_payload = _found(self.users.get(int(user)), await self._call("create_dm_channel"))
+
+        if (payload := self.dm_channels.get(int(user))) is None:
+            payload = self.dm_channels[int(user)] = {"id": str(next(_SNOWFLAKES)), "type": hikari.ChannelType.DM, "last_message_id": None, "recipients": [user_payload]}
+
+        return self.entity_factory.deserialize_dm(payload)
+
+    async def fetch_channel(self, channel: int | hikari.PartialChannel) -> hikari.PartialChannel:
+        return self.entity_factory.deserialize_channel(_found(self.channels.get(int(channel)), await self._call("fetch_channel")))
+
+    async def fetch_guild_channels(self, guild: int | hikari.Guild) -> typing.Sequence[hikari.GuildChannel]:
+        _found(self.guilds.get(int(guild)), await self._call("fetch_guild_channels"))
+        return [typing.cast(hikari.GuildChannel, self.entity_factory.deserialize_channel(payload)) for payload in self.guild_channels[int(guild)].values()]
+
+    async def fetch_roles(self, guild: int | hikari.Guild) -> typing.Sequence[hikari.Role]:
+        _found(self.guilds.get(int(guild)), await self._call("fetch_roles"))
+        return [self.entity_factory.deserialize_role(payload, guild_id=hikari.Snowflake(guild)) for payload in self.roles[int(guild)].values()]
+
+    async def fetch_emoji(self, guild: int | hikari.Guild, emoji: int | hikari.CustomEmoji) -> hikari.KnownCustomEmoji:
+        payload = _found(self.emojis.get(int(guild), {}).get(int(emoji)), await self._call("fetch_emoji"))
+        return self.entity_factory.deserialize_known_custom_emoji(payload, guild_id=hikari.Snowflake(guild))
+
+    async def fetch_guild_emojis(self, guild: int | hikari.Guild) -> typing.Sequence[hikari.KnownCustomEmoji]:
+        _found(self.guilds.get(int(guild)), await self._call("fetch_guild_emojis"))
+        return [self.entity_factory.deserialize_known_custom_emoji(payload, guild_id=hikari.Snowflake(guild)) for payload in self.emojis[int(guild)].values()]
+
+    async def _call(self, method: str) -> bool:
+        self.calls[method] += 1
+
+        if self._injected[method]:
+            raise self._injected[method].popleft()
+
+        if self.rate_limit_rate and self._random.random() < self.rate_limit_rate:
+            self.rate_limited += 1
+            await asyncio.sleep(self.retry_after)
+
+        if self.latency or self.jitter:
+            await asyncio.sleep(max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter)))
+
+        return not (self.not_found_rate and self._random.random() < self.not_found_rate)
+
+
+class _PageIterator(hikari.iterators.BufferedLazyIterator[T]):
+    __slots__ = ("_rest", "_method", "_guild", "_source", "_deserialize", "_payloads")
+
+    def __init__(
+        self,
+        rest: FakeRest,
+        method: str,
+        guild: hikari.Snowflake,
+        source: dict[int, dict[int, dict[str, typing.Any]]],
+        deserialize: typing.Callable[[dict[str, typing.Any]], T],
+    ) -> None:
+        super().__init__()
+        self._rest = rest
+        self._method = method
+        self._guild = guild
+        self._source = source
+        self._deserialize = deserialize
+        self._payloads: list[dict[str, typing.Any]] | None = None
+
+    async def _next_chunk(self) -> typing.Generator[T, None, None] | None:
+        if self._payloads is None:
+            if self._guild not in self._rest.guilds:
+                raise _not_found()
+
+            self._payloads = list(self._source[self._guild].values())
+
+        if not self._payloads:
+            return None
+
+        if not await self._rest._call(self._method):
+            raise _not_found()
+
+        page, self._payloads = self._payloads[: self._rest.page_size], self._payloads[self._rest.page_size :]
+        return (self._deserialize(payload) for payload in page)
+
+
+class FakeGatewayBot(hikari.GatewayBot):
+    """A GatewayBot that never connects, with a real cache and entity factory and a `FakeRest` in place of its REST client.
+
+    `cache_settings` configures the cache like on any GatewayBot, and every other keyword argument is passed to the `FakeRest`.
+    """
+
+    def __init__(
+        self,
+        cache_settings: hikari.impl.CacheSettings | None = None,
+        intents: hikari.Intents = hikari.Intents.ALL_UNPRIVILEGED | hikari.Intents.GUILD_MEMBERS,
+        **rest_options: typing.Any,
+    ) -> None:
+        super().__init__(_TOKEN, banner=None, cache_settings=cache_settings, intents=intents, logs=None, suppress_optimization_warning=True)
+        self._fake_rest = FakeRest(self.entity_factory, **rest_options)
+
+    @property
+    def rest(self) -> FakeRest:  # type: ignore[override]
+        return self._fake_rest
+
+
+class FakeRESTBot:
+    """A stand-in for a RESTBot, which can't be built without the optional server dependencies, with a real entity factory and a `FakeRest`.
+
+    Every keyword argument is passed to the `FakeRest`.
+    """
+
+    def __init__(self, **rest_options: typing.Any) -> None:
+        self.entity_factory = hikari.impl.EntityFactoryImpl(typing.cast(hikari.traits.RESTAware, self))
+        self.rest = FakeRest(self.entity_factory, **rest_options)
+
+
+class SyntheticGuild:
+    """The IDs making up a generated guild, to pick lookups from."""
+
+    __slots__ = ("guild_id", "owner_id", "role_ids", "booster_role_id", "channel_ids", "member_ids", "booster_ids", "emoji_ids", "banned_ids")
+
+    def __init__(self, guild_id: hikari.Snowflake) -> None:
+        self.guild_id = guild_id
+        self.owner_id: hikari.Snowflake | None = None
+        self.role_ids: list[hikari.Snowflake] = []
+        self.booster_role_id: hikari.Snowflake | None = None
+        self.channel_ids: list[hikari.Snowflake] = []
+        self.member_ids: list[hikari.Snowflake] = []
+        self.booster_ids: list[hikari.Snowflake] = []
+        self.emoji_ids: list[hikari.Snowflake] = []
+        self.banned_ids: list[hikari.Snowflake] = []
+
+    def __repr__(self) -> str:
+        return f"SyntheticGuild(guild_id={self.guild_id}, roles={len(self.role_ids)}, channels={len(self.channel_ids)}, members={len(self.member_ids)}, emojis={len(self.emoji_ids)}, bans={len(self.banned_ids)})"
+
+
+def generate_guild(
+    bot: FakeGatewayBot | FakeRESTBot,
+    members: int = 1_000,
+    roles: int = 20,
+    channels: int = 50,
+    boosters: int = 10,
+    emojis: int = 10,
+    bans: int = 0,
+    cache: bool = True,
+    seed: int | None = 0,
+) -> SyntheticGuild:
+    """Generate a guild and add it to the REST client of a fake bot and, for a `FakeGatewayBot` with `cache`, to its cache too.
+
+    - `roles` includes the @everyone role, and a booster role if there are any `boosters`.
+    - `channels` are text and voice channels, with a category heading every ten of them.
+    - Every member gets up to three random roles. The first one owns the guild and the next `boosters` are boosting it.
+    - `bans` are users who aren't members, only known to the REST client since the gateway doesn't send bans.
+    """
+    rng = random.Random(seed)
+    guild = SyntheticGuild(hikari.Snowflake(next(_SNOWFLAKES)))
+    member_payloads = [_member_payload(rng) for _ in range(members)]
+    guild.owner_id = hikari.Snowflake(member_payloads[0]["user"]["id"]) if member_payloads else hikari.Snowflake(next(_SNOWFLAKES))
+    guild_payload = _guild_payload(guild.guild_id, guild.owner_id, boosters)
+    role_payloads = [_role_payload(guild.guild_id, "@everyone", 0, is_everyone=True)]
+    role_payloads += [_role_payload(hikari.Snowflake(next(_SNOWFLAKES)), f"role-{position}", position) for position in range(1, max(roles, 1) - bool(boosters))]
+
+    if boosters:
+        role_payloads.append(_role_payload(hikari.Snowflake(next(_SNOWFLAKES)), "Server Booster", len(role_payloads), is_booster=True))
+        guild.booster_role_id = hikari.Snowflake(role_payloads[-1]["id"])
+
+    guild.role_ids = [hikari.Snowflake(payload["id"]) for payload in role_payloads]
+    assignable_role_ids = [payload["id"] for payload in role_payloads[1:] if payload["id"] != str(guild.booster_role_id)]
+    channel_payloads: list[dict[str, typing.Any]] = []
+    parent_id: str | None = None
+
+    for position in range(channels):
+        if position % 10 == 0:
+            channel_payloads.append(_channel_payload(guild.guild_id, hikari.ChannelType.GUILD_CATEGORY, position, None))
+            parent_id = channel_payloads[-1]["id"]
+        else:
+            channel_payloads.append(_channel_payload(guild.guild_id, hikari.ChannelType.GUILD_TEXT if position % 2 else hikari.ChannelType.GUILD_VOICE, position, parent_id))
+
+    guild.channel_ids = [hikari.Snowflake(payload["id"]) for payload in channel_payloads]
+    emoji_payloads = [_emoji_payload(f"emoji_{index}") for index in range(emojis)]
+    guild.emoji_ids = [hikari.Snowflake(payload["id"]) for payload in emoji_payloads]
+
+    for index, payload in enumerate(member_payloads):
+        payload["roles"] = rng.sample(assignable_role_ids, rng.randint(0, min(3, len(assignable_role_ids))))
+
+        if 1 <= index <= boosters:
+            payload["premium_since"] = _TIMESTAMP
+            payload["roles"].append(str(guild.booster_role_id))
+            guild.booster_ids.append(hikari.Snowflake(payload["user"]["id"]))
+
+    guild.member_ids = [hikari.Snowflake(payload["user"]["id"]) for payload in member_payloads]
+    ban_payloads = [{"reason": "generated", "user": _member_payload(rng)["user"]} for _ in range(bans)]
+    guild.banned_ids = [hikari.Snowflake(payload["user"]["id"]) for payload in ban_payloads]
+    rest = bot.rest
+    rest.add_guild(guild_payload)
+
+    for payload in role_payloads:
+        rest.add_role(guild.guild_id, payload)
+
+    for payload in channel_payloads:
+        rest.add_channel(payload)
+
+    for payload in member_payloads:
+        rest.add_member(guild.guild_id, payload)
+
+    for payload in emoji_payloads:
+        rest.add_emoji(guild.guild_id, payload)
+
+    for payload in ban_payloads:
+        rest.add_ban(guild.guild_id, payload)
+
+    if cache and isinstance(bot, hikari.GatewayBot):
+        _populate_cache(bot, guild.guild_id, guild_payload, role_payloads, channel_payloads, member_payloads, emoji_payloads)
+
+    return guild
+
+
+def _populate_cache(
+    bot: hikari.GatewayBot,
+    guild_id: hikari.Snowflake,
+    guild_payload: dict[str, typing.Any],
+    role_payloads: list[dict[str, typing.Any]],
+    channel_payloads: list[dict[str, typing.Any]],
+    member_payloads: list[dict[str, typing.Any]],
+    emoji_payloads: list[dict[str, typing.Any]],
+) -> None:
+    entity_factory = bot.entity_factory
+    gateway_payload = {**guild_payload, "joined_at": _TIMESTAMP, "large": len(member_payloads) > 250, "member_count": len(member_payloads), "members": [], "channels": [], "threads": [], "presences": [], "voice_states": []}
+    bot.cache.set_guild(entity_factory.deserialize_gateway_guild(gateway_payload, user_id=hikari.Snowflake(next(_SNOWFLAKES))).guild())
+
+    for payload in role_payloads:
+        bot.cache.set_role(entity_factory.deserialize_role(payload, guild_id=guild_id))
+
+    for payload in channel_payloads:
+        bot.cache.set_guild_channel(typing.cast(hikari.PermissibleGuildChannel, entity_factory.deserialize_channel(payload)))
+
+    for payload in member_payloads:
+        bot.cache.set_member(entity_factory.deserialize_member(payload, guild_id=guild_id))
+
+    for payload in emoji_payloads:
+        bot.cache.set_emoji(entity_factory.deserialize_known_custom_emoji(payload, guild_id=guild_id))
+
+
+def _found(payload: T | None, found: bool) -> T:
+    if payload is None or not found:
+        raise _not_found()
+
+    return payload
+
+
+def _not_found() -> hikari.NotFoundError:
+    return hikari.NotFoundError("https://discord.com/api/v10", {}, b"", "Unknown", 10000)
+
+
+def _guild_payload(guild_id: hikari.Snowflake, owner_id: hikari.Snowflake, boosters: int) -> dict[str, typing.Any]:
+    return {
+        "id": str(guild_id),
+        "name": f"guild-{guild_id}",
+        "icon": None,
+        "splash": None,
+        "discovery_splash": None,
+        "owner_id": str(owner_id),
+        "afk_channel_id": None,
+        "afk_timeout": 300,
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "mfa_level": 0,
+        "application_id": None,
+        "widget_enabled": False,
+        "widget_channel_id": None,
+        "system_channel_id": None,
+        "system_channel_flags": 0,
+        "rules_channel_id": None,
+        "vanity_url_code": None,
+        "description": None,
+        "banner": None,
+        "premium_tier": min(boosters // 7, 3),
+        "premium_subscription_count": boosters,
+        "preferred_locale": "en-US",
+        "public_updates_channel_id": None,
+        "nsfw_level": 0,
+        "features": [],
+        "roles": [],
+        "emojis": [],
+        "stickers": [],
+        "max_video_channel_users": 25,
+        "approximate_member_count": 0,
+        "approximate_presence_count": 0,
+        "max_presences": None,
+        "max_members": 500_000,
+    }
+
+
+def _role_payload(role_id: hikari.Snowflake, name: str, position: int, is_everyone: bool = False, is_booster: bool = False) -> dict[str, typing.Any]:
+    permissions = hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES if is_everyone else hikari.Permissions.NONE
+    return {
+        "id": str(role_id),
+        "name": name,
+        "color": 0,
+        "hoist": False,
+        "position": position,
+        "permissions": str(int(permissions)),
+        "managed": is_booster,
+        "mentionable": False,
+        **({"tags": {"premium_subscriber": None}} if is_booster else {}),
+    }
+
+
+def _channel_payload(guild_id: hikari.Snowflake, channel_type: hikari.ChannelType, position: int, parent_id: str | None) -> dict[str, typing.Any]:
+    channel_id = next(_SNOWFLAKES)
+    payload: dict[str, typing.Any] = {"id": str(channel_id), "type": int(channel_type), "guild_id": str(guild_id), "name": f"channel-{position}", "position": position, "permission_overwrites": [], "nsfw": False, "parent_id": parent_id}
+
+    if channel_type == hikari.ChannelType.GUILD_TEXT:
+        payload.update(topic=None, last_message_id=None, rate_limit_per_user=0)
+    elif channel_type == hikari.ChannelType.GUILD_VOICE:
+        payload.update(bitrate=64_000, user_limit=0, rtc_region=None, video_quality_mode=1, last_message_id=None, rate_limit_per_user=0)
+
+    return payload
+
+
+def _member_payload(rng: random.Random) -> dict[str, typing.Any]:
+    user_id = next(_SNOWFLAKES)
+    return {
+        "user": {"id": str(user_id), "username": f"user{user_id}", "discriminator": "0", "avatar": None, "global_name": None},
+        "nick": f"nick{user_id}" if rng.random() < 0.2 else None,
+        "roles": [],
+        "joined_at": _TIMESTAMP,
+        "premium_since": None,
+        "deaf": False,
+        "mute": False,
+    }
+
+
+def _emoji_payload(name: str) -> dict[str, typing.Any]:
+    return {"id": str(next(_SNOWFLAKES)), "name": name, "animated": False, "roles": [], "require_colons": True, "managed": False, "available": True}
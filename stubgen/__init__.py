@@ -0,0 +1 @@
+"""Generate the type stubs of the modules whose public API is built at import time."""
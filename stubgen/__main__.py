@@ -0,0 +1,35 @@
+"""Write the generated stubs next to their modules, or check that they are up to date."""
+
+import argparse
+import pathlib
+import sys
+import typing
+
+from stubgen import getfetch
+
+STUBS: dict[str, typing.Callable[[], str]] = {"hikariutils/getfetch.pyi": getfetch.render}
+
+
+def main(argv: typing.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m stubgen", description="Generate the type stubs of hikariutils.")
+    parser.add_argument("--check", action="store_true", help="exit with an error if a stub is out of date instead of writing it")
+    args = parser.parse_args(argv)
+    outdated = []
+
+    for path, render in STUBS.items():
+        stub = pathlib.Path(path)
+        rendered = render()
+
+        if args.check:
+            if not stub.exists() or stub.read_text() != rendered:
+                outdated.append(path)
+        else:
+            stub.write_text(rendered)
+
+    if outdated:
+        print(f"Out of date: {', '.join(outdated)}. Run python -m stubgen.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
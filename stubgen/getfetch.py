@@ -0,0 +1,134 @@
+"""Render the stub of `hikariutils.getfetch`, declaring the resolvers that are attached to the facades at import time."""
+
+import collections.abc
+import inspect
+import types
+import typing
+
+import hikari
+
+from hikariutils import getfetch
+
+HEADER = "# Generated by `python -m stubgen` from the resolvers attached at import time. Do not edit.\n"
+FACADES: tuple[type, ...] = (getfetch.Optional, getfetch.Mandatory, getfetch.Sync)
+FUNCTIONS: tuple[str, ...] = ("resolve_many", "resolve_emojis", "warm")
+CONSTANTS: tuple[str, ...] = ("WARM_KINDS", "SPECS")
+LINE_LENGTH = 320
+
+
+def render() -> str:
+    """Return the stub of `hikariutils.getfetch`."""
+    imports: dict[str, set[str]] = {}
+    body = [
+        'T = typing.TypeVar("T")',
+        *(f"{name}: {_annotation(getfetch.__annotations__[name], imports)}" for name in CONSTANTS),
+        *(_class(facade, 0, imports) for facade in FACADES),
+        *(_function(getattr(getfetch, name), 0, imports) for name in FUNCTIONS),
+        _spec(imports),
+    ]
+    header = [*(f"import {module}" for module in sorted({"typing", *imports.pop("", ())})), "", "import hikari", ""]
+    header.extend(f"from {module} import {', '.join(sorted(names))}" for module, names in sorted(imports.items()))
+    return HEADER + "\n".join(header) + "\n\n" + "\n\n".join(body) + "\n"
+
+
+def _class(cls: type, depth: int, imports: dict[str, set[str]]) -> str:
+    indent = "    " * depth
+    lines = [f"{indent}class {cls.__name__}:"]
+
+    if cls.__doc__:
+        lines.append(f'{indent}    """{cls.__doc__}"""')
+
+    members = [_class(value, depth + 1, imports) if isinstance(value, type) else _function(value.__func__, depth + 1, imports, static=True) for name, value in vars(cls).items() if not name.startswith("_") and isinstance(value, type | staticmethod)]
+
+    if members:
+        lines.extend([*([""] if cls.__doc__ else []), "\n\n".join(members)])
+    elif not cls.__doc__:
+        lines.append(f"{indent}    ...")
+
+    return "\n".join(lines)
+
+
+def _function(function: typing.Callable[..., typing.Any], depth: int, imports: dict[str, set[str]], static: bool = False) -> str:
+    indent = "    " * depth
+    signature = inspect.signature(function)
+    parameters: list[str] = []
+    keyword_only = False
+
+    for parameter in signature.parameters.values():
+        if parameter.kind is inspect.Parameter.KEYWORD_ONLY and not keyword_only:
+            parameters.append("*")
+            keyword_only = True
+
+        parameters.append(parameter.name + (f": {_annotation(parameter.annotation, imports)}" if parameter.annotation is not inspect.Parameter.empty else "") + (" = ..." if parameter.default is not inspect.Parameter.empty else ""))
+
+    returns = f" -> {_annotation(signature.return_annotation, imports)}" if signature.return_annotation is not inspect.Signature.empty else ""
+    lines = [f"{indent}@staticmethod"] if static else []
+    definition = f"{indent}{'async def' if inspect.iscoroutinefunction(function) else 'def'} {function.__name__}("
+
+    if len(line := f"{definition}{', '.join(parameters)}){returns}:") <= LINE_LENGTH:
+        lines.append(line)
+    elif len(line := f"{indent}    {', '.join(parameters)}") <= LINE_LENGTH:
+        lines.extend([definition, line, f"{indent}){returns}:"])
+    else:
+        lines.extend([definition, *(f"{indent}    {parameter}," for parameter in parameters), f"{indent}){returns}:"])
+
+    if function.__doc__:
+        lines.append(f'{indent}    """{_docstring(function.__doc__, depth)}"""')
+    else:
+        lines[-1] += " ..."
+
+    return "\n".join(lines)
+
+
+def _spec(imports: dict[str, set[str]]) -> str:
+    init = inspect.signature(getfetch.Spec.__init__)
+    attributes = [f"    {name}: {_annotation(int if name == 'required' else init.parameters[name].annotation, imports)}" for name in getfetch.Spec.__slots__]
+    return "\n".join([f'class Spec:\n    """{_docstring(getfetch.Spec.__doc__, 0)}"""\n', *attributes, "", _function(getfetch.Spec.__init__, 1, imports)])
+
+
+def _docstring(docstring: str | None, depth: int) -> str:
+    lines = inspect.cleandoc(docstring or "").splitlines()
+    return "\n".join([lines[0], *(f"{'    ' * (depth + 1)}{line}" if line else "" for line in lines[1:])]) + (f"\n{'    ' * (depth + 1)}" if len(lines) > 1 else "")
+
+
+def _annotation(annotation: typing.Any, imports: dict[str, set[str]]) -> str:
+    if annotation is None or annotation is types.NoneType:
+        return "None"
+    elif annotation is typing.Any:
+        return "typing.Any"
+    elif annotation is Ellipsis:
+        return "..."
+    elif isinstance(annotation, list):
+        return f"[{', '.join(_annotation(argument, imports) for argument in annotation)}]"
+    elif isinstance(annotation, typing.TypeVar):
+        return annotation.__name__
+    elif isinstance(annotation, types.UnionType) or typing.get_origin(annotation) is typing.Union:
+        return " | ".join(_annotation(argument, imports) for argument in typing.get_args(annotation))
+    elif (origin := typing.get_origin(annotation)) is not None:
+        arguments = typing.get_args(annotation)
+
+        if origin is collections.abc.Callable:
+            return f"typing.Callable[{_annotation(arguments[0], imports)}, {_annotation(arguments[-1], imports)}]"
+
+        return f"{_annotation(origin, imports)}[{', '.join(_annotation(argument, imports) for argument in arguments)}]"
+    elif isinstance(annotation, type):
+        return _type(annotation, imports)
+
+    raise TypeError(f"Can't render the annotation {annotation!r}")
+
+
+def _type(cls: type, imports: dict[str, set[str]]) -> str:
+    if cls.__module__ == "builtins":
+        return cls.__name__
+    elif cls.__module__ == "collections.abc":
+        return f"typing.{cls.__name__}"
+    elif getattr(hikari, cls.__name__, None) is cls:
+        return f"hikari.{cls.__name__}"
+    elif cls.__module__ == getfetch.__name__:
+        return cls.__qualname__
+    elif cls.__module__.startswith("hikariutils."):
+        imports.setdefault(cls.__module__, set()).add(cls.__name__)
+        return cls.__name__
+    else:
+        imports.setdefault("", set()).add(cls.__module__)
+        return f"{cls.__module__}.{cls.__qualname__}"
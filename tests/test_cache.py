@@ -0,0 +1,96 @@
+from hikariutils.cache import ResolverCache, approximate_size
+from hikariutils.index import RoleSnapshot
+from hikariutils.testing import FakeRESTBot, generate_guild
+from tests.conftest import Clock
+
+
+def test_objects_expire_after_their_ttl(clock: Clock) -> None:
+    cache = ResolverCache(ttls={"user": 10.0}, clock=clock)
+    cache.set("user", 1, "user")
+    clock.advance(9.0)
+
+    assert cache.get("user", 1) == "user"
+
+    clock.advance(1.0)
+
+    assert cache.get("user", 1) is None
+    assert cache.stats()["user"].expirations == 1
+
+
+def test_least_recently_used_objects_are_evicted_first(clock: Clock) -> None:
+    cache = ResolverCache(max_entries=2, clock=clock)
+    cache.set("user", 1, "first")
+    cache.set("user", 2, "second")
+    cache.get("user", 1)
+    cache.set("user", 3, "third")
+
+    assert cache.get("user", 1) == "first"
+    assert cache.get("user", 2) is None
+    assert cache.get("user", 3) == "third"
+    assert cache.stats()["user"].evictions == 1
+
+
+def test_memory_cap_evicts_until_under_it(clock: Clock) -> None:
+    cache = ResolverCache(max_bytes=2 * approximate_size("x" * 1_000), clock=clock)
+
+    for key in range(5):
+        cache.set("user", key, "x" * 1_000)
+
+    assert len(cache) == 2
+    assert cache.bytes <= 2 * approximate_size("x" * 1_000)
+
+
+def test_not_found_records_expire_and_drop_cached_copies(clock: Clock) -> None:
+    cache = ResolverCache(negative_ttl=5.0, clock=clock)
+    cache.set("user", 1, "user")
+    cache.set_missing("user", 1)
+
+    assert cache.get("user", 1) is None
+    assert cache.is_missing("user", 1)
+
+    clock.advance(5.0)
+
+    assert not cache.is_missing("user", 1)
+
+
+def test_stale_objects_are_served_until_their_max_age(clock: Clock) -> None:
+    cache = ResolverCache(ttls={"user": 10.0}, max_ages={"user": 60.0}, clock=clock)
+    cache.set("user", 1, "user")
+    clock.advance(30.0)
+
+    assert cache.get("user", 1) == "user"
+    assert cache.is_stale("user", 1)
+
+    clock.advance(30.0)
+
+    assert cache.get("user", 1) is None
+
+
+def test_objects_keep_the_age_they_are_stored_with(clock: Clock) -> None:
+    cache = ResolverCache(ttls={"user": 10.0}, max_ages={"user": 60.0}, clock=clock)
+    cache.set("user", 1, "user", age=20.0)
+    cache.set("user", 2, "user", age=60.0)
+
+    assert cache.is_stale("user", 1)
+    assert ("user", 2) not in cache
+
+
+def test_invalidating_a_kind_keeps_the_others(clock: Clock) -> None:
+    cache = ResolverCache(clock=clock)
+    cache.set("user", 1, "user")
+    cache.set("user", 2, "user")
+    cache.set("guild", 1, "guild")
+    cache.set_missing("user", 3)
+    cache.invalidate("user")
+
+    assert cache.get("user", 1) is None and cache.get("user", 2) is None
+    assert not cache.is_missing("user", 3)
+    assert cache.get("guild", 1) == "guild"
+
+
+async def test_snapshots_are_sized_by_what_they_hold() -> None:
+    bot = FakeRESTBot()
+    guild = generate_guild(bot, members=1, roles=250)
+    snapshot = RoleSnapshot(guild.guild_id, await bot.rest.fetch_roles(guild.guild_id))
+
+    assert approximate_size(snapshot) > 100 * approximate_size(snapshot.roles[guild.role_ids[0]])
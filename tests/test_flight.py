@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from hikariutils.flight import SingleFlight
+
+
+async def test_concurrent_callers_share_one_call() -> None:
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetcher() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return "result"
+
+    results = await asyncio.gather(*(flight.do("key", fetcher) for _ in range(10)))
+
+    assert results == ["result"] * 10
+    assert calls == 1
+    assert len(flight) == 0
+
+
+async def test_exceptions_reach_every_caller() -> None:
+    flight = SingleFlight()
+
+    async def fetcher() -> None:
+        await asyncio.sleep(0)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(flight.do("key", fetcher), flight.do("key", fetcher), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "key" not in flight
+
+
+async def test_cancelled_caller_leaves_the_call_running() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def fetcher() -> str:
+        await release.wait()
+        return "result"
+
+    cancelled = asyncio.create_task(flight.do("key", fetcher))
+    waiting = asyncio.create_task(flight.do("key", fetcher))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == "result"
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+
+async def test_separate_keys_run_separately() -> None:
+    flight = SingleFlight()
+
+    async def fetcher(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    assert await asyncio.gather(flight.do(1, lambda: fetcher(1)), flight.do(2, lambda: fetcher(2))) == [1, 2]
@@ -0,0 +1,71 @@
+import asyncio
+
+import hikari
+
+from hikariutils.cache import ResolverCache, attach_cache
+from hikariutils.getfetch import Optional
+from hikariutils.testing import FakeGatewayBot, FakeRESTBot, generate_guild
+from tests.conftest import Clock
+
+
+async def test_fetches_are_cached_and_not_found_is_remembered() -> None:
+    bot = FakeRESTBot()
+    guild = generate_guild(bot, members=5)
+    attach_cache(bot)
+
+    assert await Optional.Rest.user(bot, guild.member_ids[0]) is not None
+    assert await Optional.Rest.user(bot, guild.member_ids[0]) is not None
+    assert await Optional.Rest.user(bot, 1) is None
+    assert await Optional.Rest.user(bot, 1) is None
+    assert bot.rest.calls["fetch_user"] == 2
+
+
+async def test_concurrent_lookups_share_one_fetch() -> None:
+    bot = FakeRESTBot(latency=0.01)
+    guild = generate_guild(bot, members=5)
+
+    users = await asyncio.gather(*(Optional.Rest.user(bot, guild.member_ids[0]) for _ in range(10)))
+
+    assert len({user.id for user in users if user is not None}) == 1
+    assert bot.rest.calls["fetch_user"] == 1
+
+
+async def test_stale_objects_are_served_while_refreshed_in_the_background(clock: Clock) -> None:
+    bot = FakeRESTBot()
+    guild = generate_guild(bot, members=5)
+    attach_cache(bot, ResolverCache(ttls={"user": 10.0}, max_ages={"user": 60.0}, clock=clock))
+    user = await Optional.Rest.user(bot, guild.member_ids[0])
+    clock.advance(30.0)
+
+    assert await Optional.Rest.user(bot, guild.member_ids[0]) is user
+
+    await asyncio.sleep(0.01)
+
+    assert bot.rest.calls["fetch_user"] == 2
+    assert await Optional.Rest.user(bot, guild.member_ids[0]) is not user
+    assert bot.rest.calls["fetch_user"] == 2
+
+
+async def test_member_events_invalidate_cached_members() -> None:
+    bot = FakeGatewayBot()
+    guild = generate_guild(bot, members=5, cache=False)
+    cache = attach_cache(bot)
+    member = await Optional.Rest.member(bot, guild.guild_id, guild.member_ids[0])
+    assert member is not None
+
+    await bot.event_manager.dispatch(hikari.MemberDeleteEvent(shard=None, guild_id=guild.guild_id, user=member.user, old_member=None), return_tasks=True)
+
+    assert cache.get("member", (int(guild.guild_id), int(member.id))) is None
+
+
+async def test_leaving_a_guild_invalidates_everything_cached_for_it() -> None:
+    bot = FakeGatewayBot()
+    guild = generate_guild(bot, members=5, cache=False)
+    cache = attach_cache(bot)
+    await Optional.Rest.guild(bot, guild.guild_id)
+    await Optional.Rest.roles(bot, guild.guild_id, None)
+    await Optional.Rest.channels(bot, guild.guild_id)
+
+    await bot.event_manager.dispatch(hikari.GuildLeaveEvent(app=bot, shard=None, guild_id=guild.guild_id, old_guild=None), return_tasks=True)
+
+    assert all(cache.get(kind, int(guild.guild_id)) is None for kind in ("guild", "roles", "channels"))
@@ -0,0 +1,60 @@
+import datetime
+import types
+import typing
+
+import hikari
+
+from hikariutils.index import BoosterIndex, ChannelIndex, MemberIndex
+
+
+def _event(**attributes: typing.Any) -> typing.Any:
+    return types.SimpleNamespace(**attributes)
+
+
+def _member(user_id: int, role_ids: list[int], boosting: bool = False) -> typing.Any:
+    return _event(id=hikari.Snowflake(user_id), guild_id=hikari.Snowflake(1), role_ids=role_ids, premium_since=datetime.datetime.now(datetime.timezone.utc) if boosting else None, raw_communication_disabled_until=None, nickname=None)
+
+
+def _listeners(index: BoosterIndex | ChannelIndex | MemberIndex) -> dict[type[hikari.Event], typing.Any]:
+    return dict(index.listeners())
+
+
+async def test_member_events_dont_index_unknown_guilds() -> None:
+    for index in (BoosterIndex(), MemberIndex()):
+        listeners = _listeners(index)
+        await listeners[hikari.MemberCreateEvent](_event(guild_id=hikari.Snowflake(1), member=_member(2, [], boosting=True)))
+
+        assert index.boosters(1) is None
+
+        await listeners[hikari.GuildAvailableEvent](_event(guild_id=hikari.Snowflake(1), members={}))
+        await listeners[hikari.MemberCreateEvent](_event(guild_id=hikari.Snowflake(1), member=_member(2, [], boosting=True)))
+
+        assert list(index.boosters(1) or {}) == [2]
+
+
+async def test_channel_events_dont_index_unknown_guilds() -> None:
+    index = ChannelIndex()
+    listeners = _listeners(index)
+    await listeners[hikari.GuildChannelDeleteEvent](_event(guild_id=hikari.Snowflake(1), channel_id=hikari.Snowflake(2)))
+
+    assert index.partitions(1) is None
+
+
+async def test_member_role_tuples_are_shared_and_released() -> None:
+    index = MemberIndex()
+    listeners = _listeners(index)
+    await listeners[hikari.GuildAvailableEvent](_event(guild_id=hikari.Snowflake(1), members={2: _member(2, [5, 3]), 3: _member(3, [3, 5])}))
+    first, second = index.member(1, 2), index.member(1, 3)
+
+    assert first is not None and second is not None and first.role_ids is second.role_ids
+
+    for role_id in range(10):
+        await listeners[hikari.MemberUpdateEvent](_event(guild_id=hikari.Snowflake(1), member=_member(2, [role_id])))
+
+    await listeners[hikari.MemberDeleteEvent](_event(guild_id=hikari.Snowflake(1), user_id=hikari.Snowflake(3)))
+
+    assert list(index._role_ids) == [(9,)]
+
+    await listeners[hikari.GuildLeaveEvent](_event(guild_id=hikari.Snowflake(1)))
+
+    assert not index._role_ids
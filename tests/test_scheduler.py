@@ -0,0 +1,104 @@
+import asyncio
+import functools
+
+from hikariutils.scheduler import Priority, RestScheduler, use_priority
+
+
+async def _blocked(scheduler: RestScheduler, route: str, count: int) -> tuple[asyncio.Event, list[asyncio.Task[bool]]]:
+    release = asyncio.Event()
+    tasks = [asyncio.create_task(scheduler.run(route, release.wait)) for _ in range(count)]
+    await asyncio.sleep(0)
+    return release, tasks
+
+
+async def test_waiting_calls_start_by_priority_then_age() -> None:
+    scheduler = RestScheduler(max_concurrency=1)
+    release, blockers = await _blocked(scheduler, "users", 1)
+    started: list[str] = []
+
+    async def call(name: str) -> None:
+        started.append(name)
+
+    tasks = [
+        asyncio.create_task(scheduler.run("users", lambda: call("background"), Priority.BACKGROUND)),
+        asyncio.create_task(scheduler.run("members", lambda: call("normal"))),
+        asyncio.create_task(scheduler.run("users", lambda: call("interactive"), Priority.INTERACTIVE)),
+        asyncio.create_task(scheduler.run("members", lambda: call("normal later"))),
+    ]
+    await asyncio.sleep(0)
+
+    assert scheduler.queue_depth == 4
+
+    release.set()
+    await asyncio.gather(*blockers, *tasks)
+
+    assert started == ["interactive", "normal", "normal later", "background"]
+
+
+async def test_caps_are_never_exceeded() -> None:
+    scheduler = RestScheduler(max_concurrency=4, route_limits={"bans": 1})
+    running: dict[str, int] = {"bans": 0, "users": 0}
+    peaks: dict[str, int] = {"bans": 0, "users": 0}
+    totals: list[int] = []
+
+    async def call(route: str) -> None:
+        running[route] += 1
+        peaks[route] = max(peaks[route], running[route])
+        totals.append(scheduler.running)
+        await asyncio.sleep(0)
+        running[route] -= 1
+
+    await asyncio.gather(*(scheduler.run(route, functools.partial(call, route)) for route in ("bans", "users") * 20))
+
+    assert peaks["bans"] == 1
+    assert max(totals) == 4
+    assert scheduler.queue_depth == 0 and scheduler.running == 0
+
+
+async def test_a_capped_route_doesnt_hold_back_other_routes() -> None:
+    scheduler = RestScheduler(max_concurrency=10, route_limits={"bans": 1})
+    release, blockers = await _blocked(scheduler, "bans", 2)
+
+    await asyncio.wait_for(scheduler.run("users", lambda: asyncio.sleep(0), Priority.BACKGROUND), 1.0)
+
+    release.set()
+    await asyncio.gather(*blockers)
+
+
+async def test_waiting_calls_can_be_promoted() -> None:
+    scheduler = RestScheduler(max_concurrency=1)
+    release, blockers = await _blocked(scheduler, "users", 1)
+    started: list[str] = []
+
+    async def call(name: str) -> None:
+        started.append(name)
+
+    with use_priority(Priority.BACKGROUND):
+        promoted = asyncio.create_task(scheduler.run("users", lambda: call("promoted"), key="key"))
+        waiting = asyncio.create_task(scheduler.run("users", lambda: call("normal"), Priority.NORMAL))
+
+    await asyncio.sleep(0)
+
+    assert scheduler.promote("key", Priority.INTERACTIVE)
+    assert not scheduler.promote("key", Priority.BACKGROUND)
+
+    release.set()
+    await asyncio.gather(*blockers, promoted, waiting)
+
+    assert started == ["promoted", "normal"]
+    assert scheduler.stats()[Priority.INTERACTIVE].started == 1
+
+
+async def test_cancelled_waiters_free_their_place() -> None:
+    scheduler = RestScheduler(max_concurrency=1)
+    release, blockers = await _blocked(scheduler, "users", 1)
+    cancelled = asyncio.create_task(scheduler.run("users", lambda: asyncio.sleep(0), key="key"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+
+    assert scheduler.queue_depth == 0
+    assert not scheduler.promote("key", Priority.INTERACTIVE)
+
+    release.set()
+    await asyncio.gather(*blockers)
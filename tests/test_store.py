@@ -0,0 +1,57 @@
+import pathlib
+
+from hikariutils.cache import ResolverCache
+from hikariutils.getfetch import Optional
+from hikariutils.store import PersistentCache, SnapshotStore, attach_store, detach_store
+from hikariutils.testing import FakeRESTBot, generate_guild
+from tests.conftest import Clock
+
+
+async def test_snapshots_survive_a_restart(tmp_path: pathlib.Path) -> None:
+    bot = FakeRESTBot()
+    guild = generate_guild(bot, members=5)
+    await attach_store(bot, tmp_path / "snapshots.db")
+    user = await Optional.Rest.user(bot, guild.member_ids[0])
+    resolved_guild = await Optional.Rest.guild(bot, guild.guild_id)
+    await detach_store(bot)
+
+    await attach_store(bot, tmp_path / "snapshots.db")
+    bot.rest.calls.clear()
+    restored_user = await Optional.Rest.user(bot, guild.member_ids[0])
+    restored_guild = await Optional.Rest.guild(bot, guild.guild_id)
+    await detach_store(bot)
+
+    assert restored_user is not None and user is not None and restored_user.id == user.id and restored_user.username == user.username
+    assert restored_guild is not None and resolved_guild is not None and restored_guild.name == resolved_guild.name
+    assert not bot.rest.calls
+
+
+async def test_restored_snapshots_keep_their_age(tmp_path: pathlib.Path, clock: Clock) -> None:
+    bot = FakeRESTBot()
+    store = SnapshotStore(bot, tmp_path / "snapshots.db", max_age=3600.0, clock=clock)
+    store.put("user", 1, "fresh")
+    store.put("user", 2, "old", age=50.0)
+    await store.close()
+
+    clock.advance(20.0)
+    store = SnapshotStore(bot, tmp_path / "snapshots.db", max_age=3600.0, clock=clock)
+    await store.load()
+    cache = PersistentCache(store, ResolverCache(ttls={"user": 30.0}, max_ages={"user": 60.0}, clock=clock))
+
+    assert cache.get("user", 1) == "fresh" and not cache.is_stale("user", 1)
+    assert cache.get("user", 2) is None
+    await store.close()
+
+
+async def test_unpicklable_snapshots_dont_hold_back_the_rest(tmp_path: pathlib.Path) -> None:
+    bot = FakeRESTBot()
+    store = SnapshotStore(bot, tmp_path / "snapshots.db")
+    store.put("user", 1, lambda: None)
+    store.put("user", 2, "kept")
+    await store.close()
+
+    store = SnapshotStore(bot, tmp_path / "snapshots.db")
+
+    assert await store.load() == 1
+    assert (restored := store.restore("user", 2)) is not None and restored[0] == "kept"
+    await store.close()
@@ -0,0 +1,10 @@
+import pathlib
+
+from stubgen import __main__ as stubgen
+
+
+def test_stubs_are_up_to_date() -> None:
+    root = pathlib.Path(__file__).parent.parent
+
+    for path, render in stubgen.STUBS.items():
+        assert (root / path).read_text() == render(), f"{path} is out of date, run python -m stubgen"